@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for the serialization and deserialization hot paths.
+
+Run all the benchmarks from the root of the repository with ::
+
+    $ python -m benchmarks
+
+Use ``--save`` to store the results as a new baseline and ``--compare`` to
+compare them against a stored baseline. See ``python -m benchmarks --help``.
+"""
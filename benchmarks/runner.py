@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Run benchmark scenarios, store results as a baseline and compare results
+against a baseline.
+"""
+from __future__ import absolute_import, print_function
+
+import gc
+import json
+import optparse
+import os
+import platform
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # Python < 3.4
+    tracemalloc = None
+
+from benchmarks.scenarios import SCENARIOS, setup_scenario
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def measure_ops(func, min_time=0.2, repeat=3):
+    """Return the number of calls to ``func`` per second, the best of
+    ``repeat`` runs. The number of calls per run is increased until a run
+    takes at least ``min_time`` seconds.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed > min_time / 4 else 10
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return number / best
+
+
+def measure_peak_memory(func):
+    """Return the peak memory, in bytes, allocated during a call to ``func``,
+    or ``None`` if :mod:`tracemalloc` is not available.
+    """
+    if tracemalloc is None:
+        return None
+    func()  # Warm up caches so that they are not counted
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.clear_traces()
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(names=None, min_time=0.2, repeat=3, out=print):
+    """Run the scenarios named in ``names`` (all scenarios if ``None``) and
+    return the results, a dictionary of the form ::
+
+        {
+            'python': '3.6.15',
+            'results': {<name>: {'ops': <float>, 'peak_kib': <float or None>}},
+        }
+    """
+    results = {}
+    for name in SCENARIOS:
+        if names and name not in names:
+            continue
+        func, teardown = setup_scenario(name)
+        try:
+            ops = measure_ops(func, min_time=min_time, repeat=repeat)
+            peak = measure_peak_memory(func)
+        finally:
+            if teardown is not None:
+                teardown()
+        peak_kib = None if peak is None else peak / 1024.0
+        results[name] = {'ops': ops, 'peak_kib': peak_kib}
+        out(format_result(name, ops, peak_kib))
+    return {'python': platform.python_version(), 'results': results}
+
+
+def format_result(name, ops, peak_kib, change=None):
+    line = '{0:<24} {1:>12.1f} ops/s'.format(name, ops)
+    line += ' {0:>10} KiB'.format('-' if peak_kib is None else '{0:.1f}'.format(peak_kib))
+    if change is not None:
+        line += ' {0:>+8.1%}'.format(change)
+    return line
+
+
+def save(results, path):
+    with open(path, 'w') as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+        fp.write('\n')
+
+
+def load(path):
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def compare(results, baseline, threshold=0.1, out=print):
+    """Compare ``results`` with ``baseline``, both as returned by :func:`run`,
+    and return the names of the scenarios that are slower than the baseline
+    by more than ``threshold`` (a fraction of the baseline ops/sec).
+    """
+    if results['python'] != baseline.get('python'):
+        out('Warning: baseline was recorded on Python {0}, not {1}'.format(
+            baseline.get('python'), results['python']))
+    regressions = []
+    for name, result in sorted(results['results'].items()):
+        try:
+            base_ops = baseline['results'][name]['ops']
+        except KeyError:
+            out('{0:<24} not in baseline'.format(name))
+            continue
+        change = result['ops'] / base_ops - 1
+        line = format_result(name, result['ops'], result['peak_kib'], change)
+        if change < -threshold:
+            regressions.append(name)
+            line += '  REGRESSION'
+        out(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = optparse.OptionParser(
+        usage='python -m benchmarks [options] [scenario ...]',
+        description='Run the marshmallow benchmarks. Scenarios: {0}'.format(
+            ', '.join(SCENARIOS)))
+    parser.add_option('--save', metavar='PATH', nargs=1, default=None,
+                      help='Store the results as a baseline at PATH. Use '
+                           '"default" for {0}.'.format(DEFAULT_BASELINE))
+    parser.add_option('--compare', metavar='PATH', nargs=1, default=None,
+                      help='Compare the results with the baseline at PATH. Use '
+                           '"default" for {0}.'.format(DEFAULT_BASELINE))
+    parser.add_option('--threshold', type='float', default=0.1,
+                      help='Slowdown, as a fraction of the baseline, that counts '
+                           'as a regression (default: %default).')
+    parser.add_option('--min-time', type='float', default=0.2,
+                      help='Minimum duration of a timing run in seconds '
+                           '(default: %default).')
+    parser.add_option('--repeat', type='int', default=3,
+                      help='Number of timing runs per scenario (default: %default).')
+    options, names = parser.parse_args(argv)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error('Unknown scenario(s): {0}'.format(', '.join(unknown)))
+    baseline = None
+    if options.compare:
+        # Load first so that a missing baseline fails fast
+        baseline = load(_resolve(options.compare))
+
+    results = run(names, min_time=options.min_time, repeat=options.repeat,
+                  out=print if baseline is None else lambda line: None)
+    if options.save:
+        save(results, _resolve(options.save))
+    if baseline is not None:
+        regressions = compare(results, baseline, threshold=options.threshold)
+        if regressions:
+            print('{0} regression(s): {1}'.format(len(regressions), ', '.join(regressions)))
+            return 1
+    return 0
+
+
+def _resolve(path):
+    return DEFAULT_BASELINE if path == 'default' else path
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""Benchmark scenarios.
+
+A scenario is a function that builds its schema and data and returns a
+callable that takes no arguments. The callable is one operation: its calls
+per second are what the runner reports. A scenario that holds resources, such
+as a process pool, returns a ``(callable, teardown)`` pair instead, where
+``teardown`` releases them. Use :func:`setup_scenario` to get both.
+"""
+from __future__ import absolute_import
+
+import datetime as dt
+import uuid
+from decimal import Decimal
+
+from marshmallow import Schema, fields, json_backend, parallel, pipeline
+from marshmallow.compat import OrderedDict
+
+# Number of objects serialized or deserialized by one operation of the
+# many=True scenarios
+MANY = 1000
+
+# JSON modules compared by the json_dumps_<module> scenarios, if installed
+JSON_MODULES = ('json', 'simplejson', 'ujson', 'rapidjson', 'orjson')
+
+# Numbers of worker processes compared by the parallel_dump_<n> scenarios
+WORKERS = (1, 2, 4)
+
+# {<name>: <scenario function>}, in order of registration
+SCENARIOS = OrderedDict()
+
+
+def scenario(func):
+    """Register ``func`` as a scenario, named after the function."""
+    SCENARIOS[func.__name__] = func
+    return func
+
+
+def setup_scenario(name):
+    """Set up the scenario named ``name`` and return a ``(func, teardown)``
+    pair, where ``teardown`` is ``None`` if the scenario has nothing to
+    release.
+    """
+    ret = SCENARIOS[name]()
+    if isinstance(ret, tuple):
+        return ret
+    return ret, None
+
+
+class Address(object):
+    def __init__(self, street, city, zip_code):
+        self.street = street
+        self.city = city
+        self.zip_code = zip_code
+
+
+class User(object):
+    def __init__(self, idx):
+        self.id = idx
+        self.uid = uuid.UUID(int=idx)
+        self.name = 'User {0}'.format(idx)
+        self.email = 'user{0}@example.com'.format(idx)
+        self.homepage = 'http://example.com/~user{0}'.format(idx)
+        self.age = 20 + idx % 50
+        self.balance = 100.0 + idx
+        self.price = Decimal('10.99')
+        self.is_active = bool(idx % 2)
+        self.created = dt.datetime(2014, 8, 17, 14, 52, idx % 60)
+        self.birthday = dt.date(1990, 1 + idx % 12, 1 + idx % 28)
+        self.wakeup = dt.time(7, idx % 60)
+        self.address = Address('{0} Main St'.format(idx), 'Springfield', '01101')
+        self.meta = {'source': {'name': 'import', 'batch': idx % 10}}
+
+
+class Blog(object):
+    def __init__(self, idx, num_collaborators=5):
+        self.title = 'Blog {0}'.format(idx)
+        self.user = User(idx)
+        self.collaborators = [User(idx + i) for i in range(num_collaborators)]
+
+
+class FlatSchema(Schema):
+    id = fields.Integer()
+    name = fields.String()
+    age = fields.Integer()
+    balance = fields.Float()
+    is_active = fields.Boolean()
+    email = fields.String()
+
+
+class FlatCodegenSchema(FlatSchema):
+    class Meta:
+        codegen = True
+
+
+class UserSchema(Schema):
+    name = fields.String()
+    email = fields.Email()
+    homepage = fields.Url()
+    age = fields.Integer()
+    created = fields.DateTime()
+
+
+class BlogSchema(Schema):
+    title = fields.String()
+    user = fields.Nested(UserSchema)
+    collaborators = fields.Nested(UserSchema, many=True)
+
+
+class SeriesSchema(Schema):
+    name = fields.String()
+    values = fields.List(fields.Float, attribute='series')
+    counts = fields.List(fields.Integer)
+
+
+class Series(object):
+    def __init__(self, idx, length=1000):
+        self.name = 'Series {0}'.format(idx)
+        self.series = [i * 0.5 for i in range(length)]
+        self.counts = list(range(length))
+
+
+class _NullWriter(object):
+    """File-like object that discards what is written to it."""
+
+    def write(self, data):
+        return len(data)
+
+
+class DottedSchema(Schema):
+    street = fields.String(attribute='address.street')
+    city = fields.String(attribute='address.city')
+    zip_code = fields.String(attribute='address.zip_code')
+    source = fields.String(attribute='meta.source.name')
+    batch = fields.Integer(attribute='meta.source.batch')
+
+
+class DateTimeFixedSchema(Schema):
+    created = fields.DateTime()
+    created_local = fields.LocalDateTime(attribute='created')
+    created_rfc = fields.DateTime(format='rfc', attribute='created')
+    birthday = fields.Date()
+    wakeup = fields.Time()
+    balance = fields.Fixed(decimals=2)
+    price = fields.Price()
+
+
+class MethodFunctionSchema(Schema):
+    upper_name = fields.Method('get_upper_name')
+    is_adult = fields.Method('get_is_adult')
+    lower_email = fields.Function(lambda obj: obj.email.lower())
+    initials = fields.Function(lambda obj: obj.name[0])
+
+    def get_upper_name(self, obj):
+        return obj.name.upper()
+
+    def get_is_adult(self, obj, context):
+        return obj.age >= context['adult_age']
+
+
+class JSONSchema(Schema):
+    id = fields.Integer()
+    uid = fields.UUID()
+    name = fields.String()
+    created = fields.DateTime()
+    balance = fields.Float()
+
+
+def _is_positive(value):
+    return value > 0
+
+
+class ValidatedSchema(Schema):
+    name = fields.String(validate=[lambda s: len(s) > 0, lambda s: len(s) < 100])
+    email = fields.Email(validate=lambda s: s.endswith('.com'))
+    homepage = fields.Url()
+    age = fields.Integer(validate=[_is_positive, lambda n: n < 150], required=True)
+    balance = fields.Float(validate=_is_positive)
+
+
+def _user_dict(idx):
+    return {
+        'name': 'User {0}'.format(idx),
+        'email': 'user{0}@example.com'.format(idx),
+        'homepage': 'http://example.com/~user{0}'.format(idx),
+        'age': str(20 + idx % 50),
+        'balance': '{0}.5'.format(idx + 1),
+    }
+
+
+@scenario
+def flat_dump():
+    schema, user = FlatSchema(), User(1)
+    return lambda: schema.dump(user)
+
+
+@scenario
+def flat_dump_codegen():
+    schema, user = FlatCodegenSchema(), User(1)
+    return lambda: schema.dump(user)
+
+
+@scenario
+def nested_dump():
+    schema, blog = BlogSchema(), Blog(1)
+    return lambda: schema.dump(blog)
+
+
+@scenario
+def many_dump():
+    schema, users = FlatSchema(many=True), [User(i) for i in range(MANY)]
+    return lambda: schema.dump(users)
+
+
+@scenario
+def many_dump_codegen():
+    schema, users = FlatCodegenSchema(many=True), [User(i) for i in range(MANY)]
+    return lambda: schema.dump(users)
+
+
+@scenario
+def many_dump_columns():
+    schema, users = FlatSchema(), [User(i) for i in range(MANY)]
+    return lambda: schema.dump_columns(users, arrays=True)
+
+
+@scenario
+def many_dumps():
+    schema, users = FlatSchema(many=True), [User(i) for i in range(MANY)]
+    return lambda: schema.dumps(users)
+
+
+@scenario
+def many_dumps_iter():
+    schema, users = FlatSchema(), [User(i) for i in range(MANY)]
+    return lambda: [chunk for chunk, _ in schema.dumps_iter(users)]
+
+
+@scenario
+def many_dumpb():
+    schema, users = JSONSchema(many=True), [User(i) for i in range(MANY)]
+    return lambda: schema.dumpb(users)
+
+
+@scenario
+def many_loadb():
+    schema = JSONSchema(many=True)
+    data = schema.dumpb([User(i) for i in range(MANY)]).data
+    return lambda: schema.loadb(data)
+
+
+@scenario
+def number_list_dump():
+    schema, series = SeriesSchema(many=True), [Series(i) for i in range(10)]
+    return lambda: schema.dump(series)
+
+
+@scenario
+def many_dump_csv():
+    schema, users = FlatSchema(), [User(i) for i in range(MANY)]
+    return lambda: schema.dump_csv(users, _NullWriter())
+
+
+@scenario
+def dotted_dump():
+    schema, users = DottedSchema(many=True), [User(i) for i in range(100)]
+    return lambda: schema.dump(users)
+
+
+@scenario
+def datetime_fixed_dump():
+    schema, users = DateTimeFixedSchema(many=True), [User(i) for i in range(100)]
+    return lambda: schema.dump(users)
+
+
+@scenario
+def method_function_dump():
+    schema = MethodFunctionSchema(many=True, context={'adult_age': 21})
+    users = [User(i) for i in range(100)]
+    return lambda: schema.dump(users)
+
+
+@scenario
+def validated_dump():
+    schema, users = ValidatedSchema(many=True), [User(i) for i in range(100)]
+    return lambda: schema.dump(users)
+
+
+@scenario
+def validated_load():
+    schema, data = ValidatedSchema(), _user_dict(1)
+    return lambda: schema.load(data)
+
+
+@scenario
+def many_load():
+    schema = ValidatedSchema(many=True)
+    data = [_user_dict(i) for i in range(MANY)]
+    return lambda: schema.load(data)
+
+
+@scenario
+def pipeline_load_dump():
+    schema = ValidatedSchema()
+    data = [_user_dict(i) for i in range(MANY)]
+    return lambda: (pipeline.Pipeline(data).load(schema).dump(schema).batch(100)
+                    .sink(len))
+
+
+@scenario
+def schema_init():
+    return lambda: UserSchema(only=('name', 'email'))
+
+
+def _json_dumps_scenario(module_name):
+    # Created once, rather than by each setup, so that a single class is
+    # registered per module
+    schema_class = type('JSONSchema_{0}'.format(module_name), (JSONSchema, ), {
+        'Meta': type('Meta', (object, ), {'json_module': module_name}),
+    })
+
+    def setup():
+        schema, users = schema_class(many=True), [User(i) for i in range(MANY)]
+        return lambda: schema.dumps(users)
+    setup.__name__ = 'json_dumps_{0}'.format(module_name)
+    return scenario(setup)
+
+
+for _module_name in JSON_MODULES:
+    if json_backend.import_json_module(_module_name).__name__ == _module_name:
+        _json_dumps_scenario(_module_name)
+
+
+def _parallel_dump_scenario(workers):
+    def setup():
+        dumper = parallel.ParallelDumper(FlatSchema(), workers=workers, chunk_size=MANY // 4)
+        users = [User(i) for i in range(MANY * 4)]
+        return (lambda: dumper.dump(users)), dumper.close
+    setup.__name__ = 'parallel_dump_{0}'.format(workers)
+    return scenario(setup)
+
+
+if parallel.futures_available:
+    for _workers in WORKERS:
+        _parallel_dump_scenario(_workers)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""Coroutines behind :meth:`Schema.dump_async <marshmallow.Schema.dump_async>`
+and :meth:`Schema.load_async <marshmallow.Schema.load_async>`.
+
+Collections, which may be regular or asynchronous iterables, are processed
+in chunks, and control is given back to the event loop between chunks, so
+that serializing a large collection does not block other tasks. Awaitable
+values returned by :class:`Method <marshmallow.fields.Method>` and
+:class:`Function <marshmallow.fields.Function>` fields are awaited
+concurrently, a chunk at a time.
+
+This module requires Python 3.5 or later. It is imported the first time one
+of those methods is called.
+"""
+import asyncio
+import inspect
+
+from marshmallow import fields
+from marshmallow.compat import iteritems, text_type
+from marshmallow.exceptions import MarshallingError
+
+# Fields whose values may be or contain awaitables
+_AWAITABLE_FIELD_TYPES = (fields.Method, fields.Function, fields.Nested, fields.List)
+
+
+async def dump(schema, obj, chunk_size=100):
+    """Serialize ``obj`` with ``schema``. See
+    :meth:`Schema.dump_async <marshmallow.Schema.dump_async>`.
+    """
+    from marshmallow.schema import MarshalResult
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+    errors = {}
+    if not schema.many:
+        schema._update_fields(obj)
+        data = schema._marshal(obj, schema.fields, strict=schema.strict, errors=errors)
+        await _resolve_awaitables([data], [errors], schema.strict, _get_keys(schema))
+        return MarshalResult(schema._postprocess(data, obj=obj, errors=errors), errors)
+    objs, data = [], []
+    next_chunk = _chunks(obj, chunk_size)
+    while True:
+        chunk = await next_chunk()
+        if not chunk:
+            break
+        if not objs:
+            # Resolve the fields from the first object
+            schema._update_fields(chunk)
+        chunk_errors = {}
+        rows = schema._marshal(chunk, schema.fields, many=True, strict=schema.strict,
+                               errors=chunk_errors)
+        row_errors = [chunk_errors.setdefault(idx, {}) for idx in range(len(rows))]
+        await _resolve_awaitables(rows, row_errors, schema.strict, _get_keys(schema))
+        _merge_errors(errors, chunk_errors, len(objs))
+        objs.extend(chunk)
+        data.extend(rows)
+        # Let other tasks run between chunks
+        await asyncio.sleep(0)
+    return MarshalResult(schema._postprocess(data, obj=objs, errors=errors), errors)
+
+
+async def load(schema, data, chunk_size=100):
+    """Deserialize ``data`` with ``schema``. See
+    :meth:`Schema.load_async <marshmallow.Schema.load_async>`.
+    """
+    from marshmallow.schema import UnmarshalResult
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+    if not schema.many:
+        return schema._load(data, many=False)
+    result, errors = [], {}
+    next_chunk = _chunks(data, chunk_size)
+    while True:
+        chunk = await next_chunk()
+        if not chunk:
+            break
+        chunk_errors = {}
+        result.extend(schema._unmarshal(chunk, schema.fields, many=True,
+                                        strict=schema.strict,
+                                        postprocess=schema.make_object,
+                                        errors=chunk_errors))
+        _merge_errors(errors, chunk_errors, len(result) - len(chunk))
+        await asyncio.sleep(0)
+    if errors and callable(schema.__error_handler__):
+        schema.__error_handler__(errors, data)
+    return UnmarshalResult(data=result, errors=errors)
+
+
+def _merge_errors(errors, chunk_errors, start):
+    """Store ``chunk_errors``, the errors of a chunk of a collection, in
+    ``errors``. The errors of an item, keyed by its index in the chunk, are
+    stored under its index in the collection, ``start`` being the index of
+    the first item of the chunk. Other errors are kept under their key.
+    """
+    for key, each in iteritems(chunk_errors):
+        if not each:
+            continue
+        if isinstance(key, int):
+            errors[start + key] = each
+        elif isinstance(each, dict) and isinstance(errors.get(key), dict):
+            errors[key].update(each)
+        else:
+            errors[key] = each
+
+
+async def validated(field_obj, awaitable, exception_class):
+    """Await ``awaitable``, the output of ``field_obj``, and return its
+    result once the field's validators have accepted it. As in
+    :meth:`Field._call_with_validation
+    <marshmallow.fields.Field._call_with_validation>`, an error is raised as
+    ``exception_class``, with the field's ``error`` message if it has one.
+    """
+    try:
+        value = await awaitable
+        field_obj._run_validators(value, exception_class)
+    except asyncio.CancelledError:
+        # An Exception rather than a BaseException before Python 3.8
+        raise
+    except Exception as error:
+        raise exception_class(getattr(field_obj, 'error', None) or error)
+    return value
+
+
+def _chunks(iterable, size):
+    """Return a coroutine function that returns the next list of at most
+    ``size`` items of ``iterable``, a regular or asynchronous iterable, or an
+    empty list when it is exhausted.
+    """
+    if hasattr(iterable, '__aiter__'):
+        iterator = iterable.__aiter__()
+
+        async def next_chunk():
+            chunk = []
+            while len(chunk) < size:
+                try:
+                    chunk.append(await iterator.__anext__())
+                except StopAsyncIteration:
+                    break
+            return chunk
+    else:
+        iterator = iter(iterable)
+
+        async def next_chunk():
+            chunk = []
+            for item in iterator:
+                chunk.append(item)
+                if len(chunk) == size:
+                    break
+            return chunk
+    return next_chunk
+
+
+def _get_keys(schema):
+    """Return the serialized keys of the fields of ``schema`` whose values
+    may be or contain awaitables.
+    """
+    return [schema.prefix + field_name
+            for field_name, field_obj in iteritems(schema.fields)
+            if isinstance(field_obj, _AWAITABLE_FIELD_TYPES)]
+
+
+def _find_awaitables(container, key, found):
+    """Append a ``(container, key)`` pair to ``found`` for each awaitable in
+    ``container[key]``, looking into nested dictionaries and lists.
+    """
+    value = container[key]
+    if inspect.isawaitable(value):
+        found.append((container, key))
+    elif isinstance(value, dict):
+        for item_key in value:
+            _find_awaitables(value, item_key, found)
+    elif isinstance(value, list):
+        for idx in range(len(value)):
+            _find_awaitables(value, idx, found)
+
+
+async def _resolve_awaitables(rows, row_errors, strict, keys):
+    """Await the awaitable values under ``keys`` in ``rows`` concurrently and
+    replace them with their results. The error of an awaitable that raises is
+    stored in the errors of its row, under the top-level key of the value.
+    """
+    pending = []
+    for idx, row in enumerate(rows):
+        for key in keys:
+            if key not in row:
+                continue
+            found = []
+            _find_awaitables(row, key, found)
+            pending.extend((idx, key, container, item_key) for container, item_key in found)
+    if not pending:
+        return
+    results = await asyncio.gather(
+        *[container[item_key] for _, _, container, item_key in pending],
+        return_exceptions=True
+    )
+    for (idx, key, container, item_key), value in zip(pending, results):
+        # A BaseException rather than an Exception on Python 3.8+
+        if isinstance(value, asyncio.CancelledError):
+            raise value
+        if isinstance(value, Exception):
+            error = value if isinstance(value, MarshallingError) else MarshallingError(value)
+            if strict:
+                raise error
+            row_errors[idx][key] = text_type(error)
+            value = None
+        container[item_key] = value
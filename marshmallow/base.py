@@ -21,6 +21,11 @@ class FieldABC(object):
     def _deserialize(self, value):
         raise NotImplementedError
 
+    def __copy__(self):
+        ret = self.__class__.__new__(self.__class__)
+        ret.__dict__.update(self.__dict__)
+        return ret
+
     def __deepcopy__(self, memo):
         ret = copy.copy(self)
         return ret
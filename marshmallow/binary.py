@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""Compact binary encoding of serialized data, used by
+:meth:`Schema.dumpb <marshmallow.Schema.dumpb>` and
+:meth:`Schema.loadb <marshmallow.Schema.loadb>`.
+
+Both ends of the wire know the fields of the schema, so the values of a
+record are written positionally, in field order, without their keys. A
+document is laid out as follows:
+
+- the 3 bytes ``MB\\x01`` (format version 1),
+- a CRC32 of the field names, as 4 little-endian bytes, so that decoding
+  with a different schema fails instead of returning garbage,
+- one byte that is 1 for a collection of records and 0 for a single record,
+  then, for a collection, the number of records,
+- the records. Each record holds one value per field, followed by the
+  number of additional key/value pairs (e.g. from the ``extra`` argument of
+  the schema) and the pairs themselves.
+
+Each value starts with a one-byte tag. Integers are zigzag-encoded varints,
+floats are 8-byte IEEE 754 doubles, and ``True``, ``False`` and ``None``
+are encoded in the tag alone. Strings, lists and dictionaries are prefixed
+with their length. ISO8601 UTC strings serialized by
+:class:`DateTime <marshmallow.fields.DateTime>` fields are encoded as the
+number of microseconds since the epoch, and strings serialized by
+:class:`UUID <marshmallow.fields.UUID>` fields as their 16 bytes, when they
+decode back to the same string.
+"""
+from __future__ import absolute_import
+
+import datetime as dt
+import re
+import struct
+import uuid
+import zlib
+from calendar import timegm
+
+from marshmallow import fields, utils
+from marshmallow.compat import PY2, text_type, binary_type, string_types, iteritems
+
+MAGIC = b'MB\x01'
+
+# Value tags
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _TEXT, _BYTES, _LIST, _DICT, _DATETIME, \
+    _UUID, _MISSING = range(12)
+
+_DOUBLE = struct.Struct('<d')
+_CRC = struct.Struct('<I')
+
+_EPOCH = dt.datetime(1970, 1, 1)
+_ISO_UTC = re.compile(
+    r'^(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{6}))?\+00:00$')
+
+_INTEGER_TYPES = (int, long) if PY2 else (int, )  # noqa
+
+_missing = object()
+
+
+def _write_uvarint(out, value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_int(out, value):
+    # Zigzag encoding, so that small negative numbers are short
+    _write_uvarint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+
+def _write_text(out, value):
+    value = value.encode('utf-8')
+    _write_uvarint(out, len(value))
+    out.extend(value)
+
+
+def _write_value(out, value):
+    """Append the tagged encoding of ``value`` to the bytearray ``out``."""
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, text_type):
+        out.append(_TEXT)
+        _write_text(out, value)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out.extend(_DOUBLE.pack(value))
+    elif isinstance(value, _INTEGER_TYPES):
+        out.append(_INT)
+        _write_int(out, value)
+    elif isinstance(value, binary_type):
+        out.append(_BYTES)
+        _write_uvarint(out, len(value))
+        out.extend(value)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_uvarint(out, len(value))
+        for key, item in iteritems(value):
+            _write_value(out, key)
+            _write_value(out, item)
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        _write_uvarint(out, len(value))
+        for item in value:
+            _write_value(out, item)
+    else:
+        raise TypeError('{0!r} cannot be encoded.'.format(value))
+
+
+def _write_datetime(out, value):
+    """Append ``value``, an ISO8601 UTC string, as a datetime if it can be
+    decoded back to the same string. Return ``False`` otherwise.
+    """
+    match = _ISO_UTC.match(value)
+    if match is None or match.group(7) == '000000':
+        return False
+    parts = [int(part) for part in match.groups('0')]
+    seconds = timegm(parts[:6])
+    out.append(_DATETIME)
+    _write_int(out, seconds * 1000000 + parts[6])
+    return True
+
+
+def _write_uuid(out, value):
+    """Append ``value``, a UUID string, as 16 bytes if it can be decoded back
+    to the same string. Return ``False`` otherwise.
+    """
+    try:
+        uid = uuid.UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        return False
+    if text_type(uid) != value:
+        return False
+    out.append(_UUID)
+    out.extend(uid.bytes)
+    return True
+
+
+class Plan(object):
+    """The positional layout of the records of a schema.
+
+    :param dict fields_dict: Mapping of field names to :class:`Field` objects.
+    :param str prefix: The prefix of the serialized keys.
+    """
+
+    def __init__(self, fields_dict, prefix=''):
+        #: Field names, the keys of deserialization input
+        self.names = tuple(fields_dict)
+        #: Keys of the serialized data
+        self.keys = tuple(prefix + name for name in self.names)
+        # Typed string writer for each field, if any
+        self.writers = tuple(_get_writer(field_obj) for field_obj in fields_dict.values())
+        self.checksum = _CRC.pack(zlib.crc32(','.join(self.names).encode('utf-8')) & 0xffffffff)
+
+    def encode(self, data, many=False):
+        """Return the encoding of ``data``, a serialized record or list of
+        records, as bytes.
+        """
+        out = bytearray(MAGIC)
+        out.extend(self.checksum)
+        if many:
+            out.append(1)
+            _write_uvarint(out, len(data))
+            for record in data:
+                self._write_record(out, record)
+        else:
+            out.append(0)
+            self._write_record(out, data)
+        return bytes(out)
+
+    def _write_record(self, out, record):
+        present = 0
+        for key, writer in zip(self.keys, self.writers):
+            value = record.get(key, _missing)
+            if value is _missing:
+                out.append(_MISSING)
+                continue
+            present += 1
+            if writer is None or not isinstance(value, string_types) or not writer(out, value):
+                _write_value(out, value)
+        # Additional keys, e.g. from ``extra``
+        if present == len(record):
+            out.append(0)
+        else:
+            keys = set(self.keys)
+            extra = [(key, value) for key, value in iteritems(record) if key not in keys]
+            _write_uvarint(out, len(extra))
+            for key, value in extra:
+                _write_value(out, key)
+                _write_value(out, value)
+
+    def decode(self, data):
+        """Decode ``data``, as returned by :meth:`encode`. Return a tuple of
+        the form ``(result, many)``, where ``result`` is a dictionary of field
+        names to values, or a list of them if ``many`` is ``True``.
+
+        :raise ValueError: If ``data`` is not valid or was encoded for
+            different fields.
+        """
+        if not isinstance(data, binary_type):
+            data = bytes(data)
+        if not data.startswith(MAGIC):
+            raise ValueError('Not a marshmallow binary document.')
+        if data[3:7] != self.checksum:
+            raise ValueError('The document was encoded for different fields.')
+        reader = _Reader(data, 7)
+        try:
+            many = reader.read_byte()
+            if many:
+                result = [self._read_record(reader) for _ in range(reader.read_uvarint())]
+            else:
+                result = self._read_record(reader)
+        except IndexError:
+            raise ValueError('Truncated marshmallow binary document.')
+        if reader.pos != len(data):
+            raise ValueError('Unexpected data after the end of the document.')
+        return result, bool(many)
+
+    def _read_record(self, reader):
+        ret = {}
+        read_value = reader.read_value
+        for name in self.names:
+            value = read_value()
+            if value is not _missing:
+                ret[name] = value
+        for _ in range(reader.read_uvarint()):
+            key = read_value()
+            ret[key] = read_value()
+        return ret
+
+
+def _get_writer(field_obj):
+    if isinstance(field_obj, fields.DateTime) and \
+            field_obj.dateformat in (None, 'iso', 'iso8601'):
+        return _write_datetime
+    if isinstance(field_obj, fields.UUID):
+        return _write_uuid
+    return None
+
+
+class _Reader(object):
+
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.bytes = bytearray(data)
+        self.pos = pos
+        self.read_funcs = {
+            _NONE: lambda: None,
+            _FALSE: lambda: False,
+            _TRUE: lambda: True,
+            _INT: self.read_int,
+            _FLOAT: self.read_float,
+            _TEXT: self.read_text,
+            _BYTES: self.read_bytes,
+            _LIST: self.read_list,
+            _DICT: self.read_dict,
+            _DATETIME: self.read_datetime,
+            _UUID: self.read_uuid,
+            _MISSING: lambda: _missing,
+        }
+
+    def read_byte(self):
+        value = self.bytes[self.pos]
+        self.pos += 1
+        return value
+
+    def read_uvarint(self):
+        data, pos = self.bytes, self.pos
+        value = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        self.pos = pos
+        return value
+
+    def read_value(self):
+        tag = self.read_byte()
+        try:
+            read = self.read_funcs[tag]
+        except KeyError:
+            raise ValueError('Invalid tag {0} at byte {1}.'.format(tag, self.pos - 1))
+        return read()
+
+    def read_int(self):
+        value = self.read_uvarint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def _read(self, size):
+        end = self.pos + size
+        if end > len(self.bytes):
+            raise IndexError(end)
+        ret = self.data[self.pos:end]
+        self.pos = end
+        return ret
+
+    def read_float(self):
+        return _DOUBLE.unpack(self._read(8))[0]
+
+    def read_text(self):
+        return self._read(self.read_uvarint()).decode('utf-8')
+
+    def read_bytes(self):
+        return self._read(self.read_uvarint())
+
+    def read_list(self):
+        read_value = self.read_value
+        return [read_value() for _ in range(self.read_uvarint())]
+
+    def read_dict(self):
+        read_value = self.read_value
+        ret = {}
+        for _ in range(self.read_uvarint()):
+            key = read_value()
+            ret[key] = read_value()
+        return ret
+
+    def read_datetime(self):
+        value = _EPOCH + dt.timedelta(microseconds=self.read_int())
+        return text_type(utils.isoformat(value))
+
+    def read_uuid(self):
+        return text_type(uuid.UUID(bytes=bytes(self._read(16))))
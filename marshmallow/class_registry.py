@@ -3,13 +3,22 @@
 serializers, which may be used with
 :class:`fields.Nested <marshmallow.fields.Nested>`.
 """
+import gc
+import inspect
+import threading
+
+from marshmallow.compat import iteritems
 from marshmallow.exceptions import RegistryError
 
 # {
 #   <class_name>: <list of class objects>
 #   <module_path_to_class>: <list of class objects>
 # }
+#
+# Entries are replaced rather than mutated, under _lock, so that lookups
+# need no lock and always see a complete list.
 _registry = {}
+_lock = threading.Lock()
 
 
 def register(classname, cls):
@@ -38,14 +47,15 @@ def register(classname, cls):
     # If the class is already registered; need to check if the entries are
     # in the same module as cls to avoid having multiple instances of the same
     # class in the registry
-    if classname in _registry and not \
-            any(each.__module__ == module for each in _registry[classname]):
-        _registry[classname].append(cls)
-    else:
-        _registry[classname] = [cls]
+    with _lock:
+        if classname in _registry and not \
+                any(each.__module__ == module for each in _registry[classname]):
+            _registry[classname] = _registry[classname] + [cls]
+        else:
+            _registry[classname] = [cls]
 
-    # Also register the full path
-    _registry.setdefault(fullpath, []).append(cls)
+        # Also register the full path
+        _registry[fullpath] = _registry.get(fullpath, []) + [cls]
     return None
 
 def get_class(classname, all=False):
@@ -61,9 +71,91 @@ def get_class(classname, all=False):
             'to import the class.'.format(classname))
     if len(classes) > 1:
         if all:
-            return _registry[classname]
+            return classes
         raise RegistryError('Multiple classes with name {0!r} '
             'were found. Please use the full, '
             'module-qualified path.'.format(classname))
     else:
-        return _registry[classname][0]
+        return classes[0]
+
+
+# inspect.getargspec is deprecated on Python 3
+_getargspec = getattr(inspect, 'getfullargspec', None) or inspect.getargspec
+
+
+def _requires_arguments(cls):
+    """Return whether the constructor of ``cls`` has required arguments."""
+    try:
+        spec = _getargspec(cls.__init__)
+    except TypeError:  # Not a Python function, e.g. object.__init__
+        return False
+    # The first argument is self
+    if len(spec.args) - 1 > len(spec.defaults or ()):
+        return True
+    kwonlydefaults = getattr(spec, 'kwonlydefaults', None) or {}
+    return any(name not in kwonlydefaults for name in getattr(spec, 'kwonlyargs', ()))
+
+
+def _warm_schema(schema):
+    """Compile the plans of ``schema`` and, if the schema generates code,
+    generate its dump and load functions, so that the factories of the
+    functions are cached on the schema class. Resolve the schemas of its
+    :class:`Nested <marshmallow.fields.Nested>` fields.
+    """
+    from marshmallow import fields, utils
+    for field_name, field_obj in iteritems(schema.fields):
+        # The accessors of the field's attribute are cached by key
+        utils.get_accessor(getattr(field_obj, 'attribute', None) or field_name)
+        if isinstance(field_obj, fields.Nested):
+            # Raises a RegistryError if the class name cannot be resolved
+            field_obj.schema
+    schema._marshal.compile(schema.fields, generate=True)
+    marshal, json_fields = schema._get_json_marshal()
+    if marshal is not schema._marshal:
+        marshal.compile(json_fields, generate=True)
+    schema._unmarshal.compile(schema.fields, generate=True)
+
+
+def warmup(freeze=False):
+    """Build the class-level caches of every registered schema class ahead of
+    time, e.g. in a server process before it forks its workers, so that the
+    workers share them and do not each build them on their first request.
+
+    An instance of each class is created and discarded. This caches the
+    class's default field set on the class and, if the class sets the
+    ``codegen`` option, the code of its dump and load functions. The schemas
+    of its :class:`Nested <marshmallow.fields.Nested>` fields are resolved,
+    so that a missing or ambiguous class name raises a
+    :exc:`RegistryError <marshmallow.exceptions.RegistryError>` now rather
+    than on the first request. Instances still bind their own copies of the
+    cached fields and resolve their own nested schemas, whose classes are
+    warmed up like any other registered class. Classes whose constructor
+    has required arguments are skipped; errors raised by the other
+    constructors are not caught.
+
+    :param bool freeze: Also move all the objects tracked by the garbage
+        collector, including the ones built here, to a permanent generation
+        with :func:`gc.freeze` (Python 3.7+), so that the collector does not
+        write to their memory pages and forked workers keep sharing them.
+        Has no effect on earlier Python versions.
+    :return: The list of the schema classes that were instantiated.
+
+    .. versionadded:: 1.0.0
+    """
+    with _lock:
+        entries = list(_registry.values())
+    classes = []
+    seen = set()
+    for each in entries:
+        for cls in each:
+            if cls in seen:
+                continue
+            seen.add(cls)
+            if _requires_arguments(cls):
+                continue
+            _warm_schema(cls())
+            classes.append(cls)
+    if freeze and hasattr(gc, 'freeze'):
+        gc.collect()
+        gc.freeze()
+    return classes
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""Generation of specialized serialization and deserialization functions.
+
+Used by schemas that set the ``codegen`` class Meta option. The
+:class:`Marshaller <marshmallow.fields.Marshaller>` passes its compiled
+serialization plan to :func:`generate_dumper`, and the
+:class:`Unmarshaller <marshmallow.fields.Unmarshaller>` passes its
+deserialization plan to :func:`generate_loader`. Each writes the Python source
+for a function that processes a single object with the plan's fields, and
+``exec`` s it.
+
+The source does not depend on the field objects themselves, only on their
+names, types and options, so it is compiled into a factory that takes the
+field objects as arguments and returns the function. Schemas cache the
+factories of each of their field sets; see :func:`generate_dump_factory` and
+:func:`generate_load_factory`.
+
+:class:`String <marshmallow.fields.String>`,
+:class:`Integer <marshmallow.fields.Integer>`,
+:class:`Float <marshmallow.fields.Float>` and
+:class:`Boolean <marshmallow.fields.Boolean>` fields without validators are
+inlined; all other fields are called through their ``serialize`` or
+``deserialize`` methods. A generated function stores the error of each field
+that fails in the errors dictionary passed to it, as the generic path does, so
+that no field is processed twice.
+"""
+from __future__ import absolute_import
+
+from marshmallow import fields, utils
+from marshmallow.compat import OrderedDict, text_type, iteritems, itervalues
+from marshmallow.exceptions import MarshallingError, UnmarshallingError
+
+# Compiled code objects, keyed by source. Schemas with the same field layout
+# share the same code.
+_code_cache = {}
+
+
+def _can_inline(field_obj):
+    """Return True if the formatting of ``field_obj`` can be inlined."""
+    return (type(field_obj) in (fields.String, fields.Integer,
+                                fields.Float, fields.Boolean) and
+            not field_obj.validate and not field_obj.required)
+
+
+def get_options(field_obj):
+    """Return the options of ``field_obj`` that the generated code depends on.
+    Code generated for a field can be reused for another field of the same
+    class whose options are equal, e.g. an unmodified copy of the field.
+    """
+    return (type(field_obj),) + tuple(
+        getattr(field_obj, name, None)
+        for name in ('attribute', 'default', 'required', 'validate',
+                     'as_string', 'num_type')
+    )
+
+
+def _format_expr(field_obj, value, namespace, idx):
+    """Return a Python expression that formats ``value``, the name of a local
+    variable holding the serialized value for ``field_obj``.
+    """
+    if isinstance(field_obj, fields.String):
+        return '({0} if {0}.__class__ is _text_type else _ensure_text({0}))'.format(value)
+    if isinstance(field_obj, fields.Boolean):
+        return '(True if {0} else False)'.format(value)
+    # Number
+    num_type = '_num{0}'.format(idx)
+    namespace[num_type] = field_obj.num_type
+    if field_obj.as_string:
+        return 'repr({0}({1}))'.format(num_type, value)
+    return '{0}({1})'.format(num_type, value)
+
+
+def _store_errors(lines, indent, target, call, idx, exception_class):
+    """Append to ``lines`` a ``try`` statement that assigns the result of
+    ``call`` to ``target``, storing the error of field ``idx`` in ``errors``
+    (or raising it if ``strict``) if ``call`` raises ``exception_class``.
+    """
+    pad = ' ' * indent
+    lines.extend([
+        pad + 'try:',
+        pad + '    {0} = {1}'.format(target, call),
+        pad + 'except {0} as err:'.format(exception_class),
+        pad + '    if strict:',
+        pad + '        raise',
+        pad + '    errors[_key{0}] = _text_type(err)'.format(idx),
+        pad + '    {0} = None'.format(target),
+        pad + 'except TypeError:',
+        pad + '    _raise_if_field_class(_key{0}, _field{0})'.format(idx),
+        pad + '    raise',
+    ])
+
+
+def _factory_source(lines, name, count):
+    """Return the source of a function named ``make`` that takes a tuple of
+    ``count`` field objects, binds them to ``_field0``, ``_field1``, etc., and
+    returns the function named ``name`` defined by ``lines``.
+    """
+    head = ['def make(_fields):']
+    if count:
+        head.append('    {0}= _fields'.format(
+            ''.join('_field{0}, '.format(idx) for idx in range(count))))
+    body = ['    ' + line for line in lines]
+    return '\n'.join(head + body + ['    return ' + name]) + '\n'
+
+
+def generate_dump_source(plan):
+    """Return a ``(source, namespace)`` pair for a factory named ``make``
+    that takes the field objects of ``plan``, as a tuple, and returns a
+    function named ``dump`` that serializes an object according to ``plan``.
+    The function takes the object, a dictionary to store errors on and the
+    ``strict`` flag.
+
+    Inlined fields that fail to format are serialized again with the field's
+    ``serialize`` method, which raises the error to store. Other fields are
+    only serialized once.
+
+    :param tuple plan: A serialization plan, as returned by
+        :meth:`Marshaller.compile <marshmallow.fields.Marshaller.compile>`.
+    """
+    namespace = {
+        '_OrderedDict': OrderedDict,
+        '_text_type': text_type,
+        '_ensure_text': utils.ensure_text_type,
+        '_MarshallingError': MarshallingError,
+        '_raise_if_field_class': fields._raise_if_field_class,
+    }
+    lines = ['def dump(obj, errors, strict):']
+    items = []
+    for idx, (key, attr_name, field_obj) in enumerate(plan):
+        namespace['_key{0}'.format(idx)] = key
+        namespace['_attr{0}'.format(idx)] = attr_name
+        out = 'x{0}'.format(idx)
+        inline = _can_inline(field_obj)
+        if inline:
+            try:
+                namespace['_default{0}'.format(idx)] = field_obj._format(field_obj.default)
+            except Exception:
+                inline = False
+        call = '_field{0}.serialize(_attr{0}, obj)'.format(idx)
+        if inline:
+            check_key = attr_name if field_obj.attribute is None else field_obj.attribute
+            namespace['_get{0}'.format(idx)] = utils.get_accessor(check_key)
+            lines.append('    try:')
+            lines.append('        v = _get{0}(obj)'.format(idx))
+            lines.append('        {0} = _default{1} if v is None else {2}'.format(
+                out, idx, _format_expr(field_obj, 'v', namespace, idx)))
+            lines.append('    except Exception:')
+            _store_errors(lines, 8, out, call, idx, '_MarshallingError')
+        else:
+            _store_errors(lines, 4, out, call, idx, '_MarshallingError')
+        items.append('(_key{0}, {1})'.format(idx, out))
+    lines.append('    return _OrderedDict([{0}])'.format(', '.join(items)))
+    return _factory_source(lines, 'dump', len(plan)), namespace
+
+
+def _compile(source, namespace, name):
+    try:
+        code = _code_cache[source]
+    except KeyError:
+        code = _code_cache.setdefault(
+            source, compile(source, '<marshmallow generated {0}>'.format(name), 'exec'))
+    exec(code, namespace)
+    factory = namespace['make']
+    factory.source = source
+    return factory
+
+
+def bind(factory, field_objs):
+    """Return the function made by ``factory`` for ``field_objs``, a tuple
+    of the field objects of the plan the factory was generated for.
+    """
+    func = factory(field_objs)
+    func.source = factory.source
+    return func
+
+
+def generate_dump_factory(plan):
+    """Generate and compile a factory for the dump functions of ``plan``.
+    The factory takes a tuple of the field objects of ``plan``, in order, and
+    may be reused for other plans whose fields have the same keys, types and
+    options, e.g. copies of the same fields.
+
+    :param tuple plan: A serialization plan, as returned by
+        :meth:`Marshaller.compile <marshmallow.fields.Marshaller.compile>`.
+    """
+    source, namespace = generate_dump_source(plan)
+    return _compile(source, namespace, 'dump')
+
+
+def generate_dumper(plan):
+    """Generate, compile and return a function that serializes a single object
+    according to ``plan``. The function is called as ``dump(obj, errors,
+    strict)`` and stores errors like :meth:`Marshaller.serialize
+    <marshmallow.fields.Marshaller.serialize>`.
+
+    :param tuple plan: A serialization plan, as returned by
+        :meth:`Marshaller.compile <marshmallow.fields.Marshaller.compile>`.
+    """
+    return bind(generate_dump_factory(plan),
+                tuple(field_obj for _, _, field_obj in plan))
+
+
+def _load_expr(field_obj, value, namespace, idx):
+    """Return a Python expression that deserializes ``value``, the name of a
+    local variable holding the input value for ``field_obj``.
+    """
+    if isinstance(field_obj, fields.Boolean):
+        return '_field{0}._deserialize({1})'.format(idx, value)
+    default = '_default{0}'.format(idx)
+    if isinstance(field_obj, fields.String):
+        namespace[default] = field_obj.default
+        return ('({1} if {0} is None else {0} if {0}.__class__ is _text_type '
+                'else _ensure_text({0}))'.format(value, default))
+    # Number
+    namespace[default] = field_obj._format_num(field_obj.default)
+    return '{0} if {1} is None else {2}'.format(
+        default, value, _format_expr(field_obj, value, namespace, idx))
+
+
+def generate_load_source(plan):
+    """Return a ``(source, namespace)`` pair for a factory named ``make``
+    that takes the field objects of ``plan``, as a tuple, and returns a
+    function named ``load`` that deserializes a dictionary according to
+    ``plan``. The function takes the dictionary, a dictionary to store errors
+    on and the ``strict`` flag. The keys of the returned dictionary are in
+    field order.
+
+    As in :func:`generate_dump_source`, inlined fields that fail are
+    deserialized again with the field's ``deserialize`` method.
+
+    :param dict plan: A deserialization plan, as returned by
+        :meth:`Unmarshaller.compile <marshmallow.fields.Unmarshaller.compile>`.
+    """
+    namespace = {
+        '_OrderedDict': OrderedDict,
+        '_text_type': text_type,
+        '_ensure_text': utils.ensure_text_type,
+        '_UnmarshallingError': UnmarshallingError,
+        '_raise_if_field_class': fields._raise_if_field_class,
+    }
+    lines = ['def load(data, errors, strict):', '    ret = _OrderedDict()']
+    for idx, (attr_name, (key, field_obj)) in enumerate(iteritems(plan)):
+        namespace['_attr{0}'.format(idx)] = attr_name
+        namespace['_key{0}'.format(idx)] = key
+        inline = _can_inline(field_obj)
+        if inline:
+            try:
+                expr = _load_expr(field_obj, 'v', namespace, idx)
+            except Exception:
+                inline = False
+        target = 'ret[_key{0}]'.format(idx)
+        call = '_field{0}.deserialize(v)'.format(idx)
+        lines.append('    if _attr{0} in data:'.format(idx))
+        lines.append('        v = data[_attr{0}]'.format(idx))
+        if inline:
+            lines.append('        try:')
+            lines.append('            {0} = {1}'.format(target, expr))
+            lines.append('        except Exception:')
+            _store_errors(lines, 12, target, call, idx, '_UnmarshallingError')
+        else:
+            _store_errors(lines, 8, target, call, idx, '_UnmarshallingError')
+    lines.append('    return ret')
+    return _factory_source(lines, 'load', len(plan)), namespace
+
+
+def generate_load_factory(plan):
+    """Generate and compile a factory for the load functions of ``plan``.
+    As with :func:`generate_dump_factory`, the factory takes a tuple of the
+    field objects of ``plan``, in order.
+
+    :param dict plan: A deserialization plan, as returned by
+        :meth:`Unmarshaller.compile <marshmallow.fields.Unmarshaller.compile>`.
+    """
+    source, namespace = generate_load_source(plan)
+    return _compile(source, namespace, 'load')
+
+
+def generate_loader(plan):
+    """Generate, compile and return a function that deserializes a single
+    dictionary according to ``plan``. The function is called as
+    ``load(data, errors, strict)`` and stores errors like
+    :meth:`Unmarshaller.deserialize
+    <marshmallow.fields.Unmarshaller.deserialize>`.
+
+    :param dict plan: A deserialization plan, as returned by
+        :meth:`Unmarshaller.compile <marshmallow.fields.Unmarshaller.compile>`.
+    """
+    return bind(generate_load_factory(plan),
+                tuple(field_obj for _, field_obj in itervalues(plan)))
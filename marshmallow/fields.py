@@ -4,9 +4,10 @@
 from __future__ import absolute_import
 
 from decimal import Decimal as MyDecimal, ROUND_HALF_EVEN
-from functools import partial
 import datetime as dt
 import inspect
+import itertools
+import threading
 import warnings
 
 from marshmallow import validate, utils, class_registry
@@ -96,29 +97,150 @@ def _call_and_store(getter_func, data, field_name, field_obj, errors_dict,
         errors_dict[field_name] = text_type(err)
         value = None
     except TypeError:
-        # field declared as a class, not an instance
-        if (isinstance(field_obj, type) and
-                issubclass(field_obj, FieldABC)):
-            msg = ('Field for "{0}" must be declared as a '
-                            "Field instance, not a class. "
-                            'Did you mean "fields.{1}()"?'
-                            .format(field_name, field_obj.__name__))
-            raise TypeError(msg)
+        _raise_if_field_class(field_name, field_obj)
         raise
     return value
 
-class Marshaller(object):
+def _raise_if_field_class(field_name, field_obj):
+    """Raise a helpful :exc:`TypeError` if ``field_obj`` was declared as a
+    :class:`Field` class rather than an instance.
+    """
+    if (isinstance(field_obj, type) and
+            issubclass(field_obj, FieldABC)):
+        msg = ('Field for "{0}" must be declared as a '
+                        "Field instance, not a class. "
+                        'Did you mean "fields.{1}()"?'
+                        .format(field_name, field_obj.__name__))
+        raise TypeError(msg)
+
+# Errors of the object being serialized in the current thread. Nested fields
+# store the errors of their nested objects there, so that they end up with
+# the errors of the object the field belongs to, whichever marshaller
+# serializes it.
+_active = threading.local()
+
+
+class _CallErrors(object):
+    """Base class for :class:`Marshaller` and :class:`Unmarshaller`.
+
+    Every call stores its errors in its own dictionary. The dictionary of the
+    call in progress (or of the most recent call) is kept in thread-local
+    storage and exposed as :attr:`errors`, so an instance can be shared
+    between threads and called reentrantly without mixing errors.
+    """
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def errors(self):
+        """Dictionary of errors stored during the current call, or the most
+        recent call made from the current thread.
+        """
+        try:
+            return self._local.errors
+        except AttributeError:
+            self._local.errors = {}
+            return self._local.errors
+
+    @errors.setter
+    def errors(self, value):
+        self._local.errors = value
+
+    def _enter(self, errors):
+        """Make ``errors`` the error dictionary of the current thread and
+        return the state to pass to :meth:`_exit`.
+        """
+        local = self._local
+        state = (getattr(local, 'errors', None), getattr(local, 'depth', 0))
+        local.errors = errors
+        local.depth = state[1] + 1
+        return state
+
+    def _exit(self, state):
+        outer_errors, depth = state
+        local = self._local
+        local.depth = depth
+        if depth:  # Reentrant call; restore the errors of the enclosing call
+            local.errors = outer_errors
+
+
+# Stands in for a generated function that is not generated yet
+_NOT_GENERATED = object()
+
+
+class Marshaller(_CallErrors):
     """Callable class responsible for serializing data and storing errors.
 
+    The fields to serialize are compiled into a serialization plan, a tuple of
+    ``(key, attr_name, field_obj)`` triples, the first time a given fields
+    dictionary is seen (or when :meth:`compile` is called). The plan is reused
+    for as long as the same fields dictionary is passed in, so the per-object
+    work is reduced to a single loop over the plan.
+
+    A ``Marshaller`` may be shared between threads. Errors are collected per
+    call; see :meth:`serialize`. When serializing a collection, the errors
+    of each object are stored under the object's index in the collection.
+
+    The values of :class:`Nested` and :class:`Function` fields with a
+    ``batch`` function are resolved for all the objects of a call at once,
+    with a single call to the function.
+
     :param str prefix: Optional prefix that will be prepended to all the
         serialized field names.
+    :param callable codegen: Optional function that receives a compiled plan
+        and returns a function that serializes a single object, called with
+        the object, the dictionary to store its errors on and ``strict``. If
+        given, objects are serialized with the generated function rather than
+        with a loop over the plan. The function is generated the first time a
+        plan is used, unless it has fields with a ``batch`` function.
+        See :func:`marshmallow.codegen.generate_dumper`.
     """
-    def __init__(self, prefix=''):
+    def __init__(self, prefix='', codegen=None):
+        super(Marshaller, self).__init__()
         self.prefix = prefix
-        #: Dictionary of errors stored during serialization
-        self.errors = {}
+        self.codegen = codegen
+        # (fields_dict, plan, dumper, batched) for the most recently compiled
+        # fields, where batched are the entries of the plan whose fields have
+        # a batch function
+        self._compiled = (None, (), None, ())
 
-    def serialize(self, obj, fields_dict, many=False, strict=False):
+    def compile(self, fields_dict, generate=False):
+        """Build and cache the serialization plan for ``fields_dict``.
+
+        Call this again if ``fields_dict`` is mutated in place.
+
+        :param dict fields_dict: Mapping of field names to :class:`Field` objects.
+        :param bool generate: If ``True`` and there is a ``codegen`` function,
+            generate the function of the plan now rather than on first use.
+        :return: A tuple of ``(key, attr_name, field_obj)`` triples.
+
+        .. versionadded:: 1.0.0
+        """
+        prefix = self.prefix
+        plan = tuple(
+            (prefix + attr_name, attr_name, field_obj)
+            for attr_name, field_obj in iteritems(fields_dict)
+        )
+        # Entries of the fields that resolve their values with a batch function
+        batched = tuple(entry for entry in plan if getattr(entry[2], 'batch', None))
+        # The plans of batched fields are rebuilt per call, so are not generated
+        dumper = _NOT_GENERATED if self.codegen and not batched else None
+        self._compiled = (fields_dict, plan, dumper, batched)
+        if generate and dumper is _NOT_GENERATED:
+            self._generate(self._compiled)
+        return plan
+
+    def _generate(self, compiled):
+        """Return the function generated for the ``compiled`` plan, and cache
+        it unless another plan has been compiled in the meantime.
+        """
+        fields_dict, plan, _, batched = compiled
+        dumper = self.codegen(plan)
+        if self._compiled is compiled:
+            self._compiled = (fields_dict, plan, dumper, batched)
+        return dumper
+
+    def serialize(self, obj, fields_dict, many=False, strict=False, errors=None):
         """Takes raw data (a dict, list, or other object) and a dict of
         fields to output and serializes the data based on those fields.
 
@@ -128,45 +250,311 @@ class Marshaller(object):
             a collection.
         :param bool strict: If ``True``, raise errors if invalid data are passed in
             instead of failing silently and storing the errors.
-        :return: An OrderedDict of the marshalled data
+        :param dict errors: Dictionary to store errors on. If ``None``, a new
+            dictionary is used. Either way, the dictionary is available as
+            :attr:`errors` in the calling thread after the call. If ``many``
+            is ``True``, errors are keyed by the index of the invalid object,
+            e.g. ``{2: {'email': 'Invalid email'}}``.
+        :return: An OrderedDict of the marshalled data, or a list of them if
+            ``many`` is ``True``.
 
         .. versionchanged:: 1.0.0
             Renamed from ``marshal``.
         """
-        if many and obj is not None:
-            return [self.serialize(d, fields_dict, many=False) for d in obj]
-        items = []
-        for attr_name, field_obj in iteritems(fields_dict):
-            key = self.prefix + attr_name
-            value = _call_and_store(
-                getter_func=partial(field_obj.serialize, attr_name),
+        compiled = self._compiled
+        if compiled[0] is not fields_dict:
+            self.compile(fields_dict)
+            compiled = self._compiled
+        _, plan, dumper, batched = compiled
+        if dumper is _NOT_GENERATED:
+            dumper = self._generate(compiled)
+        if errors is None:
+            errors = {}
+        state = self._enter(errors)
+        active_errors = getattr(_active, 'errors', None)
+        try:
+            if many and obj is not None:
+                if batched:
+                    obj = list(obj)
+                    plan, dumper = self._resolve_batches(obj, plan, batched), None
+                return self._serialize_many(obj, plan, dumper, strict, errors)
+            if batched and obj is not None:
+                plan, dumper = self._resolve_batches([obj], plan, batched), None
+            return self._serialize(obj, plan, dumper, strict, errors)
+        finally:
+            # Give the errors of the enclosing object back to its nested fields
+            _active.errors = active_errors
+            self._exit(state)
+
+    # Make an instance callable
+    __call__ = serialize
+
+    def _resolve_batches(self, objs, plan, batched):
+        """Return a copy of ``plan`` in which the fields of the ``batched``
+        entries are replaced by :class:`_Batch` objects holding the values
+        resolved for ``objs``, a list of objects.
+        """
+        batches = dict(
+            (key, _Batch(field_obj, attr_name, objs))
+            for key, attr_name, field_obj in batched
+        )
+        return tuple(
+            (key, attr_name, batches.get(key, field_obj))
+            for key, attr_name, field_obj in plan
+        )
+
+    def _serialize(self, obj, plan, dumper, strict, errors):
+        """Serialize a single object according to ``plan``, storing its
+        errors, including those of its nested objects, in ``errors``.
+        """
+        _active.errors = errors
+        if dumper is not None:
+            return dumper(obj, errors, strict)
+        ret = OrderedDict()
+        for key, attr_name, field_obj in plan:
+            try:
+                value = field_obj.serialize(attr_name, obj)
+            except RegistryError:
+                raise
+            except MarshallingError as err:  # Store errors
+                if strict:
+                    raise err
+                errors[key] = text_type(err)
+                value = None
+            except TypeError:
+                _raise_if_field_class(key, field_obj)
+                raise
+            ret[key] = value
+        return ret
+
+    def _serialize_many(self, objs, plan, dumper, strict, errors):
+        """Serialize each object in ``objs`` according to ``plan``, storing
+        the errors of each object under its index.
+        """
+        ret = []
+        append = ret.append
+        serialize = self._serialize
+        for idx, obj in enumerate(objs):
+            row_errors = {}
+            append(serialize(obj, plan, dumper, strict, row_errors))
+            if row_errors:
+                errors[idx] = row_errors
+        return ret
+
+    def serialize_columns(self, objs, fields_dict, strict=False, errors=None):
+        """Serialize each object in ``objs`` into columns rather than rows:
+        the value of each field is appended to the field's list, so no
+        dictionary is built per object.
+
+        :param objs: An iterable of objects to serialize.
+        :param dict fields_dict: Mapping of field names to :class:`Field` objects.
+        :param bool strict: If ``True``, raise errors if invalid data are passed in
+            instead of failing silently and storing the errors.
+        :param dict errors: Dictionary to store errors on, keyed by the index of
+            the invalid object. See :meth:`serialize`.
+        :return: An OrderedDict mapping each serialized field name to the list
+            of its values, in the order of ``objs``. The value of a field that
+            fails to serialize is ``None``.
+
+        If NumPy is installed, the raw values of number fields are collected
+        and formatted in one call per column. A column that cannot be
+        formatted this way is serialized one value at a time, as usual.
+
+        .. versionadded:: 1.0.0
+        """
+        compiled_fields, plan, dumper, batched = self._compiled
+        if compiled_fields is not fields_dict:
+            plan = self.compile(fields_dict)
+            batched = self._compiled[3]
+        if errors is None:
+            errors = {}
+        state = self._enter(errors)
+        active_errors = getattr(_active, 'errors', None)
+        try:
+            if batched:
+                objs = list(objs)
+                plan = self._resolve_batches(objs, plan, batched)
+            vectorized = tuple(
+                (key, attr_name, field_obj) for key, attr_name, field_obj in plan
+                if _can_format_many(field_obj)
+            )
+            if vectorized:
+                # Keep the objects, should a column need to be serialized again
+                objs = list(objs)
+            vectorized_keys = set(key for key, _, _ in vectorized)
+            columns = OrderedDict((key, []) for key, _, _ in plan)
+            appenders = tuple(
+                (columns[key].append, key,
+                 # Raw values of the vectorized fields are formatted afterwards
+                 field_obj.get_value if key in vectorized_keys else field_obj.serialize,
+                 attr_name, field_obj)
+                for key, attr_name, field_obj in plan
+            )
+            for idx, obj in enumerate(objs):
+                row_errors = _active.errors = {}
+                for append, key, serialize, attr_name, field_obj in appenders:
+                    try:
+                        value = serialize(attr_name, obj)
+                    except RegistryError:
+                        raise
+                    except MarshallingError as err:  # Store errors
+                        if strict:
+                            raise err
+                        row_errors[key] = text_type(err)
+                        value = None
+                    except TypeError:
+                        _raise_if_field_class(key, field_obj)
+                        raise
+                    append(value)
+                if row_errors:
+                    errors[idx] = row_errors
+            for key, attr_name, field_obj in vectorized:
+                column = field_obj._format_many(columns[key])
+                if column is None:
+                    column = self._serialize_column(objs, key, attr_name, field_obj,
+                                                    strict, errors)
+                columns[key] = column
+            return columns
+        finally:
+            _active.errors = active_errors
+            self._exit(state)
+
+    def _serialize_column(self, objs, key, attr_name, field_obj, strict, errors):
+        """Serialize the values of a single field of ``objs``, one at a time."""
+        ret = []
+        for idx, obj in enumerate(objs):
+            row_errors = {}
+            ret.append(_call_and_store(
+                getter_func=lambda data: field_obj.serialize(attr_name, data),
                 data=obj,
                 field_name=key,
                 field_obj=field_obj,
-                errors_dict=self.errors,
+                errors_dict=row_errors,
                 exception_class=MarshallingError,
                 strict=strict
-            )
-            items.append((key, value))
-        return OrderedDict(items)
+            ))
+            if row_errors:
+                errors.setdefault(idx, {}).update(row_errors)
+        return ret
 
-    # Make an instance callable
-    __call__ = serialize
+
+# Marks the batch keys that are told apart by identity
+_by_identity = object()
+
+
+def _batch_ident(key):
+    """Return ``key``, or a token for its identity if ``key`` cannot be
+    hashed, e.g. a dictionary serialized by a :class:`Function` field.
+    """
+    try:
+        hash(key)
+    except TypeError:
+        return (_by_identity, id(key))
+    return key
+
+
+class _Batch(object):
+    """Stands in for a field with a ``batch`` function in the serialization
+    plan of a single call. The batch function is called once, with the
+    distinct keys of all the objects to serialize, and each object is then
+    serialized with the value resolved for its key.
+    """
+    def __init__(self, field_obj, attr, objs):
+        self.field_obj = field_obj
+        self.error = None
+        # Index of each distinct key in the list passed to the batch function
+        self.positions = {}
+        keys = []
+        for obj in objs:
+            key = field_obj._get_batch_key(attr, obj)
+            if key is None:
+                continue
+            ident = _batch_ident(key)
+            if ident not in self.positions:
+                self.positions[ident] = len(keys)
+                keys.append(key)
+        try:
+            self.resolved = field_obj.batch(keys) if keys else {}
+        except (MarshallingError, ValueError) as error:
+            # Every object fails to serialize with the same error
+            self.resolved = {}
+            self.error = error if isinstance(error, MarshallingError) else MarshallingError(error)
+
+    def serialize(self, attr, obj):
+        if self.error is not None:
+            raise self.error
+        key = self.field_obj._get_batch_key(attr, obj)
+        if key is None:
+            value = None
+        elif isinstance(self.resolved, (list, tuple)):
+            # Values in the order of the keys
+            value = self.resolved[self.positions[_batch_ident(key)]]
+        else:
+            value = self.resolved.get(key)
+        return self.field_obj._serialize_batched(value, attr, obj)
 
 
-class Unmarshaller(object):
+class Unmarshaller(_CallErrors):
     """Callable class responsible for deserializing data and storing errors.
 
+    Like :class:`Marshaller`, the fields are compiled into a plan, here a
+    mapping of input keys to ``(key, field_obj)`` pairs, that is reused for as
+    long as the same fields dictionary is passed in. An ``Unmarshaller`` may be
+    shared between threads. As with :class:`Marshaller`, the errors of each
+    item of a collection are stored under the item's index.
+
     :param str prefix: Optional prefix that will be prepended to all the
         serialized field names.
+    :param callable codegen: Optional function that receives a compiled plan
+        and returns a function that deserializes a single dictionary, called
+        with the dictionary, the dictionary to store its errors on and
+        ``strict``. As with :class:`Marshaller`, the function is generated
+        the first time a plan is used.
+        See :func:`marshmallow.codegen.generate_loader`.
 
     .. versionadded:: 1.0.0
     """
-    def __init__(self, prefix=''):
-        #: Dictionary of errors stored during deserialization
-        self.errors = {}
+    def __init__(self, prefix='', codegen=None):
+        super(Unmarshaller, self).__init__()
+        self.codegen = codegen
+        # (fields_dict, plan, loader) for the most recently compiled fields
+        self._compiled = (None, {}, None)
+
+    def compile(self, fields_dict, generate=False):
+        """Build and cache the deserialization plan for ``fields_dict``.
 
-    def deserialize(self, data, fields_dict, many=False, postprocess=None, strict=False):
+        Call this again if ``fields_dict`` is mutated in place.
+
+        :param dict fields_dict: Mapping of field names to :class:`Field` objects.
+        :param bool generate: If ``True`` and there is a ``codegen`` function,
+            generate the function of the plan now rather than on first use.
+        :return: An OrderedDict mapping input keys to ``(key, field_obj)``
+            pairs, where ``key`` is the name of the attribute to deserialize to.
+
+        .. versionadded:: 1.0.0
+        """
+        plan = OrderedDict(
+            (attr_name, (getattr(field_obj, 'attribute', None) or attr_name, field_obj))
+            for attr_name, field_obj in iteritems(fields_dict)
+        )
+        loader = _NOT_GENERATED if self.codegen else None
+        self._compiled = (fields_dict, plan, loader)
+        if generate and loader is _NOT_GENERATED:
+            self._generate(self._compiled)
+        return plan
+
+    def _generate(self, compiled):
+        """Return the function generated for the ``compiled`` plan, and cache
+        it unless another plan has been compiled in the meantime.
+        """
+        fields_dict, plan, _ = compiled
+        loader = self.codegen(plan)
+        if self._compiled is compiled:
+            self._compiled = (fields_dict, plan, loader)
+        return loader
+
+    def deserialize(self, data, fields_dict, many=False, postprocess=None,
+                    strict=False, errors=None):
         """Deserialize ``data`` based on the schema defined by ``fields_dict``.
 
         :param dict data: The data to deserialize.
@@ -177,37 +565,90 @@ class Unmarshaller(object):
             deserialized dictionary.
         :param bool strict: If ``True``, raise errors if invalid data are passed in
             instead of failing silently and storing the errors.
-        :return: An OrderedDict of the deserialized data.
+        :param dict errors: Dictionary to store errors on. If ``None``, a new
+            dictionary is used. Either way, the dictionary is available as
+            :attr:`errors` in the calling thread after the call. If ``many``
+            is ``True``, errors are keyed by the index of the invalid item.
+        :return: An OrderedDict of the deserialized data, or a list of them if
+            ``many`` is ``True``.
         """
-        if many and data is not None:
-            return [self.deserialize(d, fields_dict, many=False) for d in data]
-        items = []
-        for attr_name, value in iteritems(data):
-            if attr_name not in fields_dict:
-                continue
-            field_obj = fields_dict[attr_name]
-            key = fields_dict[attr_name].attribute or attr_name
-            value = _call_and_store(
-                getter_func=field_obj.deserialize,
-                data=data[attr_name],
-                field_name=key,
-                field_obj=field_obj,
-                errors_dict=self.errors,
-                exception_class=UnmarshallingError,
-                strict=strict
-            )
-            items.append((key, value))
-        ret = OrderedDict(items)
+        compiled = self._compiled
+        if compiled[0] is not fields_dict:
+            self.compile(fields_dict)
+            compiled = self._compiled
+        _, plan, loader = compiled
+        if loader is _NOT_GENERATED:
+            loader = self._generate(compiled)
+        if errors is None:
+            errors = {}
+        state = self._enter(errors)
+        try:
+            if many and data is not None:
+                return self._deserialize_many(data, plan, loader, strict, errors)
+            return self._deserialize(data, plan, loader, postprocess, strict, errors)
+        finally:
+            self._exit(state)
+
+    # Make an instance callable
+    __call__ = deserialize
+
+    def _deserialize(self, data, plan, loader, postprocess, strict, errors):
+        """Deserialize a single dictionary according to ``plan``."""
+        if loader is not None:
+            ret = loader(data, errors, strict)
+        else:
+            items = []
+            for attr_name, raw_value in iteritems(data):
+                if attr_name not in plan:
+                    continue
+                key, field_obj = plan[attr_name]
+                value = _call_and_store(
+                    getter_func=field_obj.deserialize,
+                    data=raw_value,
+                    field_name=key,
+                    field_obj=field_obj,
+                    errors_dict=errors,
+                    exception_class=UnmarshallingError,
+                    strict=strict
+                )
+                items.append((key, value))
+            ret = OrderedDict(items)
         if postprocess:
             return postprocess(ret)
         return ret
 
-    # Make an instance callable
-    __call__ = deserialize
+    def _deserialize_many(self, data, plan, loader, strict, errors):
+        """Deserialize each dictionary in ``data`` according to ``plan``,
+        storing the errors of each item under its index.
+        """
+        ret = []
+        append = ret.append
+        deserialize = self._deserialize
+        for idx, item in enumerate(data):
+            row_errors = {}
+            append(deserialize(item, plan, loader, None, strict, row_errors))
+            if row_errors:
+                errors[idx] = row_errors
+        return ret
 
 
-# Singleton marshaller function for use in this module
-marshal = Marshaller()
+def _get_validators(validate):
+    """Return a tuple of validation functions from the ``validate`` argument
+    of a :class:`Field`.
+
+    :raise ValueError: If ``validate`` is neither a callable nor a collection
+        of callables.
+    """
+    if not validate:
+        return ()
+    if utils.is_iterable_but_not_string(validate):
+        if inspect.isgeneratorfunction(validate):
+            return tuple(validate())
+        return tuple(validate)
+    if callable(validate):
+        return (validate, )
+    raise ValueError("The 'validate' parameter must be a callable or a "
+                     "collection of callables.")
 
 
 class Field(FieldABC):
@@ -221,12 +662,22 @@ class Field(FieldABC):
     :param str error: Error message stored upon validation failure.
     :param callable validate: Validation function that takes the output as its
         only parameter and returns a boolean. If it returns False, a
-        MarshallingError is raised.
+        MarshallingError is raised. May also be a collection of such functions,
+        or a generator function that yields them.
     :param bool required: Make a field required. If a field is ``None``,
         raise a :exc:`MarshallingError`.
     """
     _CHECK_ATTRIBUTE = True
+    # Sort key of field classes declared in place of instances, an error
+    # that is reported when the schema is used
     _creation_index = 0
+    # Source of the creation indices of fields. Taking the next value is a
+    # single, atomic operation, so fields may be created from several threads.
+    _creation_counter = itertools.count()
+    # Tuple of validation functions, built when ``validate`` is set
+    _validators = ()
+    # (key, accessor) pair for the most recently accessed key
+    _accessor = (None, None)
 
     def __init__(self, default=None, attribute=None, error=None,
                  validate=None, required=False):
@@ -236,22 +687,54 @@ class Field(FieldABC):
         self.validate = validate
         self.required = required
         # Save creation index so that fields can be sorted by Schema
-        self._creation_index = Field._creation_index
-        Field._creation_index += 1
+        self._creation_index = next(Field._creation_counter)
         self.parent = FieldABC.parent
 
+    @property
+    def validate(self):
+        """The ``validate`` argument passed to the constructor. Setting it
+        rebuilds the validators that are run on every value.
+        """
+        return self.__dict__.get('_validate')
+
+    @validate.setter
+    def validate(self, validate):
+        self._validate = validate
+        self._validators = _get_validators(validate)
+
+    def __getstate__(self):
+        """Return the state to pickle. The reference to the parent schema and
+        the caches built from the other attributes are left out; the field is
+        bound again when it is added to a schema.
+        """
+        state = self.__dict__.copy()
+        state['parent'] = FieldABC.parent
+        for attr in ('_validators', '_accessor', '_method'):
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._validators = _get_validators(self.validate)
+
     def get_value(self, attr, obj):
         """Return the value for a given key from an object."""
         # NOTE: Use getattr instead of direct attribute access here so that
         # subclasses aren't required to define `attribute` member
         attribute = getattr(self, 'attribute', None)
         check_key = attr if attribute is None else attribute
-        return utils.get_value(check_key, obj)
+        key, accessor = self._accessor
+        if key != check_key:
+            if isinstance(check_key, int):  # e.g. the index of a List item
+                return utils.get_value(check_key, obj)
+            accessor = utils.get_accessor(check_key)
+            self._accessor = (check_key, accessor)
+        return accessor(obj)
 
     def _call_with_validation(self, method, exception_class, *args, **kwargs):
-        """Utility method to invoke ``method`` and validate the output. Call ``self.validate`` when
-        appropriate, and raise ``exception_class`` if a validation error
-        occurs.
+        """Utility method to invoke ``method`` and validate the output. Run the
+        field's validators on the output, and raise ``exception_class`` if a
+        validation error occurs. The error message is only built on failure.
 
         :param str method: Name of the method to call.
         :param Exception exception_class: Type of exception to raise when an error occurs.
@@ -259,27 +742,12 @@ class Field(FieldABC):
         :param kwargs: Keyword arguments to pass to the method.
         """
         try:
-            func = getattr(self, method)
-            output = func(*args, **kwargs)
-            # NOTE: Use getattr instead of direct attribute access here so that
-            # subclasses aren't required to define the `validate` attribute
-            validate = getattr(self, 'validate', None)
-            if validate:
-                if utils.is_iterable_but_not_string(validate):
-                    if not utils.is_generator(validate):
-                        validators = validate
-                    else:
-                        validators = [i for i in validate()]
-                elif callable(validate):
-                    validators = [validate]
-                else:
-                    raise ValueError("The 'validate' parameter must be a callable or a collection of callables.")
-                for validator in validators:
-                    msg = 'Validator {0}({1}) is not True'.format(
-                        validator.__name__, output
-                    )
-                    if not validator(output):
-                        raise exception_class(self.error or msg)
+            output = getattr(self, method)(*args, **kwargs)
+            if _isawaitable(output):
+                # Validate the awaited value rather than the awaitable
+                from marshmallow import aio
+                return aio.validated(self, output, exception_class)
+            self._run_validators(output, exception_class)
             return output
         # TypeErrors should be raised if fields are not declared as instances
         except TypeError:
@@ -293,6 +761,17 @@ class Field(FieldABC):
         except Exception as error:
             raise exception_class(getattr(self, 'error', None) or error)
 
+    def _run_validators(self, output, exception_class):
+        """Run the field's validators on ``output`` and raise
+        ``exception_class`` if one of them fails.
+        """
+        for validator in self._validators:
+            if not validator(output):
+                raise exception_class(
+                    getattr(self, 'error', None) or
+                    'Validator {0}({1}) is not True'.format(validator.__name__, output)
+                )
+
     def serialize(self, attr, obj):
         """Pulls the value for the given key from the object, applies the
         field's formatting and returns the result.
@@ -310,6 +789,24 @@ class Field(FieldABC):
         return self._call_with_validation('_serialize', MarshallingError,
                                           value, attr, obj)
 
+    def _get_batch_key(self, attr, obj):
+        """Return the key of ``obj`` passed to the field's ``batch`` function:
+        the value of the field's attribute.
+        """
+        return self.get_value(attr, obj)
+
+    def _serialize_batched(self, value, attr, obj):
+        """Serialize ``value``, resolved by the field's ``batch`` function
+        for ``obj``, like :meth:`serialize` does with the value it gets.
+        """
+        if value is None and self._CHECK_ATTRIBUTE:
+            if hasattr(self, 'required') and self.required:
+                raise MarshallingError('Missing data for required field.')
+            if hasattr(self, 'default') and self.default != null:
+                return self._format(self.default)
+        return self._call_with_validation('_serialize', MarshallingError,
+                                          value, attr, obj)
+
     def deserialize(self, value):
         """Deserialize ``value``.
 
@@ -384,26 +881,61 @@ class Nested(Field):
     :param bool allow_null: Whether to return None instead of a dictionary
         with null keys, if a nested dictionary has all-null keys
     :param bool many: Whether the field is a collection of objects.
+    :param callable batch: Optional function that resolves the objects to
+        nest for all the objects of a dump at once, e.g. with a single query.
+        It receives a list of the distinct, non-null values of the field's
+        attribute (typically foreign keys) and returns a mapping from each of
+        them to the object, or list of objects if ``many`` is ``True``, to
+        nest in its place, or a list of these objects in the order of the
+        values it received. Keys missing from the mapping are serialized as
+        ``None`` would be. Errors other than :exc:`ValueError` and
+        :exc:`MarshallingError <marshmallow.exceptions.MarshallingError>`
+        raised by the function are not caught. Example: ::
+
+            def get_authors(ids):
+                return dict((user.id, user) for user in User.select().where(User.id << ids))
+
+            author = fields.Nested(UserSchema, attribute='author_id', batch=get_authors)
+
     :param kwargs: The same keyword arguments that :class:`Field` receives.
+
+    .. versionchanged:: 1.0.0
+        Add the ``batch`` parameter.
     """
 
     def __init__(self, nested, default=null, exclude=tuple(), only=None, allow_null=False,
-                many=False, **kwargs):
+                many=False, batch=None, **kwargs):
         self.nested = nested
+        self.batch = _callable(batch) if batch else None
         self.allow_null = allow_null
         self.only = only
         self.exclude = exclude
         self.many = many
         self.__schema = None
         self.__updated_fields = False  # ensures serializer fields are updated only once
+        # (all_fields, filtered_fields) pair so that the nested schema's
+        # marshaller can reuse its compiled plan
+        self.__fields_to_marshal = (None, None)
         super(Nested, self).__init__(default=default, **kwargs)
 
+    def __getstate__(self):
+        state = super(Nested, self).__getstate__()
+        # The nested schema is created again, from ``nested``, when first used
+        state.update({
+            '_Nested__schema': None,
+            '_Nested__updated_fields': False,
+            '_Nested__fields_to_marshal': (None, None),
+        })
+        return state
+
     def __get_fields_to_marshal(self, all_fields):
         """Filter all_fields based on self.only and self.exclude """
         # Default 'only' to all the nested fields
         ret = OrderedDict()
         if all_fields is None:
             return ret
+        elif self.only is None and not self.exclude:
+            return all_fields
         elif isinstance(self.only, basestring):
             ret[self.only] = all_fields[self.only]
             return ret
@@ -454,19 +986,27 @@ class Nested(Field):
         if not self.__updated_fields:
             self.__updated_fields = True
             self.schema._update_fields(nested_obj)
-        fields = self.__get_fields_to_marshal(self.schema.fields)
+        all_fields, fields = self.__fields_to_marshal
+        if all_fields is not self.schema.fields:
+            all_fields = self.schema.fields
+            fields = self.__get_fields_to_marshal(all_fields)
+            self.__fields_to_marshal = (all_fields, fields)
+        errors = {}
         try:
             # We call the protected _marshal method instead of _dump
             # because we need to pass the this field's ``many`` attribute as
             # an argument, which dump would not allow
-            ret = self.schema._marshal(nested_obj, fields, many=self.many)
+            ret = self.schema._marshal(nested_obj, fields, many=self.many, errors=errors)
         except TypeError as err:
             raise TypeError('Could not marshal nested object due to error:\n"{0}"\n'
                             'If the nested object is a collection, you need to set '
                             '"many=True".'.format(err))
-        # Parent should get any errors stored after marshalling
-        if self.schema.errors:
-            self.parent.errors[attr] = self.schema.errors
+        # The object this field belongs to gets the errors of the nested objects
+        if errors:
+            active_errors = getattr(_active, 'errors', None)
+            if active_errors is None:  # The field is serialized on its own
+                active_errors = self.parent._marshal.errors
+            active_errors[attr] = errors
         if isinstance(self.only, basestring):  # self.only is a field name
             if self.many:
                 return utils.pluck(ret, key=self.only)
@@ -505,13 +1045,18 @@ class List(Field):
 
     def _format(self, value):
         if utils.is_indexable_but_not_string(value) and not isinstance(value, dict):
+            if _can_format_many(self.container):
+                ret = self.container._format_many(value)
+                if ret is not None:
+                    return ret
             # Convert all instances in typed list to container type
             return [self.container.serialize(idx, value) for idx
                     in range(len(value))]
         if value is None:
             return self.default
 
-        return [marshal(value, self.container.nested, strict=True)]
+        # A single item
+        return [self.container.serialize(0, [value])]
 
     # Deserialization is identical to _format behavior
     _deserialize = _format
@@ -575,10 +1120,31 @@ class Number(Field):
     def _format(self, value):
         return self._validated(value, MarshallingError)
 
+    def _format_many(self, values):
+        """Format all of ``values``, a sequence, in one call with NumPy.
+        Return ``None`` if they must be formatted one at a time. See
+        :func:`marshmallow.utils.format_numbers`.
+        """
+        return utils.format_numbers(values, self.num_type, as_string=self.as_string)
+
     def _deserialize(self, value):
         return self._validated(value, UnmarshallingError)
 
 
+def _can_format_many(field_obj):
+    """Return ``True`` if the values of ``field_obj`` may be formatted in bulk
+    with ``_format_many``: NumPy is installed, the field is a number field
+    with the default formatting, and there are no validators to run on each
+    value.
+    """
+    field_class = type(field_obj)
+    return (isinstance(field_obj, Number) and
+            field_class._format == Number._format and
+            field_class._validated == Number._validated and
+            not field_obj._validators and not field_obj.required and
+            utils.get_numpy() is not None)
+
+
 class Integer(Number):
     """An integer field.
 
@@ -937,9 +1503,25 @@ class Email(Field):
         return self._validated(value, UnmarshallingError)
 
 
+# inspect.getargspec is deprecated on Python 3
+_getargspec = getattr(inspect, 'getfullargspec', None) or inspect.getargspec
+# Values returned by Method and Function fields may be awaitable on Python 3.5+
+_isawaitable = getattr(inspect, 'isawaitable', lambda value: False)
+
+
 def _get_args(func):
     """Return a tuple of argument names for a function."""
-    return inspect.getargspec(func).args
+    return _getargspec(func).args
+
+
+def _get_num_args(func):
+    """Return the number of arguments ``func`` takes, or None if its
+    signature cannot be introspected (e.g. a callable object on Python 2).
+    """
+    try:
+        return len(_get_args(func))
+    except TypeError:
+        return None
 
 
 def _callable(obj):
@@ -963,6 +1545,9 @@ class Method(Field):
         value to deserialize.
     """
     _CHECK_ATTRIBUTE = False
+    # (<parent>, <bound method>, <number of arguments>), resolved when the
+    # field is first used with a parent
+    _method = (None, None, None)
 
     def __init__(self, method_name, deserialize=None, **kwargs):
         self.method_name = method_name
@@ -972,10 +1557,22 @@ class Method(Field):
             self.deserialize_method_name = None
         super(Method, self).__init__(**kwargs)
 
+    def _get_method(self):
+        """Return the bound serialization method of the parent schema and the
+        number of arguments it takes.
+        """
+        parent, method, num_args = self._method
+        if method is None or parent is not self.parent:
+            parent = self.parent
+            method = _callable(getattr(parent, self.method_name, None))
+            num_args = len(_get_args(method))
+            self._method = (parent, method, num_args)
+        return method, num_args
+
     def _serialize(self, value, attr, obj):
         try:
-            method = _callable(getattr(self.parent, self.method_name, None))
-            if len(_get_args(method)) > 2:
+            method, num_args = self._get_method()
+            if num_args > 2:
                 if self.parent.context is None:
                     msg = 'No context available for Method field {0!r}'.format(attr)
                     raise MarshallingError(msg)
@@ -1004,20 +1601,42 @@ class Function(Field):
         which is a dictionary of context variables passed to the serializer.
     :param callable deserialize: Deserialization function that takes the value
         to be deserialized as its only argument.
+    :param callable batch: Optional function that computes the values of the
+        field for all the objects of a dump at once, in place of ``func``. It
+        receives a list of the distinct objects, or of the distinct values of
+        their ``attribute`` if one is given, and returns a mapping from each of
+        them to the serialized value, or a list of the values in the same
+        order. Objects that cannot be hashed, e.g. dictionaries, are told
+        apart by identity and need the list form. Keys missing from the
+        mapping are serialized as ``None``. ``func`` may then be omitted.
+        Errors are handled as for :class:`Nested`.
+
+    .. versionchanged:: 1.0.0
+        Add the ``batch`` parameter.
     """
     _CHECK_ATTRIBUTE = False
 
-    def __init__(self, func, deserialize=None, **kwargs):
+    def __init__(self, func=None, deserialize=None, batch=None, **kwargs):
         super(Function, self).__init__(**kwargs)
-        self.func = _callable(func)
+        self.batch = _callable(batch) if batch else None
+        if func is None and self.batch:
+            # Only the batch function computes the values
+            self.func = None
+        else:
+            self.func = _callable(func)
         if deserialize:
             self.deserialize_func = _callable(deserialize)
         else:
             self.deserialize_func = None
+        self._num_args = (self.func, _get_num_args(self.func))
 
     def _serialize(self, value, attr, obj):
         try:
-            if len(_get_args(self.func)) > 1:
+            func, num_args = self._num_args
+            if func is not self.func or num_args is None:
+                num_args = len(_get_args(self.func))
+                self._num_args = (self.func, num_args)
+            if num_args > 1:
                 if self.parent.context is None:
                     msg = 'No context available for Function field {0!r}'.format(attr)
                     raise MarshallingError(msg)
@@ -1029,6 +1648,14 @@ class Function(Field):
         except AttributeError:  # the object is not expected to have the attribute
             pass
 
+    def _get_batch_key(self, attr, obj):
+        if getattr(self, 'attribute', None) is None:
+            return obj
+        return self.get_value(attr, obj)
+
+    def _serialize_batched(self, value, attr, obj):
+        return self._call_with_validation('_format', MarshallingError, value)
+
     def _deserialize(self, value):
         if self.deserialize_func:
             return self.deserialize_func(value)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Detection of what the JSON module used by a schema supports.
+
+A :class:`Schema <marshmallow.Schema>` encodes and decodes JSON with the
+module set as its ``json_module`` class Meta option, the stdlib :mod:`json`
+module by default. The module is wrapped in a :class:`JSONBackend`, which
+probes its ``dumps`` function once per module to find out which types it
+encodes natively to exactly the same JSON as marshmallow's own formatting.
+Fields of those types are then left to the encoder by :meth:`Schema.dumps <marshmallow.Schema.dumps>` and the other
+methods that produce JSON.
+
+Only ``datetime`` and ``UUID`` values are probed. Other capabilities of the
+module are not detected, since marshmallow does no work that they could
+replace:
+
+- ``Decimal`` values: :class:`Fixed <marshmallow.fields.Fixed>` and
+  :class:`Price <marshmallow.fields.Price>` fields serialize to JSON strings,
+  which no encoder's native ``Decimal`` output (a JSON number) matches, so
+  they are always formatted by marshmallow.
+- Key order: serialized objects are ``OrderedDict`` s, which every encoder
+  iterates in field order; marshmallow does not sort keys itself.
+  ``sort_keys`` and other keyword arguments of :meth:`Schema.dumps
+  <marshmallow.Schema.dumps>` are passed to ``dumps`` as they are, so they
+  must be supported by the module.
+- Bytes output: the output of ``dumps`` is encoded to UTF-8 if it is text,
+  which is checked on each call.
+"""
+from __future__ import absolute_import
+
+import datetime as dt
+import json
+import sys
+import uuid
+
+from marshmallow import fields, utils
+from marshmallow.compat import OrderedDict, binary_type, string_types, iteritems
+
+# Backends, keyed by module
+_backends = {}
+
+
+def import_json_module(names):
+    """Return the first module in ``names`` that can be imported, or the
+    stdlib :mod:`json` module if none can.
+
+    :param names: A module name or a sequence of module names.
+    """
+    if isinstance(names, string_types):
+        names = (names, )
+    for name in names:
+        try:
+            __import__(name)
+        except ImportError:
+            continue
+        return sys.modules[name]
+    return json
+
+
+def get_backend(module):
+    """Return the :class:`JSONBackend` for ``module``, creating it the first
+    time ``module`` is seen.
+
+    :param module: A JSON module (any object with ``dumps`` and ``loads``
+        functions), a module name or a sequence of module names to try in
+        order. See :func:`import_json_module`.
+    """
+    if isinstance(module, (list, tuple) + string_types):
+        module = import_json_module(module)
+    try:
+        return _backends[module]
+    except KeyError:
+        return _backends.setdefault(module, JSONBackend(module))
+    except TypeError:  # Unhashable
+        return JSONBackend(module)
+
+
+class _FixedOffset(dt.tzinfo):
+    def utcoffset(self, value):
+        return dt.timedelta(hours=-6)
+
+    def dst(self, value):
+        return dt.timedelta(0)
+
+
+# Values of each type that must encode to the same JSON as marshmallow's
+# formatting for the type to be left to the encoder
+_NATIVE_PROBES = {
+    dt.datetime: (
+        (dt.datetime(2014, 8, 17, 14, 52, 7), utils.isoformat),
+        (dt.datetime(2014, 8, 17, 14, 52, 7, 123456), utils.isoformat),
+        (dt.datetime(2014, 8, 17, 14, 52, 7, tzinfo=utils.UTC), utils.isoformat),
+        (dt.datetime(2014, 8, 17, 14, 52, 7, tzinfo=_FixedOffset()), utils.isoformat),
+    ),
+    uuid.UUID: (
+        (uuid.UUID('12345678-1234-5678-1234-567812345678'), str),
+    ),
+}
+
+
+class JSONBackend(object):
+    """Wraps a JSON module and records what its ``dumps`` function supports.
+
+    :param module: A JSON module (any object with ``dumps`` and ``loads``
+        functions).
+    """
+
+    def __init__(self, module):
+        self.module = module
+        self.dumps = module.dumps
+        self.loads = module.loads
+        #: Decoder of the items of JSON arrays read incrementally: an instance
+        #: of the module's ``JSONDecoder`` class if it has one with a
+        #: ``raw_decode`` method (e.g. simplejson), else of :class:`json.JSONDecoder`
+        decoder_class = getattr(module, 'JSONDecoder', None)
+        if decoder_class is None or not hasattr(decoder_class, 'raw_decode'):
+            decoder_class = json.JSONDecoder
+        self.decoder = decoder_class()
+        #: Set of the types that ``dumps`` encodes natively to the same JSON
+        #: as marshmallow's formatting
+        self.native_types = frozenset(
+            type_ for type_, probes in iteritems(_NATIVE_PROBES)
+            if all(self._dumps_text(value) == json.dumps(format_func(value))
+                   for value, format_func in probes)
+        )
+
+    def __repr__(self):
+        return '<JSONBackend({0})>'.format(getattr(self.module, '__name__', self.module))
+
+    def _dumps_text(self, value):
+        """Return the output of ``dumps`` as text, or ``None`` if it raises."""
+        try:
+            ret = self.dumps(value)
+        except Exception:
+            return None
+        if isinstance(ret, binary_type):
+            ret = ret.decode('utf-8')
+        return ret
+
+    def native_fields(self, fields_dict):
+        """Return ``fields_dict`` with the fields whose values the encoder
+        formats natively replaced by fields that leave those values as they
+        are. Return ``fields_dict`` itself if no field can be replaced.
+
+        Only :class:`DateTime <marshmallow.fields.DateTime>` fields with the
+        ISO8601 format and :class:`UUID <marshmallow.fields.UUID>` fields,
+        without validators and not required, can be replaced.
+        """
+        ret = OrderedDict()
+        replaced = False
+        for field_name, field_obj in iteritems(fields_dict):
+            native_type = self._get_native_type(field_obj)
+            if native_type is not None:
+                field_obj = _NativeField(field_obj, native_type)
+                replaced = True
+            ret[field_name] = field_obj
+        return ret if replaced else fields_dict
+
+    def _get_native_type(self, field_obj):
+        if field_obj.validate or field_obj.required:
+            return None
+        if type(field_obj) is fields.DateTime and field_obj.dateformat in (None, 'iso', 'iso8601'):
+            native_type = dt.datetime
+        elif type(field_obj) is fields.UUID:
+            native_type = uuid.UUID
+        else:
+            return None
+        return native_type if native_type in self.native_types else None
+
+
+class _NativeField(object):
+    """Stands in for ``field`` when serializing to JSON. Values of exactly
+    ``native_type`` are returned as they are, to be formatted by the encoder;
+    other values are serialized by ``field``.
+    """
+
+    def __init__(self, field, native_type):
+        self.field = field
+        self.native_type = native_type
+        self.attribute = field.attribute
+        self.validate = field.validate
+        self.required = field.required
+
+    def serialize(self, attr, obj):
+        value = self.field.get_value(attr, obj)
+        if type(value) is self.native_type:
+            return value
+        return self.field.serialize(attr, obj)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Parallel serialization of large collections with a process pool.
+
+A :class:`ParallelDumper` splits a collection into chunks and serializes
+them in the worker processes of a :mod:`concurrent.futures` executor. The
+schema is not pickled itself: each worker receives a description of it, its
+class and the arguments it was created with, and builds its own instance the
+first time it sees the description. The schema class and the objects must
+therefore be picklable, e.g. defined at the top level of a module.
+
+:mod:`concurrent.futures` is in the standard library since Python 3.2. On
+Python 2, install the `futures <https://pypi.python.org/pypi/futures>`_
+backport.
+"""
+from __future__ import absolute_import
+
+import multiprocessing
+from collections import deque
+from itertools import islice
+
+from marshmallow.compat import iteritems
+from marshmallow.schema import MarshalResult
+
+futures_available = False
+try:
+    from concurrent import futures
+    futures_available = True
+except ImportError:
+    futures_available = False
+
+# (description, schema) of the schema most recently built in this process
+_worker_schema = (None, None)
+
+
+def describe(schema):
+    """Return a picklable description of ``schema``: a tuple of its class
+    and a dictionary of the arguments to create an equivalent instance, with
+    ``many=True``.
+
+    :param Schema schema: The schema to describe.
+    """
+    kwargs = schema._get_init_kwargs()
+    kwargs['many'] = True
+    return (schema.__class__, kwargs)
+
+
+def _get_schema(description):
+    global _worker_schema
+    cached_description, schema = _worker_schema
+    if cached_description != description:
+        schema_class, kwargs = description
+        schema = schema_class(**kwargs)
+        _worker_schema = (description, schema)
+    return schema
+
+
+def _dump_chunk(description, chunk):
+    """Serialize ``chunk``, a list of objects, in a worker process."""
+    return tuple(_get_schema(description).dump(chunk))
+
+
+class ParallelDumper(object):
+    """Serializes large collections with ``schema`` in parallel. ::
+
+        with ParallelDumper(UserSchema(), workers=4) as dumper:
+            result, errors = dumper.dump(users)
+
+    :param Schema schema: The schema to serialize with. Its ``many`` option
+        is ignored; the input is always a collection.
+    :param int workers: Number of worker processes. Defaults to the number
+        of processors.
+    :param int chunk_size: Number of objects serialized per task.
+    :param executor: Optional :class:`concurrent.futures.Executor` to submit
+        the chunks to, instead of a process pool owned by the dumper. It is
+        not shut down by the dumper.
+
+    Each chunk is serialized with :meth:`Schema.dump`, including its
+    post-processing (``extra``, the error handler and data handlers), in the
+    worker that serializes it. Changes made to ``schema`` after it was
+    created, such as fields added to :attr:`Schema.fields`, are not seen by
+    the workers.
+
+    .. versionadded:: 1.0.0
+    """
+
+    def __init__(self, schema, workers=None, chunk_size=1000, executor=None):
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer.')
+        if executor is None and not futures_available:
+            raise RuntimeError('ParallelDumper requires concurrent.futures. On '
+                               'Python 2, install the "futures" package.')
+        self.schema = schema
+        self.chunk_size = chunk_size
+        self.description = describe(schema)
+        workers = workers or multiprocessing.cpu_count()
+        self._owns_executor = executor is None
+        self.executor = executor or futures.ProcessPoolExecutor(max_workers=workers)
+        # Maximum number of chunks submitted and not yet merged
+        self.max_pending = 2 * workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the process pool, unless it was passed in."""
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def iter_chunks(self, objs):
+        """Serialize the objects of the iterable ``objs`` in parallel, yielding
+        the result of each chunk in order, as soon as it and the chunks before
+        it are done. Only a bounded number of chunks is in flight at a time,
+        so ``objs`` may be a generator over a very large collection.
+
+        :param objs: An iterable of objects to serialize.
+        :return: An iterator of `MarshalResult` tuples of the form
+            (``data``, ``errors``), one per chunk, where ``errors`` are keyed
+            by the index of each object in ``objs``.
+        """
+        iterator = iter(objs)
+        pending = deque()
+        start = 0
+        while True:
+            while len(pending) < self.max_pending:
+                chunk = list(islice(iterator, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append((start, self.executor.submit(
+                    _dump_chunk, self.description, chunk)))
+                start += len(chunk)
+            if not pending:
+                break
+            chunk_start, future = pending.popleft()
+            data, chunk_errors = future.result()
+            errors = dict((chunk_start + idx, row_errors)
+                          for idx, row_errors in iteritems(chunk_errors))
+            yield MarshalResult(data, errors)
+
+    def dump(self, objs):
+        """Serialize the objects of the iterable ``objs`` in parallel and
+        merge the results in order.
+
+        :param objs: An iterable of objects to serialize.
+        :return: A tuple of the form (``data``, ``errors``), as returned by
+            :meth:`Schema.dump` with ``many=True``.
+        :rtype: `MarshalResult`, a `collections.namedtuple`
+        """
+        data, errors = [], {}
+        for chunk_data, chunk_errors in self.iter_chunks(objs):
+            data.extend(chunk_data)
+            errors.update(chunk_errors)
+        return MarshalResult(data, errors)
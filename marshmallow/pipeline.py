@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""Lazy processing pipelines built on :meth:`Schema.load
+<marshmallow.Schema.load>` and :meth:`Schema.dump <marshmallow.Schema.dump>`.
+
+A :class:`Pipeline` chains stages over an iterable source. Items are pulled
+through the stages one at a time, so each stage holds at most one item (or
+one batch, for :meth:`Pipeline.batch`) and memory use does not grow with the
+size of the source. A stage only runs when the stage after it asks for an
+item, so a slow consumer holds back the whole chain. ::
+
+    from marshmallow.pipeline import Pipeline
+
+    stats = (Pipeline(csv.DictReader(fp))
+             .load(UserSchema(), on_error=log_errors)
+             .filter(lambda user: user.active)
+             .dump(ExportSchema())
+             .batch(500)
+             .sink(bulk_insert))
+    for stage in stats:
+        print(stage)
+
+Every stage counts the items it receives and produces and the time spent in
+it, from which its throughput is derived. See :class:`StageStats`.
+"""
+from __future__ import absolute_import
+
+from timeit import default_timer
+
+
+class StageStats(object):
+    """Counters of a pipeline stage.
+
+    :param str name: Name of the stage.
+    """
+
+    def __init__(self, name):
+        #: Name of the stage
+        self.name = name
+        #: Number of items received from the previous stage, or read from
+        #: the source
+        self.items_in = 0
+        #: Number of items passed on to the next stage
+        self.items_out = 0
+        #: Number of items that failed to load or dump
+        self.errors = 0
+        #: Seconds spent in the stage, excluding the stages before and after it
+        self.seconds = 0.0
+
+    @property
+    def throughput(self):
+        """Number of items processed per second, or ``None`` if no time was
+        spent in the stage.
+        """
+        if not self.seconds:
+            return None
+        return self.items_in / self.seconds
+
+    def __repr__(self):
+        return ('<StageStats {0!r}: {1} in, {2} out, {3} errors, '
+                '{4:.6f}s>'.format(self.name, self.items_in, self.items_out,
+                                   self.errors, self.seconds))
+
+
+class _Stage(object):
+    """A step of a pipeline. :meth:`process` is called for each item and
+    returns the items to pass on; :meth:`flush` returns the items left when
+    the input is exhausted.
+    """
+
+    def __init__(self, name):
+        self.stats = StageStats(name)
+
+    def process(self, item):
+        raise NotImplementedError
+
+    def flush(self):
+        return ()
+
+    def run(self, items):
+        stats = self.stats
+        process = self.process
+        for item in items:
+            stats.items_in += 1
+            start = default_timer()
+            outputs = process(item)
+            stats.seconds += default_timer() - start
+            for output in outputs:
+                stats.items_out += 1
+                yield output
+        start = default_timer()
+        outputs = self.flush()
+        stats.seconds += default_timer() - start
+        for output in outputs:
+            stats.items_out += 1
+            yield output
+
+
+class _SchemaStage(_Stage):
+    """Loads or dumps each item with ``method``, a bound method of a schema."""
+
+    def __init__(self, name, method, many, on_error):
+        super(_SchemaStage, self).__init__(name)
+        self.method = method
+        self.many = many
+        self.on_error = on_error
+
+    def process(self, item):
+        data, errors = self.method(item)
+        if errors:
+            self.stats.errors += len(errors) if self.many else 1
+            if self.on_error is not None:
+                self.on_error(item, errors)
+            if not self.many:
+                return ()
+        return (data, )
+
+
+class _FilterStage(_Stage):
+
+    def __init__(self, name, predicate):
+        super(_FilterStage, self).__init__(name)
+        self.predicate = predicate
+
+    def process(self, item):
+        return (item, ) if self.predicate(item) else ()
+
+
+class _TransformStage(_Stage):
+
+    def __init__(self, name, func):
+        super(_TransformStage, self).__init__(name)
+        self.func = func
+
+    def process(self, item):
+        return (self.func(item), )
+
+
+class _BatchStage(_Stage):
+
+    def __init__(self, name, size):
+        super(_BatchStage, self).__init__(name)
+        self.size = size
+        self.batch = []
+
+    def process(self, item):
+        self.batch.append(item)
+        if len(self.batch) < self.size:
+            return ()
+        batch, self.batch = self.batch, []
+        return (batch, )
+
+    def flush(self):
+        batch, self.batch = self.batch, []
+        return (batch, ) if batch else ()
+
+
+class _SinkStage(_Stage):
+
+    def __init__(self, name, func):
+        super(_SinkStage, self).__init__(name)
+        self.func = func
+
+    def process(self, item):
+        self.func(item)
+        return ()
+
+
+class Pipeline(object):
+    """A chain of lazy processing stages over ``source``. Each method but
+    :meth:`sink` adds a stage and returns the pipeline, so that calls can be
+    chained. Iterating over the pipeline runs it and yields the output of the
+    last stage.
+
+    :param source: An iterable of items, e.g. a generator or a file.
+    :param str name: Name of the source stage in :attr:`stats`.
+
+    .. versionadded:: 1.0.0
+    """
+
+    def __init__(self, source, name='source'):
+        self.source = source
+        self._source_stats = StageStats(name)
+        self._stages = []
+
+    @property
+    def stats(self):
+        """List of the :class:`StageStats` of the source and of each stage,
+        in order.
+        """
+        return [self._source_stats] + [stage.stats for stage in self._stages]
+
+    def _add(self, stage):
+        self._stages.append(stage)
+        return self
+
+    def load(self, schema, on_error=None, name='load'):
+        """Deserialize each item with :meth:`schema.load <marshmallow.Schema.load>`
+        and pass on the data.
+
+        :param Schema schema: The schema to load with. If its ``many`` option
+            is set, each item must be a collection, e.g. the output of a
+            :meth:`batch` stage.
+        :param callable on_error: Optional function called with the item and
+            the errors when an item fails to load. Items that fail to load are
+            dropped, unless ``many`` is set, in which case the data of the
+            whole collection are passed on, as :meth:`Schema.load` returns
+            them.
+        :param str name: Name of the stage in :attr:`stats`.
+        """
+        return self._add(_SchemaStage(name, schema.load, schema.many, on_error))
+
+    def dump(self, schema, on_error=None, name='dump'):
+        """Serialize each item with :meth:`schema.dump <marshmallow.Schema.dump>`
+        and pass on the data. Errors are handled as in :meth:`load`.
+
+        :param Schema schema: The schema to dump with.
+        :param callable on_error: Optional function called with the item and
+            the errors when an item fails to serialize.
+        :param str name: Name of the stage in :attr:`stats`.
+        """
+        return self._add(_SchemaStage(name, schema.dump, schema.many, on_error))
+
+    def filter(self, predicate, name='filter'):
+        """Pass on only the items for which ``predicate`` returns a true value.
+
+        :param callable predicate: Function that takes an item.
+        :param str name: Name of the stage in :attr:`stats`.
+        """
+        return self._add(_FilterStage(name, predicate))
+
+    def transform(self, func, name='transform'):
+        """Pass on the value returned by ``func`` for each item.
+
+        :param callable func: Function that takes an item.
+        :param str name: Name of the stage in :attr:`stats`.
+        """
+        return self._add(_TransformStage(name, func))
+
+    def batch(self, size, name='batch'):
+        """Group items into lists of ``size`` items. The last list may be
+        shorter.
+
+        :param int size: Number of items per list.
+        :param str name: Name of the stage in :attr:`stats`.
+        """
+        if size < 1:
+            raise ValueError('size must be a positive integer.')
+        return self._add(_BatchStage(name, size))
+
+    def sink(self, func, name='sink'):
+        """Run the pipeline, calling ``func`` with each output item.
+
+        :param callable func: Function that takes an item, e.g. one that
+            writes it to a file or a database.
+        :param str name: Name of the stage in :attr:`stats`.
+        :return: The :attr:`stats` of the pipeline.
+        """
+        self._add(_SinkStage(name, func))
+        for _ in self:
+            pass
+        return self.stats
+
+    def _iter_source(self):
+        stats = self._source_stats
+        iterator = iter(self.source)
+        while True:
+            start = default_timer()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                stats.seconds += default_timer() - start
+                return
+            stats.seconds += default_timer() - start
+            stats.items_in += 1
+            stats.items_out += 1
+            yield item
+
+    def __iter__(self):
+        items = self._iter_source()
+        for stage in self._stages:
+            items = stage.run(items)
+        return iter(items)
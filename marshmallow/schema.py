@@ -2,17 +2,21 @@
 """The :class:`Schema` class, including its metaclass and options (class Meta)."""
 from __future__ import absolute_import
 
+from array import array
 from collections import namedtuple
+import csv
 import datetime as dt
 import json
 import copy
+import sys
 import uuid
 import types
 import warnings
+from itertools import islice, chain
 
-from marshmallow import base, fields, utils, class_registry
-from marshmallow.compat import (with_metaclass, iteritems, text_type,
-                                binary_type, OrderedDict)
+from marshmallow import base, fields, utils, class_registry, codegen, json_backend, binary
+from marshmallow.compat import (with_metaclass, iteritems, itervalues, text_type,
+                                binary_type, OrderedDict, PY2)
 from marshmallow.orderedset import OrderedSet
 
 #: Return type of :meth:`Schema.dump`
@@ -69,6 +73,13 @@ class SchemaMeta(type):
         klass = super(SchemaMeta, mcs).__new__(mcs, name, bases, attrs)
         fields = get_fields_by_mro(klass, base.FieldABC) + fields
         klass._declared_fields = OrderedDict(fields)
+        # Unbound field sets, keyed by (only, exclude, dateformat)
+        klass._field_sets = {}
+        # Factories of generated dump and load functions, keyed by field set
+        # and by the keys of the plan; see BaseSchema._generate
+        klass._codegen_factories = {}
+        # Items of _declared_fields when the field sets were cached
+        klass._field_sets_declared = tuple(iteritems(klass._declared_fields))
         class_registry.register(name, klass)
         return klass
 
@@ -91,7 +102,9 @@ class SchemaOpts(object):
             raise ValueError("`exclude` must be a list or tuple.")
         self.strict = getattr(meta, 'strict', False)
         self.dateformat = getattr(meta, 'dateformat', None)
-        self.json_module = getattr(meta, 'json_module', json)
+        self.json_backend = json_backend.get_backend(getattr(meta, 'json_module', json))
+        self.json_module = self.json_backend.module
+        self.codegen = getattr(meta, 'codegen', False)
 
 
 class BaseSchema(base.SchemaABC):
@@ -186,8 +199,17 @@ class BaseSchema(base.SchemaABC):
             date format explicitly specified.
         - ``strict``: If ``True``, raise errors during marshalling rather than
             storing them.
-        - ``json_module``: JSON module to use. Defaults to the ``json`` module
-            in the stdlib.
+        - ``json_module``: JSON module to use, or the name of a module, or a
+            sequence of names of modules to try in order. Defaults to the
+            ``json`` module in the stdlib, which is also used if none of the
+            named modules can be imported. Values of types that the module
+            encodes natively to the same JSON as marshmallow (e.g. ``UUID``)
+            are left to the module by ``dumps``, unless data handlers are
+            registered. See :mod:`marshmallow.json_backend`.
+        - ``codegen``: If ``True``, generate and compile dump and load
+            functions specialized for the schema's fields instead of going
+            through the generic field loops. Loaded data are ordered by field
+            rather than by input key.
         """
         pass
 
@@ -198,8 +220,12 @@ class BaseSchema(base.SchemaABC):
             warnings.warn('Implicit collection handling is deprecated. Set '
                             'many=True to serialize a collection.',
                             category=DeprecationWarning)
-        # copy declared fields from metaclass
-        self.declared_fields = copy.deepcopy(self._declared_fields)
+        # Copies of the declared fields, made on first access
+        self.__declared_fields = None
+        # Key of the cached field set that self.fields is bound from
+        self.__field_set_key = None
+        # (cached field set, {field_name: bound field}) of self.fields
+        self.__bound_field_set = (None, None)
         #: Dictionary mapping field_names -> :class:`Field` objects
         self.fields = OrderedDict()
         self._data = None  # the cached, serialized data
@@ -211,11 +237,15 @@ class BaseSchema(base.SchemaABC):
         self.prefix = prefix
         self.strict = strict or self.opts.strict
         #: Callable marshalling object
-        self._marshal = fields.Marshaller(
-            prefix=self.prefix
-        )
+        self._marshal = self.__make_marshaller()
+        # (fields, json_fields, marshaller) used when encoding to JSON
+        self.__json_marshal = (None, None, None)
+        # (fields, plan) used by dumpb and loadb
+        self.__binary_plan = (None, None)
         #: Callable unmarshalling object
-        self._unmarshal = fields.Unmarshaller()
+        self._unmarshal = fields.Unmarshaller(
+            codegen=self.__generate_loader if self.opts.codegen else None
+        )
         self.extra = extra
         self.context = context or {}
 
@@ -231,20 +261,125 @@ class BaseSchema(base.SchemaABC):
                           category=DeprecationWarning)
             self._update_data()
 
+    def __reduce__(self):
+        """Pickle the schema as its class and the arguments it was created
+        with, rather than as its fields, marshallers and caches. Unpickling
+        creates a new instance, which binds its own copies of the declared
+        fields. The schema class and its context must therefore be picklable,
+        e.g. the class must be defined at the top level of a module; fields
+        declared on the class are not pickled and may use lambdas. Changes
+        made to the instance after it was created, such as fields added to
+        :attr:`fields`, are not carried over.
+
+        :func:`copy.deepcopy` goes through this method too, and so creates a
+        new instance with deep copies of the arguments. :func:`copy.copy`
+        does not; see :meth:`__copy__`.
+
+        .. versionadded:: 1.0.0
+        """
+        return (_rebuild_schema, (self.__class__, self._get_init_kwargs()))
+
+    def __copy__(self):
+        """Return a shallow copy of the schema: a new instance that shares
+        the attributes of this one, including its fields and context, rather
+        than one created from its arguments like :meth:`__reduce__` does.
+        """
+        ret = self.__class__.__new__(self.__class__)
+        ret.__dict__.update(self.__dict__)
+        return ret
+
+    def _get_init_kwargs(self):
+        """Return a dictionary of the arguments to create an instance
+        equivalent to this schema, without the deprecated ``obj`` argument.
+        """
+        return {
+            'extra': self.extra,
+            'only': tuple(self.only),
+            'exclude': tuple(self.exclude),
+            'prefix': self.prefix,
+            'strict': self.strict,
+            'many': self.many,
+            'context': self.context,
+        }
+
+    def __make_marshaller(self):
+        return fields.Marshaller(
+            prefix=self.prefix,
+            codegen=self.__generate_dumper if self.opts.codegen else None
+        )
+
+    def __generate_dumper(self, plan):
+        return self._generate(codegen.generate_dump_factory, plan,
+                              tuple(key for key, _, _ in plan),
+                              tuple((attr_name, field_obj) for _, attr_name, field_obj in plan))
+
+    def __generate_loader(self, plan):
+        return self._generate(codegen.generate_load_factory, plan, tuple(plan),
+                              tuple((attr_name, field_obj)
+                                    for attr_name, (_, field_obj) in iteritems(plan)))
+
+    def _generate(self, generate_factory, plan, keys, named_fields):
+        """Return the function generated for ``plan`` by the factory that
+        ``generate_factory`` returns, bound to the field objects of the plan.
+
+        If every field of the plan is bound from the cached field set of
+        :attr:`fields` (see :meth:`_update_fields`) and still has the options
+        of the cached field (see :func:`marshmallow.codegen.get_options`), the
+        factory is cached on the schema class, keyed by the field set and
+        ``keys``, the keys of the plan, so that the code is generated once per
+        class rather than once per instance. Fields whose options were changed
+        on the instance get code of their own.
+
+        :param tuple named_fields: ``(name, field_obj)`` pairs of the plan.
+        """
+        key = self.__field_set_key
+        field_set, bound = self.__bound_field_set
+        cache_key = None
+        if (bound is not None and
+                # The field set has not been replaced since it was bound
+                self._field_sets.get(key) is field_set and
+                all(bound.get(name) is field_obj and
+                    codegen.get_options(field_obj) == codegen.get_options(field_set[name])
+                    for name, field_obj in named_fields)):
+            cache_key = (generate_factory, key, keys)
+        factory = self._codegen_factories.get(cache_key) if cache_key else None
+        if factory is None:
+            factory = generate_factory(plan)
+            if cache_key:
+                self._codegen_factories[cache_key] = factory
+        return codegen.bind(factory, tuple(field_obj for _, field_obj in named_fields))
+
+    def _get_json_marshal(self):
+        """Return the marshaller and fields to serialize with when the result
+        is encoded to JSON. Fields whose values the JSON module formats natively
+        are left to the module, unless data handlers are registered, since they
+        may expect formatted values.
+        """
+        fields_dict, json_fields, marshal = self.__json_marshal
+        if fields_dict is not self.fields:
+            json_fields = self.fields
+            if not self.__data_handlers__:
+                json_fields = self.opts.json_backend.native_fields(self.fields)
+            marshal = self._marshal if json_fields is self.fields else self.__make_marshaller()
+            self.__json_marshal = (self.fields, json_fields, marshal)
+        return marshal, json_fields
+
     def __repr__(self):
         return '<{ClassName}(many={self.many}, strict={self.strict})>'.format(
             ClassName=self.__class__.__name__, self=self
         )
 
-    def _postprocess(self, data, obj):
+    def _postprocess(self, data, obj, errors, many=None):
+        if many is None:
+            many = self.many
         if self.extra:
-            if self.many:
+            if many:
                 for each in data:
                     each.update(self.extra)
             else:
                 data.update(self.extra)
-        if self._marshal.errors and callable(self.__error_handler__):
-            self.__error_handler__(self._marshal.errors, obj)
+        if errors and callable(self.__error_handler__):
+            self.__error_handler__(errors, obj)
 
         # invoke registered callbacks
         # NOTE: these callbacks will mutate the data
@@ -255,8 +390,10 @@ class BaseSchema(base.SchemaABC):
         return data
 
     def _update_data(self):
-        result = self._marshal(self.obj, self.fields, many=self.many, strict=self.strict)
-        self._data = self._postprocess(result, obj=self.obj)
+        errors = {}
+        result = self._marshal(self.obj, self.fields, many=self.many, strict=self.strict,
+                               errors=errors)
+        self._data = self._postprocess(result, obj=self.obj, errors=errors)
 
     @classmethod
     def error_handler(cls, func):
@@ -312,40 +449,120 @@ class BaseSchema(base.SchemaABC):
         cls.__data_handlers__.append(func)
         return func
 
+    @property
+    def declared_fields(self):
+        """Dictionary mapping field names -> this instance's copies of the
+        fields declared on the schema class. Fields that are bound to the
+        instance are shared with :attr:`fields`.
+        """
+        if self.__declared_fields is None:
+            declared_fields = copy.deepcopy(self._declared_fields)
+            for field_name, field_obj in iteritems(self.fields):
+                if field_name in declared_fields:
+                    declared_fields[field_name] = field_obj
+            self.__declared_fields = declared_fields
+        return self.__declared_fields
+
+    @declared_fields.setter
+    def declared_fields(self, value):
+        self.__declared_fields = value
+
     def _update_fields(self, obj):
-        """Update fields based on the passed in object."""
-        # if only __init__ param is specified, only return those fields
-        if self.only:
-            ret = self.__filter_fields(self.only, obj)
+        """Update fields based on the passed in object.
+
+        If every selected field is declared on the schema, the selection does
+        not depend on ``obj``. In that case the filtered fields are cached on
+        the schema class, keyed by ``only``, ``exclude`` and the ``dateformat``
+        option, and are bound to this instance with shallow copies. The cache
+        is cleared when fields are added to, removed from or replaced in
+        ``_declared_fields``; a declared field modified in place is not
+        noticed.
+
+        Once :attr:`declared_fields` has been read or assigned, the fields are
+        selected from this instance's ``declared_fields`` instead, without the
+        cache, since they may have been changed.
+        """
+        if self.__declared_fields is not None:
+            ret = self.__filter_fields(self.__get_field_names(), obj)
             self.__set_field_attrs(ret)
+            self.__field_set_key = None
+            self.__bound_field_set = (None, None)
             self.fields = ret
+            self._marshal.compile(self.fields)
+            return self.fields
+        key = (tuple(self.only), tuple(self.exclude), self.opts.dateformat)
+        if key == self.__field_set_key:
             return self.fields
+        declared = tuple(iteritems(self._declared_fields))
+        if declared != self._field_sets_declared:
+            cls = self.__class__
+            cls._field_sets = {}
+            cls._codegen_factories = {}
+            cls._field_sets_declared = declared
+        field_set = self._field_sets.get(key)
+        if field_set is None:
+            field_names = self.__get_field_names()
+            if all(field_name in self._declared_fields for field_name in field_names):
+                field_set = OrderedDict(
+                    (field_name, copy.copy(self._declared_fields[field_name]))
+                    for field_name in field_names
+                )
+                self.__set_field_attrs(field_set, bind=False)
+            else:
+                # Fields must be inferred from obj
+                field_set = False
+            self._field_sets[key] = field_set
+        if field_set is False:
+            ret = self.__filter_fields(self.__get_field_names(), obj)
+            self.__set_field_attrs(ret)
+            self.__bound_field_set = (None, None)
+        else:
+            # Names and dateformats are already set on the cached fields
+            ret = OrderedDict()
+            for field_name, field_obj in iteritems(field_set):
+                field_obj = copy.copy(field_obj)
+                if not field_obj.parent:
+                    field_obj.parent = self
+                ret[field_name] = field_obj
+            self.__field_set_key = key
+            self.__bound_field_set = (field_set, dict(ret))
+        self.fields = ret
+        # Build the serialization plan once for the resolved field set
+        self._marshal.compile(self.fields)
+        return self.fields
+
+    def __get_field_names(self):
+        """Return the names of the fields to serialize, in order."""
+        # if only __init__ param is specified, only return those fields
+        if self.only:
+            return self.only
 
+        declared_fields = self.__declared_fields
+        if declared_fields is None:
+            declared_fields = self._declared_fields
         if self.opts.fields:
             # Return only fields specified in fields option
             field_names = OrderedSet(self.opts.fields)
         elif self.opts.additional:
             # Return declared fields + additional fields
-            field_names = OrderedSet(self.declared_fields.keys()) | OrderedSet(self.opts.additional)
+            field_names = OrderedSet(declared_fields.keys()) | OrderedSet(self.opts.additional)
         else:
-            field_names = OrderedSet(self.declared_fields.keys())
+            field_names = OrderedSet(declared_fields.keys())
 
         # If "exclude" option or param is specified, remove those fields
         excludes = set(self.opts.exclude) | set(self.exclude)
         if excludes:
             field_names = field_names - excludes
-        ret = self.__filter_fields(field_names, obj)
-        # Set parents
-        self.__set_field_attrs(ret)
-        self.fields = ret
-        return self.fields
+        return field_names
 
-    def __set_field_attrs(self, fields_dict):
+    def __set_field_attrs(self, fields_dict, bind=True):
         """Set the parents of all field objects in fields_dict to self, and
         set the dateformat specified in ``class Meta``, if necessary.
+
+        :param bool bind: If ``False``, do not set the parents.
         """
         for field_name, field_obj in iteritems(fields_dict):
-            if not field_obj.parent:
+            if bind and not field_obj.parent:
                 field_obj.parent = self
             if not field_obj.name:
                 field_obj.name = field_name
@@ -404,9 +621,13 @@ class BaseSchema(base.SchemaABC):
         """
         if obj != self.obj:
             self._update_fields(obj)
-        preresult = self._marshal(obj, self.fields, many=self.many, strict=self.strict)
-        result = self._postprocess(preresult, obj=obj)
-        errors = self._marshal.errors
+        return self._dump(obj, self._marshal, self.fields)
+
+    def _dump(self, obj, marshal, fields_dict):
+        errors = {}
+        preresult = marshal(obj, fields_dict, many=self.many, strict=self.strict,
+                            errors=errors)
+        result = self._postprocess(preresult, obj=obj, errors=errors)
         return MarshalResult(result, errors)
 
     def load(self, data):
@@ -419,11 +640,14 @@ class BaseSchema(base.SchemaABC):
 
         .. versionadded:: 1.0.0
         """
-        result = self._unmarshal(data, self.fields, self.many, strict=self.strict,
-                                postprocess=self.make_object)
-        errors = self._unmarshal.errors
-        if self._unmarshal.errors and callable(self.__error_handler__):
-            self.__error_handler__(self._unmarshal.errors, data)
+        return self._load(data, many=self.many)
+
+    def _load(self, data, many):
+        errors = {}
+        result = self._unmarshal(data, self.fields, many, strict=self.strict,
+                                postprocess=self.make_object, errors=errors)
+        if errors and callable(self.__error_handler__):
+            self.__error_handler__(errors, data)
         return UnmarshalResult(data=result, errors=errors)
 
     def loads(self, json_data):
@@ -437,6 +661,36 @@ class BaseSchema(base.SchemaABC):
         """
         return self.load(self.opts.json_module.loads(json_data))
 
+    def load_iter(self, fp, array=False, chunk_size=65536):
+        """Incrementally deserialize the records in ``fp``, a file-like object,
+        yielding the result of each record as soon as it is read. Only one
+        record is held in memory at a time.
+
+        By default, ``fp`` contains newline-delimited JSON, one record per
+        line. If ``array`` is ``True``, ``fp`` contains a single JSON array of
+        records, which is parsed incrementally with the ``JSONDecoder`` of the
+        ``json_module`` class Meta option, or of the stdlib :mod:`json` module
+        if it has none. Each record is deserialized individually, whether or
+        not this Schema has ``many=True``.
+
+        :param fp: A file-like object opened in text or binary mode.
+        :param bool array: If ``True``, read a top-level JSON array instead of
+            newline-delimited JSON.
+        :param int chunk_size: Number of characters or bytes to read at a time
+            when ``array`` is ``True``.
+        :return: An iterator of `UnmarshalResult` tuples, one per record.
+        :raise ValueError: If ``fp`` does not contain valid JSON.
+
+        .. versionadded:: 1.0.0
+        """
+        if array:
+            records = utils.iter_json_array(fp, chunk_size=chunk_size,
+                                            decoder=self.opts.json_backend.decoder)
+        else:
+            records = utils.iter_json_lines(fp, loads=self.opts.json_module.loads)
+        for record in records:
+            yield self._load(record, many=False)
+
     def dumps(self, obj, *args, **kwargs):
         """Same as :meth:`dump`, except return a JSON-encoded string.
 
@@ -446,7 +700,9 @@ class BaseSchema(base.SchemaABC):
 
         .. versionadded:: 1.0.0
         """
-        deserialized, errors = self.dump(obj)
+        if obj != self.obj:
+            self._update_fields(obj)
+        deserialized, errors = self._dump(obj, *self._get_json_marshal())
         ret = self.opts.json_module.dumps(deserialized, *args, **kwargs)
         # # On Python 2, json.dumps returns bytestrings
         # # On Python 3, json.dumps returns unicode
@@ -455,6 +711,343 @@ class BaseSchema(base.SchemaABC):
             ret = bytes(ret.encode('utf-8'))
         return MarshalResult(ret, errors)
 
+    def dumps_iter(self, obj, batch_size=100, *args, **kwargs):
+        """Lazily serialize the objects in the iterable ``obj`` to a JSON
+        array, yielding the encoded array in chunks. Objects are pulled from
+        ``obj`` and serialized ``batch_size`` at a time, so the collection is
+        never held in memory as a whole. ``obj`` is always treated as a
+        collection, whether or not this Schema has ``many=True``.
+
+        Each chunk is yielded as a tuple of the form (``data``, ``errors``),
+        where ``data`` is a bytestring and ``errors`` are the errors of the
+        objects in the chunk, keyed by the index of each object in ``obj``.
+        The first chunk contains the opening bracket and the last chunk is the
+        closing bracket. Joining the ``data`` of all the chunks gives the same
+        result as :meth:`dumps` with ``many=True``.
+
+        Post-processing (``extra``, the error handler and registered data
+        handlers) is applied to each batch.
+
+        :param obj: An iterable of objects to serialize, e.g. a generator or a
+            database cursor.
+        :param int batch_size: Number of objects to serialize per chunk.
+        :return: An iterator of `MarshalResult` tuples.
+
+        .. versionadded:: 1.0.0
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be a positive integer.')
+        json_module = self.opts.json_module
+        item_separator, closing = _get_array_layout(json_module.dumps, args, kwargs)
+        iterator = iter(obj)
+        start = 0
+        opening = b'['
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            if start == 0:
+                # Resolve the fields from the first object
+                self._update_fields(batch if self.many else batch[0])
+                marshal, fields_dict = self._get_json_marshal()
+            batch_errors = {}
+            data = marshal(batch, fields_dict, many=True, strict=self.strict,
+                           errors=batch_errors)
+            errors = dict((start + idx, row_errors)
+                          for idx, row_errors in iteritems(batch_errors))
+            data = self._postprocess(data, obj=batch, errors=errors, many=True)
+            encoded = json_module.dumps(data, *args, **kwargs)
+            if isinstance(encoded, text_type):
+                encoded = encoded.encode('utf-8')
+            # Strip the brackets of the encoded batch, and the line break
+            # before the closing bracket if indented
+            yield MarshalResult(opening + encoded[1:-len(closing)], errors)
+            opening = item_separator
+            start += len(batch)
+        yield MarshalResult(b'[]' if start == 0 else closing, {})
+
+    def dump_to(self, obj, fp, batch_size=100, *args, **kwargs):
+        """Serialize ``obj`` to JSON and write the UTF-8 encoded bytes to
+        ``fp``, without building the encoded document as a whole.
+
+        If this Schema has ``many=True``, the objects are serialized and
+        written ``batch_size`` at a time, as with :meth:`dumps_iter`, and
+        errors are keyed by the index of each object. Otherwise the single
+        object is serialized and the items of its dictionary are encoded and
+        written ``batch_size`` at a time, unless ``sort_keys`` is passed.
+        Either way, the JSON module's ``dumps`` function does the encoding.
+
+        :param obj: The object or collection of objects to serialize.
+        :param fp: A binary file-like object (anything with a ``write``
+            method that accepts bytes), a `bytearray` to append to, or a
+            writable `memoryview` to fill from the start.
+        :param int batch_size: Number of objects to serialize per write if
+            ``many=True``, or else of items of the serialized dictionary to
+            encode per write.
+        :return: A tuple of the form (``nbytes``, ``errors``), where
+            ``nbytes`` is the number of bytes written.
+        :rtype: `MarshalResult`, a `collections.namedtuple`
+        :raise ValueError: If ``fp`` is a `memoryview` that is too small.
+
+        .. versionadded:: 1.0.0
+        """
+        write = _get_writer(fp)
+        nbytes, errors = 0, {}
+        if self.many:
+            for chunk, chunk_errors in self.dumps_iter(obj, batch_size, *args, **kwargs):
+                write(chunk)
+                nbytes += len(chunk)
+                errors.update(chunk_errors)
+        else:
+            if obj != self.obj:
+                self._update_fields(obj)
+            data, errors = self._dump(obj, *self._get_json_marshal())
+            for chunk in _iter_json(self.opts.json_module.dumps, data, batch_size,
+                                    args, kwargs):
+                write(chunk)
+                nbytes += len(chunk)
+        return MarshalResult(nbytes, errors)
+
+    def dump_async(self, obj, chunk_size=100):
+        """Coroutine version of :meth:`dump`, for use with :mod:`asyncio`.
+
+        If this Schema has ``many=True``, ``obj`` may be a regular or an
+        asynchronous iterable. The objects are serialized ``chunk_size`` at a
+        time, and control is given back to the event loop between chunks.
+
+        Awaitable values, such as coroutines returned by the methods and
+        functions of :class:`Method <marshmallow.fields.Method>` and
+        :class:`Function <marshmallow.fields.Function>` fields, are awaited
+        concurrently, a chunk at a time, and replaced by their results. The
+        field's validators are run on each result, as they are on the values
+        of :meth:`dump`. The error of an awaitable that raises, or whose
+        result fails validation, is stored like any other serialization
+        error, under the field's name and the object's index if
+        ``many=True``; with ``strict``, it is raised as a
+        :exc:`MarshallingError <marshmallow.exceptions.MarshallingError>`.
+
+        Requires Python 3.5 or later.
+
+        :param obj: The object or collection of objects to serialize.
+        :param int chunk_size: Number of objects to serialize between two
+            returns to the event loop.
+        :return: A coroutine that returns a tuple of the form (``data``,
+            ``errors``), as :meth:`dump` does.
+
+        .. versionadded:: 1.0.0
+        """
+        return _import_aio().dump(self, obj, chunk_size=chunk_size)
+
+    def load_async(self, data, chunk_size=100):
+        """Coroutine version of :meth:`load`, for use with :mod:`asyncio`.
+
+        If this Schema has ``many=True``, ``data`` may be a regular or an
+        asynchronous iterable of dictionaries. They are deserialized
+        ``chunk_size`` at a time, and control is given back to the event loop
+        between chunks.
+
+        Requires Python 3.5 or later.
+
+        :param data: The data to deserialize.
+        :param int chunk_size: Number of items to deserialize between two
+            returns to the event loop.
+        :return: A coroutine that returns a tuple of the form (``result``,
+            ``errors``), as :meth:`load` does.
+
+        .. versionadded:: 1.0.0
+        """
+        return _import_aio().load(self, data, chunk_size=chunk_size)
+
+    def dump_columns(self, obj, arrays=False):
+        """Serialize the objects in the iterable ``obj`` into columns: return
+        a dictionary mapping each field name to the list of the field's
+        values, in the order of ``obj``. No dictionary is built per object,
+        and the result can be handed to dataframe or columnar file writers.
+        ``obj`` is always treated as a collection, whether or not this Schema
+        has ``many=True``.
+
+        The ``extra`` values are added as columns with the same value for
+        each object, and the error handler is called with the errors, keyed
+        by the index of each object. Data handlers, which receive rows, are
+        not applied.
+
+        :param obj: An iterable of objects to serialize.
+        :param bool arrays: If ``True``, return the columns of
+            :class:`Integer <marshmallow.fields.Integer>` and
+            :class:`Float <marshmallow.fields.Float>` fields as `array.array`
+            objects, unless a value fails to serialize or does not fit.
+        :return: A tuple of the form (``columns``, ``errors``), where
+            ``columns`` is an `OrderedDict`.
+        :rtype: `MarshalResult`, a `collections.namedtuple`
+
+        .. versionadded:: 1.0.0
+        """
+        iterator = iter(obj)
+        batch = list(islice(iterator, 1))
+        # Resolve the fields from the first object
+        self._update_fields(batch if self.many or not batch else batch[0])
+        iterator = chain(batch, iterator)
+        errors = {}
+        columns = self._marshal.serialize_columns(iterator, self.fields,
+                                                  strict=self.strict, errors=errors)
+        if arrays:
+            for (key, column), field_obj in zip(list(iteritems(columns)),
+                                                itervalues(self.fields)):
+                columns[key] = _to_array(field_obj, column)
+        if self.extra:
+            length = len(next(itervalues(columns))) if columns else 0
+            for key, value in iteritems(self.extra):
+                columns[key] = [value] * length
+        if errors and callable(self.__error_handler__):
+            self.__error_handler__(errors, obj)
+        return MarshalResult(columns, errors)
+
+    def dump_csv(self, obj, fp, batch_size=100):
+        """Serialize the objects in the iterable ``obj`` and write them to
+        ``fp`` as CSV, one row per object, streaming the rows through the
+        :mod:`csv` module. ``obj`` is always treated as a collection, whether
+        or not this Schema has ``many=True``.
+
+        The header row holds the serialized field names, in the order of
+        :attr:`fields`, followed by the keys of ``extra``. Keys added by data
+        handlers are not written. Empty cells are ``None`` values, and lists
+        and dictionaries (e.g. from :class:`List <marshmallow.fields.List>`
+        and :class:`Nested <marshmallow.fields.Nested>` fields) are written
+        as JSON. Invalid objects are written like :meth:`dump` serializes
+        them, and their errors are returned. The error handler is called once,
+        after all the rows are written, with the errors keyed by the index of
+        each object, so that it does not stop the export.
+
+        Objects are pulled from ``obj`` and serialized ``batch_size`` at a
+        time, as with :meth:`dumps_iter`, so that the ``batch`` functions of
+        fields are called once per batch. ``extra`` and registered data
+        handlers are applied to each batch.
+
+        :param obj: An iterable of objects to serialize.
+        :param fp: A file-like object opened in text mode with
+            ``newline=''``, or in binary mode on Python 2, where the cells
+            are encoded to UTF-8.
+        :param int batch_size: Number of objects to serialize at a time.
+        :return: A tuple of the form (``nrows``, ``errors``), where ``nrows``
+            is the number of rows written, not counting the header, and
+            ``errors`` are keyed by the index of each object.
+        :rtype: `MarshalResult`, a `collections.namedtuple`
+
+        .. versionadded:: 1.0.0
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be a positive integer.')
+        iterator = iter(obj)
+        batch = list(islice(iterator, batch_size))
+        # Resolve the fields from the first object
+        self._update_fields(batch if self.many or not batch else batch[0])
+        header = [self.prefix + field_name for field_name in self.fields]
+        header.extend(key for key in self.extra or () if key not in header)
+        dumps = self.opts.json_module.dumps
+        writerow = csv.writer(fp).writerow
+        if PY2:
+            writerow([key.encode('utf-8') for key in header])
+        else:
+            writerow(header)
+        errors, nrows = {}, 0
+        while batch:
+            batch_errors = {}
+            rows = self._marshal(batch, self.fields, many=True, strict=self.strict,
+                                 errors=batch_errors)
+            # The error handler is called with the errors of all the rows
+            rows = self._postprocess(rows, obj=batch, errors=None, many=True)
+            for row in rows:
+                values = map(row.get, header)
+                if PY2:
+                    writerow([_to_csv_cell(value, dumps).encode('utf-8') for value in values])
+                else:
+                    # The csv module writes these types as _to_csv_cell would
+                    writerow([
+                        value if type(value) in _CSV_NATIVE_TYPES
+                        else _to_csv_cell(value, dumps)
+                        for value in values
+                    ])
+            for idx, row_errors in iteritems(batch_errors):
+                errors[nrows + idx] = row_errors
+            nrows += len(batch)
+            batch = list(islice(iterator, batch_size))
+        if errors and callable(self.__error_handler__):
+            self.__error_handler__(errors, obj)
+        return MarshalResult(nrows, errors)
+
+    def load_csv(self, fp):
+        """Incrementally deserialize the rows of ``fp``, CSV with a header row
+        as written by :meth:`dump_csv`, yielding the result of each row as
+        soon as it is read. Columns are matched to fields by the header, and
+        the cells are decoded as described in :meth:`dump_csv`. Each row is
+        deserialized individually, whether or not this Schema has
+        ``many=True``, so an invalid row does not stop the import.
+
+        :param fp: A file-like object opened in text mode with
+            ``newline=''``, or in binary mode on Python 2, where the cells
+            are decoded from UTF-8.
+        :return: An iterator of `UnmarshalResult` tuples, one per row.
+
+        .. versionadded:: 1.0.0
+        """
+        reader = csv.reader(fp)
+        header = next(reader, None)
+        if header is None:
+            return
+        if PY2:
+            header = [key.decode('utf-8') for key in header]
+        prefix = self.prefix
+        names = [key[len(prefix):] if prefix and key.startswith(prefix) else key
+                 for key in header]
+        columns = [(name, self.fields.get(name)) for name in names]
+        loads = self.opts.json_module.loads
+        for cells in reader:
+            data = OrderedDict()
+            for (name, field_obj), cell in zip(columns, cells):
+                if PY2:
+                    cell = cell.decode('utf-8')
+                data[name] = _from_csv_cell(cell, field_obj, loads)
+            yield self._load(data, many=False)
+
+    def _get_binary_plan(self):
+        fields_dict, plan = self.__binary_plan
+        if fields_dict is not self.fields:
+            plan = binary.Plan(self.fields, prefix=self.prefix)
+            self.__binary_plan = (self.fields, plan)
+        return plan
+
+    def dumpb(self, obj):
+        """Same as :meth:`dump`, except return the result in marshmallow's
+        compact binary format, where the values of each object are packed in
+        field order, without their keys. Use :meth:`loadb` with the same
+        fields to load it. See :mod:`marshmallow.binary`.
+
+        :param obj: The object or collection of objects to serialize.
+        :return: A tuple of the form (``data``, ``errors``), where ``data`` is
+            a bytestring.
+        :rtype: `MarshalResult`, a `collections.namedtuple`
+
+        .. versionadded:: 1.0.0
+        """
+        data, errors = self.dump(obj)
+        return MarshalResult(self._get_binary_plan().encode(data, many=self.many), errors)
+
+    def loadb(self, data):
+        """Same as :meth:`load`, except it takes data in the binary format
+        returned by :meth:`dumpb`. Whether ``data`` is loaded as a collection
+        depends on how it was dumped.
+
+        :param bytes data: The data to deserialize.
+        :return: A tuple of the form (``result``, ``errors``)
+        :rtype: `UnmarshalResult`, a `collections.namedtuple`
+        :raise ValueError: If ``data`` is invalid or was dumped with different
+            fields.
+
+        .. versionadded:: 1.0.0
+        """
+        result, many = self._get_binary_plan().decode(data)
+        return self._load(result, many=many)
+
     def make_object(self, data):
         """Override-able method that defines how to create the final deserialization
         output. Defaults to noop (i.e. just return ``data`` as is).
@@ -483,7 +1076,8 @@ class BaseSchema(base.SchemaABC):
 
     @property
     def errors(self):
-        """Dictionary of errors raised during serialization.
+        """Dictionary of errors raised during the most recent serialization
+        in the current thread.
 
         .. deprecated:: 1.0.0
             Use the return value of `dump` instead.
@@ -507,7 +1101,10 @@ class BaseSchema(base.SchemaABC):
         if field_names is not None and type(field_names) not in (list, tuple):
             raise ValueError("field_names param must be a list or tuple")
         fields_to_validate = field_names or self.fields.keys()
-        field_set, error_set = set(self.fields), set(self.errors)
+        errors = self.errors
+        if self.many:  # Errors are keyed by the index of each object
+            errors = [name for row_errors in itervalues(errors) for name in row_errors]
+        field_set, error_set = set(self.fields), set(errors)
         for fname in fields_to_validate:
             if fname not in field_set:
                 raise KeyError('"{0}" is not a valid field name.'.format(fname))
@@ -516,6 +1113,147 @@ class BaseSchema(base.SchemaABC):
         return True
 
 
+def _rebuild_schema(schema_class, kwargs):
+    """Create a schema from the description returned by
+    :meth:`BaseSchema.__reduce__`.
+    """
+    return schema_class(**kwargs)
+
+
+def _import_aio():
+    """Import :mod:`marshmallow.aio`, which requires Python 3.5 or later."""
+    if sys.version_info < (3, 5):
+        raise RuntimeError('dump_async and load_async require Python 3.5 or later.')
+    from marshmallow import aio
+    return aio
+
+
+def _get_int_typecode():
+    # 'q' (long long) is not available before Python 3.3
+    try:
+        array('q')
+    except ValueError:
+        return 'l'
+    return 'q'
+
+# array.array typecodes of the numeric fields for dump_columns(arrays=True)
+_ARRAY_TYPECODES = {
+    fields.Integer: _get_int_typecode(),
+    fields.Float: 'd',
+}
+
+
+def _to_array(field_obj, column):
+    """Return ``column``, the values of ``field_obj``, as an `array.array`
+    if the field is numeric and all the values fit in the array. Return
+    ``column`` itself otherwise.
+    """
+    typecode = _ARRAY_TYPECODES.get(type(field_obj))
+    if typecode is None or getattr(field_obj, 'as_string', False):
+        return column
+    try:
+        return array(typecode, column)
+    except (TypeError, OverflowError):  # e.g. None for an invalid value
+        return column
+
+
+# Types of the values written to CSV as they are on Python 3
+_CSV_NATIVE_TYPES = frozenset([text_type, int, float, bool, type(None)])
+
+
+def _to_csv_cell(value, dumps):
+    """Return ``value``, a serialized value, as the text of a CSV cell. Lists
+    and dictionaries are encoded to JSON with ``dumps``.
+    """
+    if value is None:
+        return u''
+    if isinstance(value, float):
+        # repr, since str drops digits on Python 2
+        value = repr(value)
+    elif isinstance(value, (list, tuple, dict)):
+        value = dumps(value)
+    if isinstance(value, binary_type):
+        return value.decode('utf-8')
+    return text_type(value)
+
+
+def _from_csv_cell(cell, field_obj, loads):
+    """Return the value to deserialize from ``cell``, the text of a CSV cell.
+    Empty cells are ``None``, and the JSON of :class:`List` and
+    :class:`Nested` fields is decoded with ``loads``.
+    """
+    if cell == u'':
+        return None
+    if isinstance(field_obj, (fields.List, fields.Nested)) and cell[:1] in (u'[', u'{'):
+        try:
+            return loads(cell)
+        except ValueError:  # Left to the field to report
+            pass
+    return cell
+
+
+def _get_array_layout(dumps, args, kwargs):
+    """Return the bytes that ``dumps`` writes between the items of an array,
+    up to the line break that starts each item if indented, and before the
+    end of the array, including the closing bracket. These depend on the
+    ``indent`` and ``separators`` arguments and on the JSON module.
+    """
+    encoded = dumps([0, 0], *args, **kwargs)
+    if isinstance(encoded, text_type):
+        encoded = encoded.encode('utf-8')
+    first, last = encoded.index(b'0'), encoded.rindex(b'0')
+    return encoded[first + 1:last].split(b'\n')[0], encoded[last + 1:]
+
+
+def _iter_json(dumps, data, batch_size, args, kwargs):
+    """Encode ``data`` to JSON as ``dumps(data, *args, **kwargs)`` would,
+    yielding the UTF-8 encoded output in pieces. If ``data`` is a
+    dictionary, its items are encoded ``batch_size`` at a time, the same way
+    :meth:`Schema.dumps_iter` encodes the items of an array, so that only one
+    batch is encoded at once. Other data, and dictionaries whose keys are
+    sorted by ``dumps``, are encoded as a whole.
+    """
+    if not isinstance(data, dict) or not data or kwargs.get('sort_keys'):
+        encoded = dumps(data, *args, **kwargs)
+        yield encoded.encode('utf-8') if isinstance(encoded, text_type) else encoded
+        return
+    # Objects are laid out like arrays, with braces rather than brackets
+    item_separator, closing = _get_array_layout(dumps, args, kwargs)
+    items = iteritems(data)
+    opening = b'{'
+    while True:
+        batch = OrderedDict(islice(items, batch_size))
+        if not batch:
+            break
+        encoded = dumps(batch, *args, **kwargs)
+        if isinstance(encoded, text_type):
+            encoded = encoded.encode('utf-8')
+        yield opening + encoded[1:-len(closing)]
+        opening = item_separator
+    yield closing[:-1] + b'}'
+
+
+def _get_writer(fp):
+    """Return a function that writes bytes to ``fp``, a binary file-like
+    object, a `bytearray` or a writable `memoryview`.
+    """
+    if hasattr(fp, 'write'):
+        return fp.write
+    if isinstance(fp, bytearray):
+        return fp.extend
+    # Fill the buffer from the start
+    position = [0]
+
+    def write(data):
+        start = position[0]
+        end = start + len(data)
+        if end > len(fp):
+            raise ValueError('Buffer of {0} bytes is too small.'.format(len(fp)))
+        fp[start:end] = data
+        position[0] = end
+    return write
+
+
 class Schema(with_metaclass(SchemaMeta, BaseSchema)):
     __doc__ = BaseSchema.__doc__
 
@@ -2,12 +2,15 @@
 """Utility methods for marshmallow."""
 from __future__ import absolute_import
 import json
+import codecs
+import re
 import datetime
 import time
 import inspect
 from email.utils import formatdate, parsedate
 from calendar import timegm
 import types
+import weakref
 from decimal import Decimal, Context, Inexact
 from pprint import pprint as py_pprint
 
@@ -18,7 +21,12 @@ try:
 except ImportError:
     dateutil_available = False
 
-from marshmallow.compat import basestring, OrderedDict, binary_type, text_type
+# NumPy is imported on first use, since importing it is slow. None until
+# then, False if it is not installed.
+numpy_available = None
+numpy = None
+
+from marshmallow.compat import PY2, basestring, OrderedDict, binary_type, text_type
 
 
 def is_generator(obj):
@@ -72,6 +80,73 @@ def float_to_decimal(f):
     return result
 
 
+_INTEGER_TYPES = frozenset([int, long, bool]) if PY2 else frozenset([int, bool])  # noqa
+
+# {num_type: (types of the values in a list, kinds of the dtype of an array,
+#  dtype to convert to)}
+_NUMBER_CONVERSIONS = {
+    float: (_INTEGER_TYPES | frozenset([float]), 'biuf', 'float64'),
+    int: (_INTEGER_TYPES, 'biu', 'int64'),
+}
+
+
+def get_numpy():
+    """Return the ``numpy`` module, importing it on the first call, or
+    ``None`` if NumPy is not installed.
+
+    .. versionadded:: 1.0.0
+    """
+    global numpy, numpy_available
+    if numpy_available is False:
+        return None
+    if numpy is None:
+        try:
+            import numpy as module
+        except ImportError:
+            numpy_available = False
+            return None
+        numpy, numpy_available = module, True
+    return numpy
+
+
+def format_numbers(values, num_type, as_string=False):
+    """Convert each number of ``values``, a list, tuple or 1-dimensional NumPy
+    array, to ``num_type`` (``int`` or ``float``) in one call with NumPy.
+    Return the list of the converted numbers, or of their ``repr`` if
+    ``as_string`` is ``True``.
+
+    Return ``None`` if NumPy is not installed or if the result could differ
+    from converting the values one at a time, e.g. if ``values`` contains
+    strings or ``None``. The values must then be converted one at a time.
+
+    .. versionadded:: 1.0.0
+    """
+    if num_type not in _NUMBER_CONVERSIONS:
+        return None
+    numpy = get_numpy()
+    if numpy is None:
+        return None
+    types, kinds, dtype = _NUMBER_CONVERSIONS[num_type]
+    if isinstance(values, numpy.ndarray):
+        if values.ndim != 1 or values.dtype.kind not in kinds:
+            return None
+        # Unsigned 64-bit integers may not fit
+        if num_type is int and values.dtype.kind == 'u' and values.dtype.itemsize >= 8:
+            return None
+        array = values.astype(dtype)
+    else:
+        if not set(map(type, values)) <= types:
+            return None
+        try:
+            array = numpy.array(values, dtype=dtype)
+        except OverflowError:
+            return None
+    ret = array.tolist()
+    if as_string:
+        return list(map(repr, ret))
+    return ret
+
+
 def to_marshallable_type(obj, field_names=None):
     """Helper for converting an object to a dictionary only if it is not
     dictionary already or an indexable object nor a simple type"""
@@ -281,6 +356,87 @@ def get_value(key, obj, default=None):
         return _get_value_for_keys(key.split('.'), obj, default)
 
 
+# Accessors returned by get_accessor, keyed by key
+_accessors = {}
+
+
+def get_accessor(key):
+    """Return a function ``accessor(obj, default=None)`` that returns the same
+    value as ``get_value(key, obj, default)``. Accessors are cached by key.
+
+    The dotted path in ``key`` is split once, and the lookup for each part of
+    the path is specialized for each class of object it is applied to, the
+    first time that class is seen: attribute lookups for plain objects,
+    ``dict.get`` for dictionaries, and the generic lookup otherwise.
+    """
+    try:
+        return _accessors[key]
+    except KeyError:
+        pass
+    if isinstance(key, int):
+        def accessor(obj, default=None):
+            return _get_value_for_key(key, obj, default)
+    else:
+        getters = tuple(_KeyGetter(part) for part in key.split('.'))
+        if len(getters) == 1:
+            accessor = getters[0]
+        else:
+            def accessor(obj, default=None):
+                for getter in getters:
+                    obj = getter(obj, default)
+                return obj
+    return _accessors.setdefault(key, accessor)
+
+
+class _KeyGetter(object):
+    """Callable that returns the value for a single, non-dotted key, with
+    the lookup specialized per class of object.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        # {id(<class>): <function(obj, default)>}. Classes are not referenced,
+        # so that classes created at runtime can be collected; the entry of a
+        # class is removed when it is.
+        self._getters = {}
+        # {id(<class>): <weak reference to the class>}
+        self._refs = {}
+
+    def __call__(self, obj, default=None):
+        try:
+            getter = self._getters[id(type(obj))]
+        except KeyError:
+            getter = self._add(type(obj))
+        return getter(obj, default)
+
+    def _add(self, cls):
+        """Specialize the lookup for ``cls`` and return the getter."""
+        ident = id(cls)
+        getters, refs = self._getters, self._refs
+
+        def forget(ref):
+            refs.pop(ident, None)
+            getters.pop(ident, None)
+        refs.setdefault(ident, weakref.ref(cls, forget))
+        return getters.setdefault(ident, self._specialize(cls))
+
+    def _specialize(self, cls):
+        key = self.key
+        if cls in (dict, OrderedDict) and not hasattr(cls, key):
+            def getter(obj, default):
+                return obj.get(key, default)
+        elif ((not hasattr(cls, '__getitem__') or hasattr(cls, 'strip')) and
+                not hasattr(cls, '__getattr__') and
+                cls.__getattribute__ is object.__getattribute__):
+            # Neither the class nor its instances are indexable
+            def getter(obj, default):
+                return getattr(obj, key, default)
+        else:
+            def getter(obj, default):
+                return _get_value_for_key(key, obj, default)
+        return getter
+
+
 def _get_value_for_keys(keys, obj, default):
     if len(keys) == 1:
         return _get_value_for_key(keys[0], obj, default)
@@ -298,3 +454,156 @@ def _get_value_for_key(key, obj, default):
         except KeyError:
             return default
     return default
+
+
+def _iter_text(fp, chunk_size):
+    """Read ``fp`` in chunks of ``chunk_size``, decoding bytes as UTF-8."""
+    decoder = None
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            if decoder is not None:
+                chunk = decoder.decode(b'', True)
+                if chunk:
+                    yield chunk
+            return
+        if isinstance(chunk, binary_type):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder('utf-8')()
+            chunk = decoder.decode(chunk)
+        yield chunk
+
+
+def iter_json_lines(fp, loads=json.loads):
+    """Return an iterator of the values decoded from ``fp``, a file-like
+    object containing newline-delimited JSON (one JSON value per line).
+    Blank lines are skipped.
+
+    :param fp: A file-like object opened in text or binary mode.
+    :param callable loads: Function that decodes a JSON string.
+    """
+    for line in fp:
+        if isinstance(line, binary_type):
+            line = line.decode('utf-8')
+        if line.strip():
+            yield loads(line)
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Text that a JSON value cut off by the end of the buffer may end with: a
+# string without its closing quote, or the start of a \u escape, a number or
+# a literal. Decoding errors at such text may go away with more input.
+_PARTIAL_VALUE = re.compile(r'''(?:
+    "(?:[^"\\]|\\.)*\\?
+  | u[0-9a-fA-F]{0,4}
+  | -?[0-9]*(?:\.[0-9]*)?(?:[eE][-+]?[0-9]*)?
+  | t(?:r(?:ue?)?)? | f(?:a(?:l(?:se?)?)?)? | n(?:u(?:ll?)?)?
+  | N(?:aN?)? | -?I(?:n(?:f(?:i(?:n(?:i(?:ty?)?)?)?)?)?)?
+)\Z''', re.VERBOSE | re.DOTALL)
+
+
+def _is_truncated(buf, error):
+    """Return True if the decoding ``error`` raised for ``buf`` may be due to
+    ``buf`` ending before the end of the value, rather than to invalid JSON.
+    """
+    pos = getattr(error, 'pos', None)
+    if pos is None:
+        # The decoder does not tell where the error is (e.g. json on Python 2)
+        return True
+    return _PARTIAL_VALUE.match(buf, pos) is not None
+
+
+class _TextBuffer(object):
+    """Buffer over an iterator of text chunks, for incremental parsing."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.buf = ''
+        self.pos = 0
+        # Number of characters dropped from the start of the buffer
+        self.offset = 0
+
+    def read_more(self, size=1):
+        """Append chunks to the buffer until at least ``size`` characters were
+        added or the input is exhausted, dropping the consumed text. Return
+        False if the input was already exhausted.
+        """
+        chunks = []
+        added = 0
+        while added < size:
+            try:
+                chunk = next(self.chunks)
+            except StopIteration:
+                break
+            chunks.append(chunk)
+            added += len(chunk)
+        if not chunks:
+            return False
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + ''.join(chunks)
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character, or an empty string
+        at the end of the input.
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.read_more():
+                return ''
+
+
+def iter_json_array(fp, chunk_size=65536, decoder=None):
+    """Return an iterator of the items of the JSON array that is the
+    top-level value of ``fp``, a file-like object. The input is read
+    ``chunk_size`` characters (or bytes) at a time and each item is decoded
+    as soon as it is complete, so only one item needs to be held in memory.
+
+    :param fp: A file-like object opened in text or binary mode.
+    :param int chunk_size: Number of characters or bytes to read at a time.
+    :param decoder: The :class:`json.JSONDecoder` that decodes each item, or
+        any object with a compatible ``raw_decode`` method.
+    :raise ValueError: If ``fp`` does not contain a valid JSON array. The
+        error is raised as soon as an invalid item is read.
+
+    An item that is cut off by the end of the buffer is decoded again once
+    more input is read. The buffer is then at least doubled, so that a large
+    item is decoded a few times at most.
+    """
+    raw_decode = (decoder or json.JSONDecoder()).raw_decode
+    text = _TextBuffer(_iter_text(fp, chunk_size))
+    if text.peek() != '[':
+        raise ValueError('Expected a JSON array at character {0}'.format(text.offset + text.pos))
+    text.pos += 1
+    if text.peek() == ']':
+        return
+    while True:
+        text.peek()
+        while True:
+            try:
+                value, end = raw_decode(text.buf, text.pos)
+            except ValueError as error:
+                if (_is_truncated(text.buf, error) and
+                        text.read_more(len(text.buf) - text.pos)):
+                    continue
+                raise ValueError('Invalid JSON array item at character {0}: {1}'.format(
+                    text.offset + text.pos, error))
+            # A number that ends with the buffer (e.g. "-0." decodes as -0)
+            # may continue in the next chunk
+            if (text.buf[end - 1:end].isdigit() and
+                    _PARTIAL_VALUE.match(text.buf, end) and
+                    text.read_more(len(text.buf) - text.pos)):
+                continue
+            break
+        yield value
+        text.pos = end
+        char = text.peek()
+        if char == ']':
+            return
+        if char != ',':
+            raise ValueError("Expected ',' or ']' at character {0}".format(
+                text.offset + text.pos))
+        text.pos += 1
@@ -54,7 +54,7 @@ setup(
     author='Steven Loria',
     author_email='sloria1@gmail.com',
     url='https://github.com/sloria/marshmallow',
-    packages=find_packages(exclude=("test*", )),
+    packages=find_packages(exclude=("test*", "benchmarks*")),
     package_dir={'marshmallow': 'marshmallow'},
     include_package_data=True,
     tests_require=TEST_REQUIREMENTS,
@@ -16,6 +16,16 @@ def watch():
     """Run tests when a file changes."""
     run('py.test -f tests/', pty=True)
 
+@task
+def benchmark(save=False, compare=False):
+    """Run the benchmarks, optionally saving or comparing with the baseline."""
+    args = ''
+    if save:
+        args += ' --save default'
+    if compare:
+        args += ' --compare default'
+    run('python -m benchmarks' + args, pty=True)
+
 @task
 def clean():
     run("rm -rf build")
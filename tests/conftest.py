@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 """Pytest fixtures that are available in all test modules."""
+import sys
+
 import pytest
 
 from tests.base import User, UserSchema, Blog
 
+# Modules with syntax that older Pythons cannot compile
+collect_ignore = []
+if sys.version_info < (3, 5):
+    collect_ignore.append('test_aio.py')
+
 @pytest.fixture
 def user():
     return User(name="Monty", age=42.3, homepage="http://monty.python.org/")
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Tests for Schema.dump_async and Schema.load_async (Python 3.5+)."""
+import asyncio
+
+import pytest
+
+from marshmallow import Schema, fields
+from marshmallow.exceptions import MarshallingError
+
+from tests.base import User, UserSchema, Blog, BlogSchema
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class AsyncIterable(object):
+    """Asynchronous iterable over ``items``, giving control back to the event
+    loop before each item.
+    """
+
+    def __init__(self, items):
+        self.items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        try:
+            return next(self.items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class Tracker(object):
+    """Counts the coroutines running at the same time."""
+
+    def __init__(self):
+        self.active = self.max_active = 0
+
+    async def __call__(self, value):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        return value
+
+
+class ProfileSchema(Schema):
+    name = fields.String()
+    age = fields.Integer()
+    upper_name = fields.Method('get_upper_name')
+    initial = fields.Function(lambda obj: obj.tracker(obj.name[0]))
+
+    async def get_upper_name(self, obj):
+        if obj.name == 'fail':
+            raise ValueError('Cannot resolve')
+        return await obj.tracker(obj.name.upper())
+
+
+def make_users(count, tracker=None):
+    tracker = tracker or Tracker()
+    users = []
+    for idx in range(count):
+        user = User('User{0}'.format(idx), age=idx)
+        user.tracker = tracker
+        users.append(user)
+    return users
+
+
+def test_dump_async_many_matches_dump():
+    users = make_users(5)
+    schema = UserSchema(many=True)
+    assert run(schema.dump_async(users, chunk_size=2)) == schema.dump(users)
+
+
+def test_dump_async_single_object():
+    user = make_users(1)[0]
+    data, errors = run(ProfileSchema().dump_async(user))
+    assert data == {'name': 'User0', 'age': 0, 'upper_name': 'USER0', 'initial': 'U'}
+    assert errors == {}
+
+
+def test_dump_async_async_iterable():
+    users = make_users(5)
+    data, errors = run(ProfileSchema(many=True).dump_async(AsyncIterable(users),
+                                                           chunk_size=2))
+    assert [row['upper_name'] for row in data] == ['USER{0}'.format(i) for i in range(5)]
+    assert errors == {}
+
+
+def test_awaitables_are_awaited_concurrently():
+    tracker = Tracker()
+    run(ProfileSchema(many=True).dump_async(make_users(10, tracker), chunk_size=5))
+    assert tracker.max_active == 10  # Two fields of five objects
+
+
+def test_dump_async_gives_control_to_loop_between_chunks():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        before = len(ticks)
+        await UserSchema(many=True).dump_async(make_users(10), chunk_size=2)
+        task.cancel()
+        return len(ticks) - before
+
+    assert run(main()) >= 4
+
+
+def test_errors_of_awaitables():
+    users = make_users(3)
+    users[1].name = 'fail'
+    users[2].email = 'invalid'
+    data, errors = run(ProfileSchema(many=True).dump_async(users, chunk_size=2))
+    assert data[1]['upper_name'] is None
+    assert errors[1] == {'upper_name': 'Cannot resolve'}
+    assert list(errors) == [1]
+    with pytest.raises(MarshallingError):
+        run(ProfileSchema(many=True, strict=True).dump_async(users))
+
+
+def test_validators_run_on_awaited_values():
+    class ValidatedSchema(ProfileSchema):
+        upper_name = fields.Method('get_upper_name', validate=lambda value: value != 'USER1')
+
+    data, errors = run(ValidatedSchema(many=True).dump_async(make_users(3)))
+    assert [row['upper_name'] for row in data] == ['USER0', None, 'USER2']
+    assert list(errors) == [1]
+    assert 'USER1' in errors[1]['upper_name']
+
+
+def test_field_error_message_of_awaitables():
+    class MessageSchema(ProfileSchema):
+        upper_name = fields.Method('get_upper_name', error='custom msg')
+
+    users = make_users(2)
+    users[1].name = 'fail'
+    data, errors = run(MessageSchema(many=True).dump_async(users))
+    assert errors == {1: {'upper_name': 'custom msg'}}
+    data, errors = run(MessageSchema().dump_async(users[1]))
+    assert errors == {'upper_name': 'custom msg'}
+
+
+def test_cancelled_awaitables_are_not_stored():
+    class CancelledSchema(Schema):
+        value = fields.Method('get_value')
+
+        def get_value(self, obj):
+            future = asyncio.get_event_loop().create_future()
+            future.cancel()
+            return future
+
+    with pytest.raises(asyncio.CancelledError):
+        run(CancelledSchema(many=True).dump_async([1, 2]))
+
+
+def test_errors_not_keyed_by_index_are_kept(monkeypatch):
+    schema = ProfileSchema(many=True)
+    marshal = schema._marshal
+
+    def marshal_with_schema_error(*args, **kwargs):
+        kwargs['errors']['_schema'] = {'value': 'Invalid'}
+        return marshal(*args, **kwargs)
+
+    monkeypatch.setattr(schema, '_marshal', marshal_with_schema_error)
+    users = make_users(3)
+    users[1].name = 'fail'
+    data, errors = run(schema.dump_async(users, chunk_size=2))
+    assert errors == {1: {'upper_name': 'Cannot resolve'}, '_schema': {'value': 'Invalid'}}
+
+
+def test_nested_awaitables():
+    class TeamSchema(Schema):
+        members = fields.Nested(ProfileSchema, many=True, only=('upper_name', ))
+
+    class Team(object):
+        members = make_users(2)
+
+    data, errors = run(TeamSchema().dump_async(Team()))
+    assert data['members'] == [{'upper_name': 'USER0'}, {'upper_name': 'USER1'}]
+
+
+def test_nested_errors_many():
+    blogs = [Blog('Blog 0', user=User('Monty')),
+             Blog('Blog 1', user=User('Joe', email='invalid'))]
+    expected = BlogSchema(many=True).dump(blogs)
+    data, errors = run(BlogSchema(many=True).dump_async(blogs, chunk_size=1))
+    assert list(errors) == [1]
+    assert 'email' in errors[1]['user']
+    assert errors == expected.errors
+
+
+def test_data_handlers_receive_awaited_values():
+    class HandlerSchema(ProfileSchema):
+        pass
+
+    @HandlerSchema.data_handler
+    def add_greeting(schema, data, obj):
+        for row in data:
+            row['greeting'] = 'Hi ' + row['upper_name']
+        return data
+
+    data, _ = run(HandlerSchema(many=True).dump_async(make_users(2)))
+    assert [row['greeting'] for row in data] == ['Hi USER0', 'Hi USER1']
+
+
+def test_load_async():
+    class LoadSchema(Schema):
+        name = fields.String()
+        email = fields.Email()
+
+        def make_object(self, data):
+            return User(**data)
+
+    items = [{'name': 'Mick', 'email': 'mick@stones.com'},
+             {'name': 'Keith', 'email': 'invalid'},
+             {'name': 'Charlie', 'email': 'foo'}]
+    expected = LoadSchema(many=True).load(items)
+    for data in (items, AsyncIterable(items)):
+        result, errors = run(LoadSchema(many=True).load_async(data, chunk_size=2))
+        assert (result, errors) == expected
+        assert sorted(errors) == [1, 2]
+    result, errors = run(LoadSchema().load_async(items[0]))
+    assert result.email == 'mick@stones.com'
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        run(UserSchema(many=True).dump_async([], chunk_size=0))
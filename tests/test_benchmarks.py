@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Tests for the benchmark suite."""
+import pytest
+
+from marshmallow import class_registry
+
+from benchmarks import runner
+from benchmarks.scenarios import SCENARIOS, setup_scenario
+
+
+@pytest.mark.parametrize('name', list(SCENARIOS))
+def test_scenario_runs_without_errors(name):
+    func, teardown = setup_scenario(name)
+    try:
+        result = func()
+    finally:
+        if teardown is not None:
+            teardown()
+    errors = getattr(result, 'errors', None)
+    assert not errors
+
+
+def test_json_dumps_setup_registers_no_schema():
+    before = dict(class_registry._registry)
+    for _ in range(2):
+        setup_scenario('json_dumps_json')
+    assert class_registry._registry == before
+
+
+def test_run_and_compare():
+    lines = []
+    results = runner.run(['flat_dump', 'schema_init'], min_time=0.001, repeat=1,
+                         out=lines.append)
+    assert set(results['results']) == set(['flat_dump', 'schema_init'])
+    assert len(lines) == 2
+    baseline = {'python': results['python'], 'results': {
+        'flat_dump': {'ops': results['results']['flat_dump']['ops'] * 2},
+        'schema_init': {'ops': results['results']['schema_init']['ops'] / 2},
+    }}
+    assert runner.compare(results, baseline, out=lines.append) == ['flat_dump']
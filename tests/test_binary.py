@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Tests for the binary format of Schema.dumpb and Schema.loadb."""
+import datetime as dt
+import uuid
+
+import pytest
+
+from marshmallow import Schema, fields, binary, utils
+from marshmallow.compat import binary_type
+
+
+class Item(object):
+    def __init__(self, idx, **kwargs):
+        self.id = idx
+        self.uid = uuid.UUID(int=idx)
+        self.name = u'Item {0} ☃'.format(idx)
+        self.price = idx * 1.5
+        self.count = -idx * 1000
+        self.available = bool(idx % 2)
+        self.created = dt.datetime(2014, 8, 17, 14, 52, idx % 60, idx)
+        self.tags = ['a', 'b']
+        self.meta = {'source': 'import', 'batch': idx}
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+class PartSchema(Schema):
+    name = fields.String()
+    count = fields.Integer()
+
+
+class ItemSchema(Schema):
+    id = fields.Integer()
+    uid = fields.UUID()
+    name = fields.String()
+    price = fields.Float()
+    count = fields.Integer()
+    available = fields.Boolean()
+    created = fields.DateTime()
+    created_rfc = fields.DateTime(format='rfc', attribute='created')
+    tags = fields.List(fields.String)
+    meta = fields.Raw()
+    parts = fields.Nested(PartSchema, many=True)
+
+
+def make_item(idx, **kwargs):
+    kwargs.setdefault('parts', [Item(idx + 1), Item(idx + 2)])
+    return Item(idx, **kwargs)
+
+
+def plain(value):
+    """Return ``value`` with ordered dictionaries turned into dictionaries."""
+    if isinstance(value, dict):
+        return dict((key, plain(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    return value
+
+
+def test_roundtrip_matches_load_of_dump():
+    schema = ItemSchema()
+    item = make_item(3)
+    data, errors = schema.dumpb(item)
+    assert isinstance(data, binary_type)
+    assert not errors
+    result, errors = schema.loadb(data)
+    assert not errors
+    assert plain(result) == plain(schema.load(schema.dump(item).data).data)
+
+
+def test_roundtrip_many():
+    schema = ItemSchema(many=True)
+    items = [make_item(i) for i in range(5)]
+    data = schema.dumpb(items).data
+    result, errors = schema.loadb(data)
+    assert plain(result) == plain(schema.load(schema.dump(items).data).data)
+    assert len(result) == 5
+
+
+def test_binary_is_smaller_than_json():
+    schema = ItemSchema(many=True)
+    items = [make_item(i) for i in range(20)]
+    assert len(schema.dumpb(items).data) < len(schema.dumps(items).data) / 2
+
+
+@pytest.mark.parametrize('value', [
+    0, 1, -1, 63, -64, 64, 2 ** 70, -2 ** 70, 0.1, -1e300, float('inf'),
+    u'', u'ünïcödé', True, False, None, [], {}, [1, [2, {u'a': None}]],
+])
+def test_values_roundtrip(value):
+    schema = Schema(only=('value', ))
+    schema.fields['value'] = fields.Raw()
+    plan = binary.Plan(schema.fields)
+    assert plan.decode(plan.encode({'value': value})) == ({'value': value}, False)
+
+
+@pytest.mark.parametrize('value', [
+    u'2014-08-17T14:52:07+00:00',
+    u'2014-08-17T14:52:07.000001+00:00',
+    u'1912-06-23T00:00:00+00:00',
+    u'2014-08-17T14:52:07.000000+00:00',
+    u'2014-08-17T14:52:07-06:00',
+    u'not a datetime',
+])
+def test_datetime_strings_roundtrip(value):
+    plan = binary.Plan({'created': fields.DateTime()})
+    encoded = plan.encode({'created': value})
+    assert plan.decode(encoded) == ({'created': value}, False)
+
+
+def test_datetime_is_packed():
+    plan = binary.Plan({'created': fields.DateTime()})
+    value = utils.isoformat(dt.datetime(2014, 8, 17, 14, 52, 7))
+    assert len(plan.encode({'created': value})) < len(value)
+
+
+@pytest.mark.parametrize('value', [
+    u'12345678-1234-5678-1234-567812345678',
+    u'12345678-1234-5678-1234-56781234567F',
+    u'not a uuid',
+])
+def test_uuid_strings_roundtrip(value):
+    plan = binary.Plan({'uid': fields.UUID()})
+    assert plan.decode(plan.encode({'uid': value})) == ({'uid': value}, False)
+
+
+def test_extra_and_missing_keys():
+    plan = binary.Plan({'name': fields.String()})
+    data = {'extra': 42, 'more': [1]}
+    assert plan.decode(plan.encode(data)) == (data, False)
+
+
+def test_prefix():
+    schema = ItemSchema(only=('id', 'name'), prefix='item_')
+    data = schema.dumpb(make_item(1)).data
+    assert schema.loadb(data).data == {'id': 1, 'name': u'Item 1 ☃'}
+
+
+def test_loadb_with_different_fields_raises():
+    data = ItemSchema().dumpb(make_item(1)).data
+    with pytest.raises(ValueError):
+        ItemSchema(exclude=('meta', )).loadb(data)
+
+
+@pytest.mark.parametrize('data', [b'', b'{"id": 1}', b'MB\x01'])
+def test_loadb_invalid_data_raises(data):
+    with pytest.raises(ValueError):
+        ItemSchema().loadb(data)
+
+
+def test_loadb_truncated_data_raises():
+    data = ItemSchema().dumpb(make_item(1)).data
+    with pytest.raises(ValueError):
+        ItemSchema().loadb(data[:-5])
+    with pytest.raises(ValueError):
+        ItemSchema().loadb(data + b'\x00')
+
+
+def test_loadb_bytearray():
+    schema = ItemSchema(only=('id', ))
+    assert schema.loadb(bytearray(schema.dumpb(make_item(1)).data)).data == {'id': 1}
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Tests for generated dump functions."""
+import pytest
+
+from marshmallow import Schema, fields, codegen
+from marshmallow.exceptions import MarshallingError
+
+from tests.base import User, UserSchema
+
+
+class UserCodegenSchema(UserSchema):
+    class Meta:
+        codegen = True
+
+
+class SimpleSchema(Schema):
+    name = fields.String()
+    age = fields.Integer()
+    balance = fields.Float(as_string=True)
+    registered = fields.Boolean()
+    email = fields.Email()
+
+    class Meta:
+        codegen = True
+
+
+def test_codegen_dump_matches_generic_dump(user):
+    expected = UserSchema().dump(user).data
+    result, errors = UserCodegenSchema().dump(user)
+    assert result == expected
+    assert list(result.keys()) == list(expected.keys())
+    assert not errors
+
+
+def test_codegen_many(user):
+    users = [user, User('Keith', age=42)]
+    expected = UserSchema(many=True).dump(users).data
+    assert UserCodegenSchema(many=True).dump(users).data == expected
+
+
+def test_codegen_inlines_simple_fields():
+    plan = fields.Marshaller().compile(SimpleSchema().fields)
+    source, _ = codegen.generate_dump_source(plan)
+    assert '_get0(obj)' in source
+    assert '_get4' not in source
+    assert '_field4.serialize' in source
+
+
+def test_codegen_defaults_and_dicts():
+    data = SimpleSchema().dump({'name': None, 'age': '42', 'balance': 1}).data
+    assert data == {'name': '', 'age': 42, 'balance': '1.0',
+                    'registered': False, 'email': None}
+
+
+def test_codegen_falls_back_to_store_errors():
+    user = User('Joe', age='badage', email='invalid')
+    result, errors = SimpleSchema().dump(user)
+    assert 'age' in errors
+    assert 'email' in errors
+    assert result['name'] == 'Joe'
+
+
+def test_codegen_serializes_each_field_once_on_error():
+    calls = []
+
+    def count(obj):
+        calls.append(obj)
+        return obj.name
+
+    class CountingSchema(Schema):
+        counted = fields.Function(count)
+        age = fields.Integer()
+        email = fields.Email()
+
+        class Meta:
+            codegen = True
+
+    users = [User('Joe', age='badage', email='invalid'), User('Keith')]
+    result, errors = CountingSchema(many=True).dump(users)
+    assert calls == users
+    assert set(errors[0]) == set(['age', 'email'])
+    assert 1 not in errors
+    assert [each['counted'] for each in result] == ['Joe', 'Keith']
+
+
+def test_codegen_strict_raises():
+    user = User('Joe', email='invalid')
+    with pytest.raises(MarshallingError):
+        SimpleSchema(strict=True).dump(user)
+
+
+def test_codegen_respects_attribute_and_prefix():
+    class AliasSchema(Schema):
+        username = fields.String(attribute='name')
+
+        class Meta:
+            codegen = True
+
+    data = AliasSchema(prefix='usr_').dump(User('Mick')).data
+    assert data == {'usr_username': 'Mick'}
+
+
+class TestGeneratedLoader:
+
+    def test_load_matches_generic_load(self):
+        data = {'name': 'Monty', 'age': '42', 'balance': '3.14',
+                'registered': 'false', 'email': 'monty@python.org',
+                'unknown': 'ignored'}
+        expected = SimpleSchema().load(data).data
+        generic = SimpleSchema()
+        generic._unmarshal.codegen = None
+        generic._unmarshal.compile(generic.fields)
+        assert dict(generic.load(data).data) == dict(expected)
+        assert expected == {'name': 'Monty', 'age': 42, 'balance': '3.14',
+                            'registered': False, 'email': 'monty@python.org'}
+
+    def test_load_orders_by_field(self):
+        data = {'email': 'monty@python.org', 'name': 'Monty'}
+        result = SimpleSchema().load(data).data
+        assert list(result.keys()) == ['name', 'email']
+
+    def test_load_defaults(self):
+        result = SimpleSchema().load({'name': None, 'age': None}).data
+        assert result == {'name': '', 'age': 0}
+
+    def test_load_falls_back_to_store_errors(self):
+        result, errors = SimpleSchema().load({'name': 'Monty', 'age': 'nan',
+                                              'email': 'invalid'})
+        assert 'age' in errors
+        assert 'email' in errors
+        assert result['name'] == 'Monty'
+
+    def test_load_deserializes_each_field_once_on_error(self):
+        calls = []
+
+        class Counted(fields.Field):
+            def _deserialize(self, value):
+                calls.append(value)
+                return value
+
+        class CountingSchema(Schema):
+            counted = Counted()
+            age = fields.Integer()
+            email = fields.Email()
+
+            class Meta:
+                codegen = True
+
+        data = [{'counted': 1, 'age': 'nan', 'email': 'invalid'},
+                {'counted': 2, 'age': '42'}]
+        result, errors = CountingSchema(many=True).load(data)
+        assert calls == [1, 2]
+        assert set(errors[0]) == set(['age', 'email'])
+        assert 1 not in errors
+        assert result[0] == {'counted': 1, 'age': None, 'email': None}
+
+    def test_load_uses_attribute(self):
+        class AliasSchema(Schema):
+            username = fields.String(attribute='name')
+
+            class Meta:
+                codegen = True
+
+        assert AliasSchema().load({'username': 'Mick'}).data == {'name': 'Mick'}
+
+    def test_load_many_and_make_object(self):
+        class UserLoadSchema(SimpleSchema):
+            def make_object(self, data):
+                return User(**data)
+
+        result = UserLoadSchema().load({'name': 'Keith', 'age': '42'}).data
+        assert isinstance(result, User)
+        assert result.age == 42
+        results = UserLoadSchema(many=True).load([{'name': 'Keith'}, {'name': 'Mick'}]).data
+        assert [each['name'] for each in results] == ['Keith', 'Mick']
+
+
+class TestGeneratedCache:
+
+    def test_dumper_is_generated_on_first_dump(self, user):
+        schema = SimpleSchema()
+        assert schema._marshal._compiled[2] is not None
+        assert not callable(schema._marshal._compiled[2])
+        schema.dump(user)
+        assert callable(schema._marshal._compiled[2])
+
+    def test_factories_are_shared_between_instances(self, user):
+        class CachedSchema(SimpleSchema):
+            pass
+
+        first, second = CachedSchema(), CachedSchema()
+        first.dump(user)
+        first.load({'name': 'Monty'})
+        factories = dict(CachedSchema._codegen_factories)
+        assert len(factories) == 2
+        second.dump(user)
+        second.load({'name': 'Monty'})
+        assert CachedSchema._codegen_factories == factories
+        # Each instance has its own functions, bound to its own fields
+        assert second._marshal._compiled[2] is not first._marshal._compiled[2]
+
+    def test_replaced_fields_are_not_cached(self):
+        class ReplacedSchema(SimpleSchema):
+            pass
+
+        schema = ReplacedSchema()
+        schema.fields['age'] = fields.String()
+        schema._marshal.compile(schema.fields)
+        data = schema.dump(User('Joe', age=42)).data
+        assert data['age'] == '42'
+        assert ReplacedSchema._codegen_factories == {}
+        assert ReplacedSchema().dump(User('Joe', age=42)).data['age'] == 42
+
+    def test_changed_options_are_not_cached(self):
+        class OptionsSchema(Schema):
+            name = fields.String()
+            age = fields.Integer()
+
+            class Meta:
+                codegen = True
+
+        obj = {'name': None, 'age': 3}
+        changed = OptionsSchema()
+        changed.fields['age'].as_string = True
+        changed.fields['name'].default = 'other'
+        assert changed.dump(obj).data == {'name': 'other', 'age': '3'}
+        assert OptionsSchema().dump(obj).data == {'name': '', 'age': 3}
+        # Changed after the code of the unmodified fields is cached
+        changed = OptionsSchema()
+        changed.fields['age'].as_string = True
+        changed.fields['name'].default = 'other'
+        assert changed.dump(obj).data == {'name': 'other', 'age': '3'}
+        assert changed.load({'age': None}).data == {'age': '0'}
+        assert OptionsSchema().load({'age': None}).data == {'age': 0}
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 import pytest
+import datetime as dt
 import json
 import uuid
 
 from marshmallow import fields, utils, Schema
 from marshmallow.exceptions import UnmarshallingError
-from marshmallow.compat import text_type, total_seconds
+from marshmallow.compat import text_type, total_seconds, PY2
 
 from tests.base import *  # noqa
 
@@ -409,6 +410,140 @@ class TestSchemaDeserialization:
             v.load(bad_data)
 
 
+class TestLoadIter:
+
+    records = [
+        {'name': 'Mick', 'age': '71'},
+        {'name': 'Keith', 'age': 'old'},
+        {'name': 'Charlie', 'age': 73},
+    ]
+
+    def check_results(self, results):
+        assert [result.data['name'] for result in results] == ['Mick', 'Keith', 'Charlie']
+        assert results[0].data['age'] == 71.0
+        assert results[0].errors == {}
+        assert 'age' in results[1].errors
+        assert results[2].errors == {}
+
+    def test_load_iter_ndjson(self):
+        from io import BytesIO
+        content = '\n'.join(json.dumps(record) for record in self.records) + '\n'
+        results = list(SimpleUserSchema().load_iter(BytesIO(content.encode('utf-8'))))
+        self.check_results(results)
+
+    def test_load_iter_array(self):
+        from io import StringIO
+        content = text_type(json.dumps(self.records, indent=2))
+        results = list(SimpleUserSchema(many=True).load_iter(
+            StringIO(content), array=True, chunk_size=5))
+        self.check_results(results)
+
+    def test_load_iter_calls_make_object(self):
+        from io import StringIO
+
+        class UserLoadSchema(SimpleUserSchema):
+            def make_object(self, data):
+                return User(**data)
+
+        content = text_type(json.dumps([{'name': 'Mick'}]))
+        results = list(UserLoadSchema().load_iter(StringIO(content), array=True))
+        assert isinstance(results[0].data, User)
+
+    def test_load_iter_array_uses_json_module(self):
+        from io import StringIO
+        decoded = []
+
+        class Decoder(json.JSONDecoder):
+            def raw_decode(self, s, idx=0):
+                value, end = super(Decoder, self).raw_decode(s, idx)
+                decoded.append(value)
+                return value, end
+
+        class JSONModule(object):
+            JSONDecoder = Decoder
+            dumps = staticmethod(json.dumps)
+            loads = staticmethod(json.loads)
+
+        class ModuleSchema(SimpleUserSchema):
+            class Meta:
+                json_module = JSONModule()
+
+        content = text_type(json.dumps(self.records))
+        results = list(ModuleSchema().load_iter(StringIO(content), array=True))
+        self.check_results(results)
+        assert decoded == self.records
+
+    def test_load_iter_invalid_json(self):
+        from io import StringIO
+        results = SimpleUserSchema().load_iter(StringIO(u'{"name": "Mick"}\n{"name"\n'))
+        assert next(results).data['name'] == 'Mick'
+        with pytest.raises(ValueError):
+            next(results)
+
+class TestLoadCsv:
+
+    class ProfileSchema(Schema):
+        name = fields.String()
+        age = fields.Integer()
+        active = fields.Boolean()
+        rating = fields.Float()
+        tags = fields.List(fields.String)
+        # Parsed without dateutil
+        created = fields.DateTime(format='iso')
+
+    def make_csv(self, rows):
+        import csv
+        from io import BytesIO, StringIO
+        fp = BytesIO() if PY2 else StringIO(newline='')
+        csv.writer(fp).writerows(
+            [cell.encode('utf-8') for cell in row] if PY2 else row for row in rows)
+        fp.seek(0)
+        return fp
+
+    def test_load_csv(self):
+        fp = self.make_csv([
+            [u'name', u'age', u'active', u'rating', u'tags', u'created', u'unknown'],
+            [u'Mick ☃', u'71', u'False', u'0.1', u'["a", "b"]', u'2014-08-17T14:52:07+00:00', u'x'],
+            [u'Keith', u'old', u'True', u'', u'[]', u'2014-08-17T14:52:07+00:00', u'y'],
+        ])
+        results = list(self.ProfileSchema().load_csv(fp))
+        assert len(results) == 2
+        data, errors = results[0]
+        assert errors == {}
+        assert data['name'] == u'Mick ☃'
+        assert data['age'] == 71
+        assert data['active'] is False
+        assert data['rating'] == 0.1
+        assert data['tags'] == ['a', 'b']
+        assert data['created'].year == 2014
+        assert list(results[1].errors) == ['age']
+        assert results[1].data['rating'] == 0.0
+
+    def test_dump_csv_roundtrip(self):
+        from io import BytesIO, StringIO
+        schema = self.ProfileSchema()
+        objs = [{'name': u'Mick ☃', 'age': 71, 'active': False, 'rating': 0.1,
+                 'tags': ['a', 'b, c'], 'created': dt.datetime(2014, 8, 17, 14, 52, 7)}]
+        fp = BytesIO() if PY2 else StringIO(newline='')
+        schema.dump_csv(objs, fp)
+        fp.seek(0)
+        expected = schema.load(schema.dump(objs[0]).data)
+        assert list(schema.load_csv(fp)) == [expected]
+
+    def test_load_csv_strips_prefix(self):
+        fp = self.make_csv([[u'p_name', u'p_age'], [u'Mick', u'71']])
+        data = next(self.ProfileSchema(prefix='p_').load_csv(fp)).data
+        assert data == {'name': u'Mick', 'age': 71}
+
+    def test_load_csv_is_lazy(self):
+        fp = self.make_csv([[u'name']] + [[u'User{0}'.format(i)] for i in range(1000)])
+        results = self.ProfileSchema().load_csv(fp)
+        assert next(results).data['name'] == 'User0'
+        assert next(results).data['name'] == 'User1'
+
+    def test_load_csv_empty(self):
+        assert list(self.ProfileSchema().load_csv(self.make_csv([]))) == []
+
 class TestUnMarshaller:
 
     @pytest.fixture
@@ -470,6 +605,22 @@ class TestUnMarshaller:
         assert 'age' in errors
         assert 'name' not in errors
 
+    def test_deserialize_many_errors_are_keyed_by_index(self, unmarshal):
+        users_data = [
+            {'email': 'mick@stones.com', 'age': '71'},
+            {'email': 'invalid', 'age': 'nan'},
+            {'email': 'keith@stones.com', 'age': '70'},
+        ]
+        fields_dict = {
+            'email': fields.Email(),
+            'age': fields.Integer(),
+        }
+        result = unmarshal(users_data, fields_dict, many=True)
+        assert [each['age'] for each in result] == [71, None, 70]
+        errors = unmarshal.errors
+        assert list(errors) == [1]
+        assert set(errors[1]) == set(['email', 'age'])
+
     def test_deserialize_fields_with_attribute_param(self, unmarshal):
         data = {
             'username': 'mick@stones.com',
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Tests for the detection of JSON module capabilities."""
+import datetime as dt
+import json
+import uuid
+
+import pytest
+
+from marshmallow import Schema, fields, utils, json_backend
+
+from tests.base import User, UserSchema, mockjson
+
+
+class nativejson(object):
+    """JSON module that encodes datetimes and UUIDs natively, to bytes."""
+
+    @staticmethod
+    def default(value):
+        if isinstance(value, dt.datetime):
+            return utils.isoformat(value)
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        raise TypeError(repr(value))
+
+    @classmethod
+    def dumps(cls, value, **kwargs):
+        return json.dumps(value, default=cls.default, **kwargs).encode('utf-8')
+
+    loads = staticmethod(json.loads)
+
+
+class UserNativeSchema(UserSchema):
+    class Meta:
+        json_module = nativejson
+
+
+def test_stdlib_backend():
+    backend = json_backend.get_backend(json)
+    assert backend.module is json
+    assert backend.native_types == frozenset()
+
+
+def test_backends_are_cached():
+    assert json_backend.get_backend(json) is json_backend.get_backend(json)
+
+
+def test_mock_backend():
+    backend = json_backend.get_backend(mockjson)
+    assert backend.native_types == frozenset()
+
+
+def test_native_backend():
+    backend = json_backend.get_backend(nativejson)
+    assert backend.native_types == frozenset([dt.datetime, uuid.UUID])
+
+
+@pytest.mark.parametrize('names', [
+    'json',
+    ('notajsonmodule', 'json'),
+    ['notajsonmodule'],
+])
+def test_json_module_names(names):
+    class NamedSchema(Schema):
+        class Meta:
+            json_module = names
+
+    assert NamedSchema().opts.json_module is json
+
+
+def test_native_fields_are_left_to_encoder(user, monkeypatch):
+    expected, errors = UserSchema().dumps(user)
+    calls = []
+    original_format = fields.DateTime._format
+
+    def format(self, value):
+        calls.append(value)
+        return original_format(self, value)
+    monkeypatch.setattr(fields.DateTime, '_format', format)
+    result, errors = UserNativeSchema().dumps(user)
+    assert json.loads(result.decode('utf-8')) == json.loads(expected.decode('utf-8'))
+    # Only the fields with a non-ISO format are formatted by marshmallow
+    assert len(calls) == 2
+
+
+def test_native_fields_with_other_values():
+    user = User('Monty')
+    user.created, user.uid = None, 'not-a-uuid'
+    schema = UserNativeSchema(only=('created', 'uid'))
+    assert json.loads(schema.dumps(user).data.decode('utf-8')) == \
+        schema.dump(user).data
+
+
+def test_native_fields_in_dumps_iter(user):
+    schema = UserNativeSchema(only=('name', 'created', 'uid'))
+    chunks = schema.dumps_iter([user, user])
+    result = json.loads(b''.join(chunk for chunk, _ in chunks).decode('utf-8'))
+    assert result == [schema.dump(user).data] * 2
+
+
+def test_native_fields_in_dump_to(user):
+    class encoderjson(nativejson):
+        """Native module with the stdlib's encoder class."""
+        JSONEncoder = json.JSONEncoder
+
+    class UserEncoderSchema(UserSchema):
+        class Meta:
+            json_module = encoderjson
+
+    schema = UserEncoderSchema(only=('name', 'created', 'uid'))
+    buf = bytearray()
+    schema.dump_to(user, buf)
+    assert bytes(buf) == schema.dumps(user).data
+
+
+def test_dump_is_unaffected(user):
+    data = UserNativeSchema().dump(user).data
+    assert data['created'] == utils.isoformat(user.created)
+    assert data['uid'] == str(user.uid)
+
+
+def test_not_left_to_encoder_with_data_handlers(user):
+    class HandlerSchema(UserNativeSchema):
+        pass
+
+    @HandlerSchema.data_handler
+    def add_created(schema, data, obj):
+        data['created_date'] = data['created'][:10]
+        return data
+
+    result = json.loads(HandlerSchema(only=('created', )).dumps(user).data.decode('utf-8'))
+    assert result['created_date'] == user.created.isoformat()[:10]
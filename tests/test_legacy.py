@@ -31,3 +31,9 @@ def test_validating_nonexistent_field_raises_error(user):
     ser_user = UserSchema(user)
     with pytest.raises(KeyError):
         ser_user.is_valid(["foobar"])
+
+def test_validate_field_many():
+    users = [User("Joe", email="joe@foo.com"), User("John", email="johnexample.com")]
+    ser = UserSchema(users, many=True)
+    assert ser.is_valid(["name"]) is True
+    assert ser.is_valid(["email"]) is False
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests for the parallel serialization of collections."""
+import pytest
+
+from marshmallow import Schema, fields, parallel
+from marshmallow.exceptions import MarshallingError
+
+from tests.base import User, UserSchema
+
+futures = pytest.importorskip('concurrent.futures')
+
+
+class ContextSchema(Schema):
+    name = fields.String()
+    greeting = fields.Method('get_greeting')
+
+    def get_greeting(self, obj):
+        return '{0} {1}'.format(self.context['greeting'], obj.name)
+
+
+def make_users(count):
+    return [User('User{0}'.format(idx), age=idx,
+                 email='invalid' if idx % 4 == 1 else 'user@example.com')
+            for idx in range(count)]
+
+
+def test_dump_matches_schema_dump():
+    users = make_users(23)
+    schema = UserSchema(only=('name', 'email', 'age'), extra={'kind': 'user'})
+    with parallel.ParallelDumper(schema, workers=2, chunk_size=5) as dumper:
+        result = dumper.dump(iter(users))
+    assert result == UserSchema(many=True, only=('name', 'email', 'age'),
+                                extra={'kind': 'user'}).dump(users)
+    assert sorted(result.errors) == [1, 5, 9, 13, 17, 21]
+
+
+def test_iter_chunks():
+    users = make_users(7)
+    executor = futures.ThreadPoolExecutor(max_workers=2)
+    dumper = parallel.ParallelDumper(UserSchema(only=('name', )), chunk_size=3,
+                                     executor=executor)
+    chunks = list(dumper.iter_chunks(users))
+    dumper.close()
+    assert [len(data) for data, _ in chunks] == [3, 3, 1]
+    assert [list(errors) for _, errors in chunks] == [[], [], []]
+    assert [row['name'] for data, _ in chunks for row in data] == \
+        ['User{0}'.format(idx) for idx in range(7)]
+    # The executor that was passed in is not shut down
+    assert executor.submit(len, []).result() == 0
+    executor.shutdown()
+
+
+def test_schema_arguments_are_passed_to_workers():
+    schema = ContextSchema(context={'greeting': 'Hi'}, exclude=('name', ))
+    with parallel.ParallelDumper(schema, workers=2, chunk_size=2) as dumper:
+        data, errors = dumper.dump(make_users(3))
+    assert data == [{'greeting': 'Hi User0'}, {'greeting': 'Hi User1'},
+                    {'greeting': 'Hi User2'}]
+
+
+def test_strict_errors_are_raised():
+    with parallel.ParallelDumper(UserSchema(strict=True), workers=1) as dumper:
+        with pytest.raises(MarshallingError):
+            dumper.dump(make_users(3))
+
+
+def test_empty():
+    with parallel.ParallelDumper(UserSchema(), workers=1) as dumper:
+        assert dumper.dump([]) == ([], {})
+
+
+def test_requires_futures(monkeypatch):
+    monkeypatch.setattr(parallel, 'futures_available', False)
+    with pytest.raises(RuntimeError):
+        parallel.ParallelDumper(UserSchema())
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        parallel.ParallelDumper(UserSchema(), chunk_size=0)
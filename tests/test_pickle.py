@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Tests for pickling schemas and fields."""
+import pickle
+
+import pytest
+
+from marshmallow import Schema, fields
+from marshmallow.compat import iteritems
+from marshmallow.exceptions import UnmarshallingError
+
+from tests.base import User, Blog, UserSchema, BlogSchema
+
+PROTOCOLS = range(pickle.HIGHEST_PROTOCOL + 1)
+
+
+def roundtrip(obj, protocol=pickle.HIGHEST_PROTOCOL):
+    return pickle.loads(pickle.dumps(obj, protocol))
+
+
+def is_positive(value):
+    return value > 0
+
+
+class RefSchema(Schema):
+    user = fields.Nested('tests.base.UserSchema', only=('name', 'age'))
+    parent = fields.Nested('self', exclude=('parent', ))
+
+
+@pytest.fixture
+def user():
+    return User(name='Monty', age=42.3, homepage='http://monty.python.org/')
+
+
+@pytest.mark.parametrize('protocol', PROTOCOLS)
+def test_schema_roundtrip(user, protocol):
+    schema = UserSchema(only=('name', 'age', 'is_old', 'lowername'), strict=True,
+                        prefix='usr_', extra={'kind': 'user'},
+                        context={'key': 'value'})
+    copy = roundtrip(schema, protocol)
+    assert type(copy) is UserSchema
+    assert copy.only == ('name', 'age', 'is_old', 'lowername')
+    assert copy.strict is True
+    assert copy.prefix == 'usr_'
+    assert copy.extra == {'kind': 'user'}
+    assert copy.context == {'key': 'value'}
+    assert list(copy.fields) == list(schema.fields)
+    assert copy.dump(user).data == schema.dump(user).data
+
+
+def test_schema_fields_are_bound_to_the_copy():
+    copy = roundtrip(UserSchema(exclude=('email', )))
+    assert 'email' not in copy.fields
+    for field_name, field_obj in iteritems(copy.fields):
+        assert field_obj.parent is copy
+        assert field_obj.name == field_name
+
+
+def test_schema_many_roundtrip(user):
+    schema = UserSchema(many=True)
+    users = [user, User(name='Joe', age=12)]
+    assert roundtrip(schema).dump(users).data == schema.dump(users).data
+
+
+def test_schema_with_caches_filled(user):
+    schema = BlogSchema()
+    blog = Blog('Monty\'s blog', user=user, collaborators=[user])
+    expected = schema.dump(blog).data
+    schema.dumps(blog)
+    schema.dumpb(blog)
+    assert roundtrip(schema).dump(blog).data == expected
+
+
+def test_schema_with_string_references(user):
+    schema = RefSchema()
+    obj = {'user': user, 'parent': {'user': user}}
+    expected = schema.dump(obj).data
+    assert roundtrip(schema).dump(obj).data == expected
+
+
+def test_schema_is_smaller_than_its_fields():
+    schema = UserSchema()
+    state = dict((name, field_obj) for name, field_obj in iteritems(schema.fields)
+                 if not isinstance(field_obj, fields.Function))
+    assert len(pickle.dumps(schema, 2)) < len(pickle.dumps(state, 2))
+
+
+def test_field_roundtrip():
+    field_obj = fields.Integer(attribute='count', validate=is_positive, required=True)
+    field_obj.parent = UserSchema()
+    assert field_obj.serialize('value', {'count': 3}) == 3
+    copy = roundtrip(field_obj)
+    assert copy.parent is None
+    assert copy.attribute == 'count'
+    assert copy.required is True
+    assert copy.validate is is_positive
+    assert copy._validators == (is_positive, )
+    assert copy.serialize('value', {'count': 4}) == 4
+    with pytest.raises(UnmarshallingError):
+        copy.deserialize(-1)
+
+
+def test_method_field_roundtrip(user):
+    schema = UserSchema()
+    field_obj = schema.fields['is_old']
+    assert field_obj.serialize('is_old', user) is False
+    copy = roundtrip(field_obj)
+    assert copy.parent is None
+    copy.parent = schema
+    assert copy.serialize('is_old', user) is False
+
+
+def test_nested_field_roundtrip(user):
+    schema = BlogSchema()
+    field_obj = schema.fields['user']
+    expected = field_obj.serialize('user', {'user': user})
+    copy = roundtrip(field_obj)
+    assert copy.parent is None
+    assert copy.nested is UserSchema
+    assert copy.serialize('user', {'user': user}) == expected
+
+
+def test_nested_schema_instance_is_pickled_as_a_spec(user):
+    field_obj = fields.Nested(UserSchema(only=('name', )))
+    field_obj.parent = Schema()
+    field_obj.serialize('user', {'user': user})
+    copy = roundtrip(field_obj)
+    assert copy.nested is not field_obj.nested
+    assert copy.nested.only == ('name', )
+    copy.parent = Schema()
+    assert copy.serialize('user', {'user': user}) == {'name': 'Monty'}
+
+
+def test_copy_shares_the_attributes(user):
+    import copy
+    schema = UserSchema(only=('name', ), context={'key': 'value'})
+    schema.fields['nick'] = fields.String(attribute='name')
+    copied = copy.copy(schema)
+    assert type(copied) is UserSchema
+    assert copied.fields is schema.fields
+    assert copied.context is schema.context
+    assert copied.dump(user).data == schema.dump(user).data
+
+
+def test_deepcopy_rebuilds_the_schema(user):
+    import copy
+    schema = UserSchema(only=('name', ), context={'key': 'value'})
+    schema.fields['nick'] = fields.String(attribute='name')
+    copied = copy.deepcopy(schema)
+    assert copied.context == schema.context
+    assert copied.context is not schema.context
+    assert copied.dump(user).data == {'name': 'Monty'}
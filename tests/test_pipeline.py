@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Tests for marshmallow.pipeline."""
+import pytest
+
+from marshmallow import Schema, fields, UnmarshallingError
+from marshmallow.pipeline import Pipeline, StageStats
+
+
+class ItemSchema(Schema):
+    id = fields.Integer(required=True)
+    name = fields.String()
+
+
+def make_rows(count):
+    for idx in range(count):
+        yield {'id': idx, 'name': u'Item {0}'.format(idx)}
+
+
+def test_load_filter_transform_dump_sink():
+    output = []
+    stats = (Pipeline(make_rows(10))
+             .load(ItemSchema())
+             .filter(lambda item: item['id'] % 2)
+             .transform(lambda item: dict(item, name=item['name'].upper()))
+             .dump(ItemSchema(only=('name', )))
+             .sink(output.append))
+    assert output == [{'name': u'ITEM {0}'.format(idx)} for idx in (1, 3, 5, 7, 9)]
+    assert [stage.name for stage in stats] == [
+        'source', 'load', 'filter', 'transform', 'dump', 'sink']
+    assert [(stage.items_in, stage.items_out) for stage in stats] == [
+        (10, 10), (10, 10), (10, 5), (5, 5), (5, 5), (5, 0)]
+    for stage in stats:
+        assert stage.seconds >= 0
+
+
+def test_pipeline_is_lazy():
+    pulled = []
+
+    def source():
+        for row in make_rows(1000):
+            pulled.append(row['id'])
+            yield row
+    items = iter(Pipeline(source()).load(ItemSchema()).batch(10))
+    first = next(items)
+    assert [item['id'] for item in first] == list(range(10))
+    assert len(pulled) == 10
+
+
+def test_batch():
+    batches = list(Pipeline(range(7)).batch(3))
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_batch_size_must_be_positive():
+    with pytest.raises(ValueError):
+        Pipeline([]).batch(0)
+
+
+def test_load_errors_drop_items():
+    rows = [{'id': 1}, {'id': 'invalid'}, {'id': 'x'}, {'id': 4}]
+    failed = []
+    pipeline = Pipeline(rows).load(ItemSchema(),
+                                   on_error=lambda item, errors: failed.append((item, errors)))
+    assert [item['id'] for item in pipeline] == [1, 4]
+    assert [item for item, _ in failed] == rows[1:3]
+    assert 'id' in failed[0][1]
+    assert pipeline.stats[1].errors == 2
+
+
+def test_load_many_after_batch():
+    rows = [{'id': 1}, {'id': 'invalid'}, {'id': 3}]
+    failed = []
+    pipeline = (Pipeline(rows)
+                .batch(2)
+                .load(ItemSchema(many=True), on_error=lambda item, errors: failed.append(errors)))
+    chunks = list(pipeline)
+    assert len(chunks) == 2
+    assert chunks[1] == [{'id': 3}]
+    assert list(failed[0]) == [1]
+    assert pipeline.stats[2].errors == 1
+
+
+def test_strict_schema_raises():
+    pipeline = Pipeline([{'id': 'invalid'}]).load(ItemSchema(strict=True))
+    with pytest.raises(UnmarshallingError):
+        list(pipeline)
+
+
+def test_stage_names():
+    stats = Pipeline([], name='rows').transform(str, name='to_text').sink(len, name='out')
+    assert [stage.name for stage in stats] == ['rows', 'to_text', 'out']
+
+
+def test_throughput():
+    stats = StageStats('load')
+    assert stats.throughput is None
+    stats.items_in, stats.seconds = 100, 0.5
+    assert stats.throughput == 200
+    assert repr(stats) == "<StageStats 'load': 100 in, 0 out, 0 errors, 0.500000s>"
@@ -2,7 +2,7 @@
 
 import pytest
 
-from marshmallow import Schema, fields, class_registry
+from marshmallow import Schema, fields, class_registry, utils
 from marshmallow.exceptions import RegistryError
 
 
@@ -102,3 +102,128 @@ def test_can_use_full_module_path_to_class():
     field2 = fields.Nested('tests.test_registry.FooSerializer')
 
     assert field2.serialize('bar', {'foo': {'_id': 42}})
+
+
+def test_register_from_threads(monkeypatch):
+    import threading
+    monkeypatch.setattr(class_registry, '_registry', {})
+    classes = [type('ThreadSchema{0}'.format(idx), (object, ), {}) for idx in range(8)]
+
+    def register(cls):
+        for _ in range(100):
+            class_registry.register('ThreadSchema', cls)
+
+    threads = [threading.Thread(target=register, args=(cls, )) for cls in classes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    fullpath = '{0}.ThreadSchema'.format(__name__)
+    assert len(class_registry.get_class(fullpath, all=True)) == 800
+    assert class_registry.get_class('ThreadSchema') in classes
+
+
+def test_fields_created_from_threads_have_distinct_indices():
+    import threading
+    created = []
+
+    def create():
+        created.extend(fields.Field() for _ in range(1000))
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(field._creation_index for field in created)) == 8000
+
+
+class TestWarmup:
+
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        registry = {}
+        monkeypatch.setattr(class_registry, '_registry', registry)
+        return registry
+
+    def test_warmup_builds_class_caches(self, registry):
+        class WarmSchema(Schema):
+            name = fields.String()
+            email = fields.Email(attribute='contact.email')
+
+        class WarmBlogSchema(Schema):
+            title = fields.String()
+            author = fields.Nested('WarmSchema')
+
+        assert WarmSchema._field_sets == {}
+        warmed = class_registry.warmup(freeze=False)
+        assert set(warmed) == set([WarmSchema, WarmBlogSchema])
+        assert list(WarmSchema._field_sets) == [((), (), None)]
+        assert list(WarmBlogSchema._field_sets) == [((), (), None)]
+        assert 'contact.email' in utils._accessors
+
+    def test_warmup_raises_on_unresolved_nested(self, registry):
+        class BrokenSchema(Schema):
+            author = fields.Nested('MissingSchema')
+
+        with pytest.raises(RegistryError):
+            class_registry.warmup(freeze=False)
+
+    def test_warmup_generates_code_once_per_class(self, registry, user):
+        class WarmSchema(Schema):
+            name = fields.String()
+            age = fields.Integer()
+
+            class Meta:
+                codegen = True
+
+        class_registry.warmup()
+        factories = dict(WarmSchema._codegen_factories)
+        assert len(factories) == 2
+        schema = WarmSchema()
+        schema.dump(user)
+        schema.load({'name': 'Monty'})
+        assert WarmSchema._codegen_factories == factories
+
+    def test_warmup_does_not_scan_existing_instances(self, registry):
+        class WarmSchema(Schema):
+            name = fields.String()
+
+        class WarmBlogSchema(Schema):
+            author = fields.Nested('WarmSchema')
+
+        schema = WarmBlogSchema()
+        class_registry.warmup()
+        assert schema.fields['author']._Nested__schema is None
+
+    def test_warmup_skips_classes_that_require_arguments(self, registry):
+        class WarmSchema(Schema):
+            name = fields.String()
+
+        class ArgSchema(Schema):
+            name = fields.String()
+
+            def __init__(self, name, *args, **kwargs):
+                super(ArgSchema, self).__init__(*args, **kwargs)
+
+        assert class_registry.warmup() == [WarmSchema]
+
+    def test_warmup_raises_errors_of_constructors(self, registry):
+        class BrokenSchema(Schema):
+            name = fields.String()
+
+            def __init__(self, *args, **kwargs):
+                super(BrokenSchema, self).__init__(*args, **kwargs)
+                len(None)
+
+        with pytest.raises(TypeError):
+            class_registry.warmup()
+
+    def test_warmup_freezes_objects(self, registry, monkeypatch):
+        frozen = []
+        monkeypatch.setattr(class_registry.gc, 'freeze', lambda: frozen.append(True),
+                            raising=False)
+        class_registry.warmup()
+        assert frozen == []
+        class_registry.warmup(freeze=True)
+        assert frozen == [True]
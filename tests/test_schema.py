@@ -24,6 +24,39 @@ class TestFieldSerialization:
         field = fields.Function(lambda obj: obj.name.upper())
         assert "FOO" == field.serialize("key", self.user)
 
+    def test_function_field_resolves_arity_once(self, monkeypatch):
+        field = fields.Function(lambda obj: obj.name.upper())
+        monkeypatch.setattr(fields, '_get_args', None)
+        assert field.serialize('key', self.user) == 'FOO'
+        assert field.serialize('key', self.user) == 'FOO'
+
+    def test_method_field_resolves_method_per_parent(self):
+        class MethodSchema(Schema):
+            uppername = fields.Method('get_uppername')
+
+            def get_uppername(self, obj):
+                return obj.name.upper()
+
+        class ContextMethodSchema(Schema):
+            uppername = fields.Method('get_uppername')
+
+            def get_uppername(self, obj, context):
+                return context['prefix'] + obj.name.upper()
+
+        field = MethodSchema._declared_fields['uppername']
+        schema = MethodSchema()
+        assert schema.dump(self.user).data['uppername'] == 'FOO'
+        method, num_args = schema.fields['uppername']._get_method()
+        assert method == schema.get_uppername
+        assert num_args == 2
+        # A bound copy of the field, the declared field is untouched
+        assert field._method == (None, None, None)
+
+        field.parent = ContextMethodSchema(context={'prefix': 'x'})
+        assert field.serialize('uppername', self.user) == 'xFOO'
+        field.parent = ContextMethodSchema(context={'prefix': 'y'})
+        assert field.serialize('uppername', self.user) == 'yFOO'
+
     def test_function_with_uncallable_param(self):
         with pytest.raises(ValueError):
             fields.Function("uncallable")
@@ -328,6 +361,40 @@ class TestValidation:
             with pytest.raises(MarshallingError):
                 field.serialize('uppername', invalid)
 
+    def test_validators_are_normalized_once(self):
+        calls = []
+
+        def validators_gen():
+            calls.append(1)
+            yield lambda x: x <= 24
+
+        field = fields.Integer(validate=validators_gen)
+        assert len(field._validators) == 1
+        for age in (18, 20, 22):
+            field.serialize('age', User(name='Joe', age=age))
+        assert len(calls) == 1
+
+    def test_invalid_validate_param(self):
+        with pytest.raises(ValueError):
+            fields.Integer(validate='notcallable')
+
+    def test_setting_validate_rebuilds_validators(self):
+        field = fields.Integer()
+        assert field.validate is None
+        user = User(name='Joe', age=30)
+        assert field.serialize('age', user) == 30
+        field.validate = lambda x: x <= 24
+        with pytest.raises(MarshallingError):
+            field.serialize('age', user)
+        field.validate = None
+        assert field.serialize('age', user) == 30
+
+    def test_custom_error_message_with_validator(self):
+        field = fields.Integer(validate=lambda x: x <= 24, error='Too old.')
+        with pytest.raises(MarshallingError) as excinfo:
+            field.serialize('age', User(name='Joe', age=30))
+        assert 'Too old.' in str(excinfo)
+
     def test_method_validator(self):
         class MethodSerializer(Schema):
             uppername = fields.Method('get_uppername',
@@ -408,6 +475,67 @@ class TestMarshaller:
         res = marshal(gen, {"name": fields.String()}, many=True)
         assert len(res) == 2
 
+    def test_errors_are_stored_per_call(self):
+        marshal = fields.Marshaller()
+        errors = {}
+        marshal(User("Foo", email="foobar"), {"email": fields.Email()}, errors=errors)
+        assert "email" in errors
+        assert marshal.errors is errors
+        marshal(User("Foo", email="foo@bar.com"), {"email": fields.Email()})
+        assert marshal.errors == {}
+        assert "email" in errors
+
+    def test_many_errors_are_keyed_by_index(self):
+        users = [User("Foo", email="foo@bar.com"), User("Bar", email="invalid"),
+                 User("Baz", email="baz@bar.com"), User("Qux", email="alsoinvalid")]
+        marshal = fields.Marshaller()
+        result = marshal(users, {"email": fields.Email()}, many=True)
+        assert [each['email'] for each in result] == ['foo@bar.com', None, 'baz@bar.com', None]
+        assert sorted(marshal.errors) == [1, 3]
+        assert 'email' in marshal.errors[1]
+        assert 'email' in marshal.errors[3]
+
+    def test_many_strict_raises_on_first_error(self):
+        users = [User("Foo", email="foo@bar.com"), User("Bar", email="invalid")]
+        marshal = fields.Marshaller()
+        with pytest.raises(MarshallingError):
+            marshal(users, {"email": fields.Email()}, many=True, strict=True)
+
+    def test_reentrant_call_restores_errors(self):
+        marshal = fields.Marshaller()
+
+        class Reentrant(fields.Field):
+            _CHECK_ATTRIBUTE = False
+
+            def _serialize(self, value, attr, obj):
+                return marshal(User("Bar", email="bar@baz.com"), {"email": fields.Email()})
+
+        fields_dict = OrderedDict([('inner', Reentrant()), ('email', fields.Email())])
+        result = marshal(User("Foo", email="foobar"), fields_dict)
+        assert result['inner'] == {'email': 'bar@baz.com'}
+        assert list(marshal.errors) == ['email']
+
+    def test_compile_returns_plan(self):
+        name, email = fields.String(), fields.Email()
+        fields_dict = OrderedDict([('name', name), ('email', email)])
+        marshal = fields.Marshaller(prefix='usr_')
+        plan = marshal.compile(fields_dict)
+        assert plan == (('usr_name', 'name', name), ('usr_email', 'email', email))
+
+    def test_plan_is_reused_for_same_fields(self):
+        fields_dict = {'name': fields.String()}
+        marshal = fields.Marshaller()
+        marshal(User('Foo'), fields_dict)
+        plan = marshal._compiled[1]
+        marshal(User('Bar'), fields_dict)
+        assert marshal._compiled[1] is plan
+
+    def test_plan_is_rebuilt_for_different_fields(self):
+        marshal = fields.Marshaller()
+        marshal(User('Foo'), {'name': fields.String()})
+        result = marshal(User('Foo', age=42), {'age': fields.Integer()})
+        assert result == {'age': 42}
+
 
 def test_enum_is_select():
     assert fields.Select is fields.Enum
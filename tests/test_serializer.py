@@ -3,12 +3,13 @@
 
 import json
 import random
+import sys
 
 import pytest
 
 from marshmallow import Schema, fields, utils, MarshalResult, UnmarshalResult
 from marshmallow.exceptions import MarshallingError
-from marshmallow.compat import unicode, binary_type
+from marshmallow.compat import unicode, binary_type, PY2
 
 from tests.base import *  # noqa
 
@@ -42,6 +43,81 @@ def test_dump_returns_dict_of_errors():
     assert 'email' in errors
     assert 'homepage' in errors
 
+def test_dump_many_returns_errors_keyed_by_index():
+    s = UserSchema(many=True)
+    users = [User(name='Mick', email='mick@stones.com'),
+             User(name='Monty', email='invalidemail', homepage='badurl')]
+    result, errors = s.dump(users)
+    assert result[0]['email'] == 'mick@stones.com'
+    assert list(errors) == [1]
+    assert 'email' in errors[1]
+    assert 'homepage' in errors[1]
+
+def test_errors_are_not_shared_between_dumps():
+    s = UserSchema()
+    _, errors = s.dump(User('Monty', email='invalid'))
+    assert 'email' in errors
+    _, errors2 = s.dump(User('Monty', email='monty@python.org'))
+    assert errors2 == {}
+    assert 'email' in errors
+
+def test_errors_are_not_shared_between_loads():
+    s = UserSchema()
+    _, errors = s.load({'name': 'Monty', 'email': 'invalid'})
+    assert 'email' in errors
+    _, errors2 = s.load({'name': 'Monty', 'email': 'monty@python.org'})
+    assert errors2 == {}
+
+def test_schema_can_be_shared_between_threads():
+    import threading
+    s = BlogSchema()
+    results = {}
+
+    def dump(idx):
+        email = 'invalid' if idx % 2 else 'foo{0}@bar.com'.format(idx)
+        blog = Blog('Blog', user=User('User{0}'.format(idx), email=email))
+        results[idx] = [s.dump(blog) for _ in range(50)]
+
+    threads = [threading.Thread(target=dump, args=(i, )) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for idx, dumped in results.items():
+        for data, errors in dumped:
+            assert data['user']['name'] == 'User{0}'.format(idx)
+            if idx % 2:
+                assert list(errors) == ['user']
+                assert 'email' in errors['user']
+            else:
+                assert errors == {}
+
+def test_list_fields_can_be_dumped_from_threads():
+    import threading
+
+    class TagsSchema(Schema):
+        tags = fields.List(fields.Integer(validate=lambda n: n >= 0))
+    s = TagsSchema()
+    results = {}
+
+    def dump(idx):
+        tags = [idx, -1] if idx % 2 else idx
+        results[idx] = [s.dump({'tags': tags}) for _ in range(50)]
+
+    threads = [threading.Thread(target=dump, args=(i, )) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for idx, dumped in results.items():
+        for data, errors in dumped:
+            if idx % 2:
+                assert data['tags'] is None
+                assert list(errors) == ['tags']
+            else:
+                assert data['tags'] == [idx]
+                assert errors == {}
+
 def test_dump_returns_a_marshalresult(user):
     s = UserSchema()
     result = s.dump(user)
@@ -86,6 +162,81 @@ def test_fields_are_not_copies(SchemaClass):
     assert s.fields is not s2.fields
 
 
+class TestFieldSetCache:
+
+    def test_field_sets_are_cached_per_class(self):
+        s = UserSchema(only=('name', 'email'))
+        s2 = UserSchema(only=('name', 'email'))
+        assert (('name', 'email'), (), None) in UserSchema._field_sets
+        assert list(s.fields.keys()) == ['name', 'email']
+        assert list(s2.fields.keys()) == ['name', 'email']
+
+    def test_bound_fields_are_not_shared(self):
+        s = UserSchema(exclude=('age', ))
+        s2 = UserSchema(exclude=('age', ))
+        for field_name in s.fields:
+            assert s.fields[field_name] is not s2.fields[field_name]
+            assert s.fields[field_name].parent is s
+            assert s2.fields[field_name].parent is s2
+        cached = UserSchema._field_sets[((), ('age', ), None)]
+        assert all(field_obj.parent is None for field_obj in cached.values())
+        assert all(field_obj.name == field_name
+                   for field_name, field_obj in cached.items())
+
+    def test_cache_is_cleared_when_declared_fields_change(self):
+        class CachedSchema(Schema):
+            name = fields.String()
+
+        assert list(CachedSchema().fields) == ['name']
+        CachedSchema._declared_fields['age'] = fields.Float()
+        assert list(CachedSchema().fields) == ['name', 'age']
+        CachedSchema._declared_fields['name'] = fields.String(attribute='email')
+        obj = {'name': 'Mick', 'email': 'mick@stones.com', 'age': 71}
+        assert CachedSchema().dump(obj).data == {'name': 'mick@stones.com', 'age': 71.0}
+        del CachedSchema._declared_fields['age']
+        assert list(CachedSchema().fields) == ['name']
+
+    def test_inferred_fields_are_not_cached(self, user):
+        class InferredSchema(Schema):
+            class Meta:
+                fields = ('name', 'age')
+
+        s = InferredSchema()
+        assert InferredSchema._field_sets[((), (), None)] is False
+        assert s.dump(user).data == {'name': user.name, 'age': user.age}
+
+    def test_declared_fields_share_bound_fields(self):
+        s = UserSchema(only=('name', ))
+        assert s.declared_fields['name'] is s.fields['name']
+        assert s.declared_fields['email'] is not UserSchema._declared_fields['email']
+
+    def test_fields_changed_on_instance_declared_fields(self, user):
+        s = UserSchema(only=None)
+        s.declared_fields['years'] = fields.Integer(attribute='age')
+        del s.declared_fields['email']
+        data = s.dump(user).data
+        assert data['years'] == int(user.age)
+        assert 'email' not in data
+        assert 'years' not in UserSchema._declared_fields
+        assert 'years' not in UserSchema().dump(user).data
+
+    def test_fields_assigned_to_instance_declared_fields(self, user):
+        s = UserSchema()
+        s.declared_fields = {'username': fields.String(attribute='name')}
+        assert s.dump(user).data == {'username': user.name}
+
+    def test_dateformat_is_set_on_cached_fields(self, user):
+        class DateFormatSchema(Schema):
+            created = fields.DateTime()
+
+            class Meta:
+                dateformat = '%Y-%m'
+
+        DateFormatSchema()
+        data = DateFormatSchema().dump(user).data
+        assert data['created'] == user.created.strftime('%Y-%m')
+
+
 def test_dumps_returns_json(user):
     ser = UserSchema()
     serialized, errors = ser.dump(user)
@@ -100,6 +251,324 @@ def test_dumps_returns_bytestring(user):
     assert isinstance(result, binary_type)
 
 
+def test_nested_errors_are_the_same_for_dump_and_json_output():
+    from io import BytesIO
+    invalid_blog = Blog("Joe's blog", user=User('Joe', email='invalid'))
+    blogs = [Blog("Monty's blog", user=User('Monty')), invalid_blog]
+    schema = BlogSchema()
+    errors = schema.dump(invalid_blog).errors
+    assert 'email' in errors['user']
+    assert schema.dumps(invalid_blog).errors == errors
+    assert schema.dump_to(invalid_blog, BytesIO()).errors == errors
+    many_errors = BlogSchema(many=True).dump(blogs).errors
+    assert many_errors == {1: errors}
+    assert BlogSchema(many=True).dumps(blogs).errors == many_errors
+    chunks = list(schema.dumps_iter(blogs))
+    assert chunks[0][1] == many_errors
+
+
+class TestDumpsIter:
+
+    def make_users(self, count, consumed=None):
+        for idx in range(count):
+            if consumed is not None:
+                consumed.append(idx)
+            email = 'invalid' if idx % 3 == 1 else 'user{0}@example.com'.format(idx)
+            yield User('User{0}'.format(idx), email=email, age=idx)
+
+    def test_chunks_join_to_dumps_output(self):
+        users = list(self.make_users(7))
+        expected, _ = UserSchema(many=True).dumps(users)
+        chunks = list(UserSchema().dumps_iter(iter(users), batch_size=3))
+        assert len(chunks) == 4  # 3 batches and the closing bracket
+        assert all(isinstance(chunk, binary_type) for chunk, _ in chunks)
+        assert b''.join(chunk for chunk, _ in chunks) == expected
+
+    def test_objects_are_pulled_lazily(self):
+        consumed = []
+        chunks = UserSchema().dumps_iter(self.make_users(10, consumed), batch_size=4)
+        next(chunks)
+        assert consumed == [0, 1, 2, 3]
+
+    def test_errors_are_keyed_by_index_in_iterable(self):
+        chunks = UserSchema().dumps_iter(self.make_users(6), batch_size=4)
+        errors = [errors for _, errors in chunks]
+        assert sorted(errors[0]) == [1]
+        assert sorted(errors[1]) == [4]
+        assert 'email' in errors[1][4]
+        assert errors[2] == {}
+
+    def test_empty_iterable(self):
+        chunks = list(UserSchema().dumps_iter(iter([])))
+        assert chunks == [(b'[]', {})]
+        assert json.loads(chunks[0][0].decode('utf-8')) == []
+
+    def test_extra_and_separators(self):
+        schema = UserSchema(only=('name', ), extra={'kind': 'user'})
+        chunks = schema.dumps_iter(self.make_users(3), batch_size=2,
+                                   separators=(',', ':'))
+        result = b''.join(chunk for chunk, _ in chunks)
+        assert b', ' not in result
+        assert json.loads(result.decode('utf-8')) == [
+            {'name': 'User0', 'kind': 'user'},
+            {'name': 'User1', 'kind': 'user'},
+            {'name': 'User2', 'kind': 'user'},
+        ]
+
+    @pytest.mark.parametrize('kwargs', [
+        {'indent': 2},
+        {'indent': 0, 'sort_keys': True},
+        {'indent': 4, 'separators': (',', ': ')},
+    ])
+    def test_indented_chunks_join_to_dumps_output(self, kwargs):
+        users = list(self.make_users(5))
+        schema = UserSchema(only=('name', 'age'))
+        chunks = schema.dumps_iter(iter(users), batch_size=2, **kwargs)
+        expected = UserSchema(only=('name', 'age'), many=True).dumps(users, **kwargs).data
+        assert b''.join(chunk for chunk, _ in chunks) == expected
+
+    def test_fields_are_inferred_from_first_object(self):
+        chunks = UserMetaSchema(many=True).dumps_iter(self.make_users(3))
+        result = json.loads(b''.join(chunk for chunk, _ in chunks).decode('utf-8'))
+        assert [each['name'] for each in result] == ['User0', 'User1', 'User2']
+        assert [each['age'] for each in result] == [0, 1, 2]
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            next(UserSchema().dumps_iter([], batch_size=0))
+
+
+class TestDumpTo:
+
+    def test_dump_to_file(self, user):
+        from io import BytesIO
+        fp = BytesIO()
+        schema = UserSchema()
+        nbytes, errors = schema.dump_to(user, fp)
+        expected = schema.dumps(user).data
+        assert fp.getvalue() == expected
+        assert nbytes == len(expected)
+        assert errors == {}
+
+    def test_dump_to_bytearray_many(self):
+        users = [User('Mick', email='mick@stones.com'), User('Keith', email='invalid'),
+                 User('Charlie', email='charlie@stones.com')]
+        schema = UserSchema(many=True, only=('name', 'email'))
+        buf = bytearray(b'prefix:')
+        nbytes, errors = schema.dump_to(users, buf, batch_size=2)
+        expected = schema.dumps(users).data
+        assert bytes(buf) == b'prefix:' + expected
+        assert nbytes == len(expected)
+        assert list(errors) == [1]
+
+    def test_dump_to_memoryview(self, user):
+        schema = UserSchema(only=('name', ))
+        buf = bytearray(64)
+        nbytes, _ = schema.dump_to(user, memoryview(buf))
+        assert bytes(buf[:nbytes]) == schema.dumps(user).data
+
+    def test_dump_to_memoryview_too_small(self, user):
+        with pytest.raises(ValueError):
+            UserSchema(only=('name', )).dump_to(user, memoryview(bytearray(4)))
+
+    @pytest.mark.parametrize('kwargs', [
+        {},
+        {'indent': 2},
+        {'separators': (',', ':')},
+        {'indent': 2, 'sort_keys': True},
+    ])
+    def test_dump_to_writes_single_object_in_pieces(self, kwargs):
+        class TagsSchema(Schema):
+            name = fields.String()
+            tags = fields.List(fields.String)
+            count = fields.Integer()
+            nested = fields.Raw()
+
+        obj = {'name': u'caf\xe9', 'tags': ['tag{0}'.format(idx) for idx in range(20000)],
+               'count': 3, 'nested': {'a': [1, 2]}}
+        writes = []
+        buf = bytearray()
+
+        class Writer(object):
+            def write(self, data):
+                writes.append(len(data))
+                buf.extend(data)
+        schema = TagsSchema()
+        nbytes, errors = schema.dump_to(obj, Writer(), batch_size=1, **kwargs)
+        expected = schema.dumps(obj, **kwargs).data
+        assert bytes(buf) == expected
+        assert nbytes == len(expected)
+        if kwargs.get('sort_keys'):
+            # Keys sorted by the JSON module are encoded as a whole
+            assert writes == [len(expected)]
+        else:
+            assert len(writes) == 5
+
+
+class TestDumpColumns:
+
+    def make_users(self):
+        return [User('Mick', email='mick@stones.com', age=70),
+                User('Keith', email='invalid', age=71),
+                User('Charlie', email='charlie@stones.com', age=None)]
+
+    def test_columns_match_rows(self):
+        users = self.make_users()
+        schema = UserSchema(many=True)
+        rows, row_errors = schema.dump(users)
+        columns, errors = schema.dump_columns(iter(users))
+        assert list(columns) == list(rows[0])
+        for key, column in columns.items():
+            assert column == [row[key] for row in rows]
+        assert errors == row_errors
+        assert 'email' in errors[1]
+
+    def test_arrays(self):
+        from array import array
+        schema = UserSchema(only=('name', 'age', 'finger_count', 'balance'))
+        columns, errors = schema.dump_columns(self.make_users(), arrays=True)
+        assert isinstance(columns['age'], array)
+        assert list(columns['age']) == [70.0, 71.0, 0.0]
+        assert isinstance(columns['finger_count'], array)
+        assert list(columns['finger_count']) == [10, 10, 10]
+        # Not numeric, or formatted as strings
+        assert columns['name'] == ['Mick', 'Keith', 'Charlie']
+        assert columns['balance'] == ['100.00'] * 3
+
+    def test_arrays_fall_back_to_lists(self):
+        class IntSchema(Schema):
+            count = fields.Integer()
+        objs = [{'count': 1}, {'count': 'not a number'}, {'count': 2 ** 80}]
+        columns, errors = IntSchema().dump_columns(objs, arrays=True)
+        assert columns['count'] == [1, None, 2 ** 80]
+        assert list(errors) == [1]
+
+    def test_extra(self):
+        schema = UserSchema(only=('name', ), extra={'kind': 'user'})
+        columns = schema.dump_columns(self.make_users()).data
+        assert columns['kind'] == ['user'] * 3
+
+    def test_fields_are_inferred_from_first_object(self):
+        columns = UserMetaSchema().dump_columns(iter(self.make_users())).data
+        assert columns['name'] == ['Mick', 'Keith', 'Charlie']
+
+    def test_empty(self):
+        columns, errors = UserSchema(only=('name', 'age')).dump_columns([])
+        assert columns == {'name': [], 'age': []}
+        assert errors == {}
+
+    @pytest.mark.parametrize('numpy_available', [True, False])
+    def test_number_columns(self, monkeypatch, numpy_available):
+        if numpy_available:
+            pytest.importorskip('numpy')
+        monkeypatch.setattr(utils, 'numpy_available', numpy_available)
+
+        class NumberSchema(Schema):
+            count = fields.Integer()
+            ratio = fields.Float(as_string=True)
+            score = fields.Float(validate=lambda n: n >= 0)
+        objs = [{'count': 1, 'ratio': 0.5, 'score': 2},
+                {'count': None, 'ratio': 1, 'score': -1},
+                {'count': 'x', 'ratio': 2 ** 60, 'score': 0.5}]
+        schema = NumberSchema(many=True)
+        rows, row_errors = schema.dump(objs)
+        columns, errors = schema.dump_columns(objs)
+        for key, column in columns.items():
+            assert column == [row[key] for row in rows]
+        assert errors == row_errors
+        assert sorted(errors) == [1, 2]
+
+
+class TestDumpCsv:
+
+    def make_fp(self):
+        from io import BytesIO, StringIO
+        return BytesIO() if PY2 else StringIO(newline='')
+
+    def read_rows(self, fp):
+        import csv
+        fp.seek(0)
+        rows = list(csv.reader(fp))
+        if PY2:
+            rows = [[cell.decode('utf-8') for cell in row] for row in rows]
+        return rows
+
+    def test_dump_csv(self):
+        users = [User(u'Mick ☃', email='mick@stones.com', age=0.1),
+                 User('Keith', email='invalid', age=71)]
+        schema = UserSchema(only=('name', 'email', 'age', 'registered', 'hair_colors',
+                                  'homepage'))
+        fp = self.make_fp()
+        nrows, errors = schema.dump_csv(iter(users), fp)
+        assert nrows == 2
+        assert list(errors) == [1]
+        assert 'email' in errors[1]
+        assert self.read_rows(fp) == [
+            list(schema.fields),
+            [u'Mick ☃', u'mick@stones.com', u'0.1', u'True',
+             u'["black", "brown", "blond", "redhead"]', u''],
+            [u'Keith', u'', u'71.0', u'True',
+             u'["black", "brown", "blond", "redhead"]', u''],
+        ]
+
+    def test_prefix_and_extra(self):
+        schema = UserSchema(only=('name', ), prefix='user_', extra={'kind': 'user'})
+        fp = self.make_fp()
+        schema.dump_csv([User('Mick')], fp)
+        assert self.read_rows(fp) == [[u'user_name', u'kind'], [u'Mick', u'user']]
+
+    def test_empty(self):
+        fp = self.make_fp()
+        assert UserSchema(only=('name', 'age')).dump_csv([], fp) == (0, {})
+        assert self.read_rows(fp) == [[u'name', u'age']]
+
+    def test_error_handler_is_called_once(self):
+        class HandledSchema(UserSchema):
+            pass
+
+        calls = []
+
+        @HandledSchema.error_handler
+        def handle_errors(schema, errors, obj):
+            calls.append(errors)
+            raise ValueError('Invalid users')
+
+        users = [User('Mick', email='invalid'), User('Keith'),
+                 User('Charlie', email='invalid')]
+        fp = self.make_fp()
+        with pytest.raises(ValueError):
+            HandledSchema(only=('name', 'email')).dump_csv(users, fp)
+        assert len(calls) == 1
+        assert list(sorted(calls[0])) == [0, 2]
+        # Every row was written before the handler was called
+        assert [row[0] for row in self.read_rows(fp)[1:]] == [u'Mick', u'Keith', u'Charlie']
+
+    def test_errors_are_keyed_across_batches(self):
+        users = [User('Mick', email='invalid' if idx % 2 else None) for idx in range(5)]
+        fp = self.make_fp()
+        nrows, errors = UserSchema(only=('name', 'email')).dump_csv(users, fp, batch_size=2)
+        assert nrows == 5
+        assert sorted(errors) == [1, 3]
+        assert len(self.read_rows(fp)) == 6
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            UserSchema().dump_csv([], self.make_fp(), batch_size=0)
+
+    def test_fields_are_inferred_from_first_object(self):
+        fp = self.make_fp()
+        UserMetaSchema(many=True).dump_csv([User('Mick'), User('Keith')], fp)
+        rows = self.read_rows(fp)
+        assert rows[0][:2] == [u'name', u'age']
+        assert [row[0] for row in rows[1:]] == [u'Mick', u'Keith']
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 5), reason='Tested in test_aio.py')
+def test_dump_async_requires_python_35(user):
+    with pytest.raises(RuntimeError):
+        UserSchema().dump_async(user)
+
+
 def test_naive_datetime_field(user, serialized_user):
     expected = utils.isoformat(user.created)
     assert serialized_user.data['created'] == expected
@@ -783,6 +1252,35 @@ class TestNestedSchema:
         serialized = BlogSchema().dump(self.blog)[0]
         assert serialized['categories'] == ["humor", "violence"]
 
+    @pytest.mark.parametrize('numpy_available', [True, False])
+    @pytest.mark.parametrize(('field', 'value'), [
+        (fields.List(fields.Float), [1, 2.5, True]),
+        (fields.List(fields.Float(as_string=True)), (1, 2.5)),
+        (fields.List(fields.Integer), [1, 2 ** 70]),
+        (fields.List(fields.Integer(as_string=True)), [1, '2']),
+        (fields.List(fields.Float(validate=lambda n: n > 0)), [1, 2]),
+        (fields.List(fields.Fixed(decimals=2)), [1, 2.5]),
+    ])
+    def test_list_of_numbers(self, monkeypatch, numpy_available, field, value):
+        if numpy_available:
+            pytest.importorskip('numpy')
+        expected = [field.container.serialize(idx, value) for idx in range(len(value))]
+        monkeypatch.setattr(utils, 'numpy_available', numpy_available)
+        result = field.serialize('numbers', {'numbers': value})
+        assert result == expected
+        assert [type(each) for each in result] == [type(each) for each in expected]
+
+    def test_list_of_numbers_from_array(self):
+        numpy = pytest.importorskip('numpy')
+        field = fields.List(fields.Float)
+        assert field.serialize('numbers', {'numbers': numpy.arange(3)}) == [0.0, 1.0, 2.0]
+
+    def test_list_field_wraps_single_item(self):
+        field = fields.List(fields.String)
+        assert field.serialize('tags', {'tags': 'humor'}) == ['humor']
+        field = fields.List(fields.Nested(UserSchema, only=('name', )))
+        assert field.serialize('users', {'users': self.user}) == [{'name': 'Monty'}]
+
     def test_nested_errors(self):
         invalid_user = User("Monty", email="foo")
         blog = Blog("Monty's blog", user=invalid_user)
@@ -793,6 +1291,24 @@ class TestNestedSchema:
         # No problems with collaborators
         assert "collaborators" not in errors
 
+    def test_nested_errors_many(self):
+        blogs = [Blog("Monty's blog", user=self.user),
+                 Blog("Joe's blog", user=User("Joe", email="foo")),
+                 Blog("Mick's blog", user=User("Mick", email="bar"))]
+        data, errors = BlogSchema(many=True).dump(blogs)
+        assert sorted(errors) == [1, 2]
+        assert list(errors[1]) == ['user']
+        assert 'email' in errors[1]['user']
+        assert 'bar' in errors[2]['user']['email']
+        assert data[1]['user']['name'] == 'Joe'
+
+    def test_nested_errors_dump_columns(self):
+        blogs = [Blog("Monty's blog", user=self.user),
+                 Blog("Joe's blog", user=User("Joe", email="foo"))]
+        columns, errors = BlogSchema().dump_columns(blogs)
+        assert list(errors) == [1]
+        assert 'email' in errors[1]['user']
+
     def test_nested_method_field(self):
         data = BlogSchema().dump(self.blog)[0]
         assert data['user']['is_old']
@@ -1072,3 +1588,168 @@ def test_serializer_can_specify_nested_object_as_attribute(blog):
     ser = BlogUsernameSchema()
     result = ser.dump(blog)
     assert result.data['author_name'] == blog.user.name
+
+
+class TestBatch:
+
+    def setup_method(self, method):
+        self.users = dict((idx, User(name='User {0}'.format(idx), age=idx * 10))
+                          for idx in range(3))
+        self.posts = [{'title': 'Post {0}'.format(idx), 'author_id': idx % 3,
+                       'id': idx} for idx in range(6)]
+        self.calls = []
+
+    def get_users(self, ids):
+        self.calls.append(ids)
+        return dict((idx, self.users[idx]) for idx in ids if idx in self.users)
+
+    def make_schema(self, **kwargs):
+        get_users = self.get_users
+
+        class PostSchema(Schema):
+            title = fields.String()
+            author = fields.Nested(UserSchema, only=('name', 'age'),
+                                   attribute='author_id', batch=get_users, **kwargs)
+        return PostSchema
+
+    def test_nested_batch_is_called_once(self):
+        data, errors = self.make_schema()(many=True).dump(self.posts)
+        assert not errors
+        assert self.calls == [[0, 1, 2]]
+        for post, result in zip(self.posts, data):
+            assert result['author']['name'] == self.users[post['author_id']].name
+
+    def test_nested_batch_single_object(self):
+        data, errors = self.make_schema()().dump(self.posts[4])
+        assert self.calls == [[1]]
+        assert data['author']['name'] == 'User 1'
+
+    def test_nested_batch_with_generator(self):
+        schema = self.make_schema()(many=True)
+        data, errors = schema.dump(post for post in self.posts)
+        assert len(data) == 6
+        assert len(self.calls) == 1
+
+    def test_nested_batch_skips_null_and_duplicate_keys(self):
+        self.posts[0]['author_id'] = None
+        self.posts[1]['author_id'] = 42
+        data, errors = self.make_schema(allow_null=True)(many=True).dump(self.posts)
+        assert self.calls == [[42, 2, 0, 1]]
+        assert data[0]['author'] is None
+        assert data[1]['author'] is None
+        assert data[2]['author']['name'] == 'User 2'
+
+    def test_nested_batch_with_codegen(self):
+        PostSchema = self.make_schema()
+
+        class CodegenSchema(PostSchema):
+            class Meta:
+                codegen = True
+        data = CodegenSchema(many=True).dump(self.posts).data
+        assert self.calls == [[0, 1, 2]]
+        assert data == PostSchema(many=True).dump(self.posts).data
+
+    def test_function_batch(self):
+        class PostSchema(Schema):
+            title = fields.String()
+            by_object = fields.Function(lambda obj: 'unused', attribute='id',
+                                        batch=lambda ids: dict((i, i * 3) for i in ids))
+            comment_count = fields.Function(batch=lambda ids: dict((i, -i) for i in ids),
+                                            attribute='id')
+        data, errors = PostSchema(many=True).dump(self.posts)
+        assert not errors
+        assert [row['by_object'] for row in data] == [0, 3, 6, 9, 12, 15]
+        assert [row['comment_count'] for row in data] == [0, -1, -2, -3, -4, -5]
+
+    def test_function_batch_receives_objects(self):
+        class Post(object):
+            def __init__(self, idx):
+                self.id = idx
+
+        received = []
+
+        def get_values(posts):
+            received.extend(posts)
+            return dict((post, post.id + 1) for post in posts)
+
+        class PostSchema(Schema):
+            value = fields.Function(batch=get_values)
+        posts = [Post(idx) for idx in range(3)]
+        data = PostSchema(many=True).dump(posts).data
+        assert received == posts
+        assert [row['value'] for row in data] == [1, 2, 3]
+
+    def test_function_batch_on_dicts(self):
+        received = []
+
+        def get_values(posts):
+            received.extend(posts)
+            return [post['title'].upper() for post in posts]
+
+        class PostSchema(Schema):
+            shout = fields.Function(batch=get_values)
+        posts = self.posts[:3] + [self.posts[0]]
+        data, errors = PostSchema(many=True).dump(posts)
+        assert not errors
+        assert received == self.posts[:3]
+        assert [row['shout'] for row in data] == ['POST 0', 'POST 1', 'POST 2', 'POST 0']
+
+    def test_nested_batch_returning_list(self):
+        def get_users(ids):
+            return [self.users[idx] for idx in ids]
+
+        class PostSchema(Schema):
+            author = fields.Nested(UserSchema, only=('name', ),
+                                   attribute='author_id', batch=get_users)
+        data = PostSchema(many=True).dump(self.posts).data
+        assert [row['author']['name'] for row in data] == [
+            'User 0', 'User 1', 'User 2', 'User 0', 'User 1', 'User 2']
+
+    def test_batch_unexpected_error_propagates(self):
+        def fail(keys):
+            raise KeyError('bug')
+
+        class PostSchema(Schema):
+            author = fields.Function(batch=fail, attribute='author_id')
+        with pytest.raises(KeyError):
+            PostSchema(many=True).dump(self.posts)
+
+    def test_batch_error_is_stored_for_each_object(self):
+        def fail(keys):
+            raise ValueError('database is down')
+
+        class PostSchema(Schema):
+            title = fields.String()
+            author = fields.Function(batch=fail, attribute='author_id')
+        data, errors = PostSchema(many=True).dump(self.posts[:2])
+        assert data[0]['title'] == 'Post 0'
+        assert errors == {0: {'author': 'database is down'},
+                          1: {'author': 'database is down'}}
+        with pytest.raises(MarshallingError):
+            PostSchema(many=True, strict=True).dump(self.posts)
+
+    def test_batch_values_are_validated(self):
+        class PostSchema(Schema):
+            author = fields.Function(batch=lambda ids: dict((i, i) for i in ids),
+                                     attribute='author_id', validate=lambda v: v > 0)
+        data, errors = PostSchema(many=True).dump(self.posts[:3])
+        assert list(errors) == [0]
+        assert data[1]['author'] == 1
+
+    def test_dump_columns_with_batch(self):
+        columns = self.make_schema()(many=True).dump_columns(self.posts).data
+        assert self.calls == [[0, 1, 2]]
+        assert [author['name'] for author in columns['author']] == [
+            'User 0', 'User 1', 'User 2', 'User 0', 'User 1', 'User 2']
+
+    def test_dump_csv_with_batch(self):
+        from io import BytesIO, StringIO
+        fp = BytesIO() if PY2 else StringIO(newline='')
+        posts = self.posts + self.posts[:4]
+        nrows, errors = self.make_schema()().dump_csv(posts, fp, batch_size=5)
+        assert nrows == 10
+        assert self.calls == [[0, 1, 2], [2, 0, 1]]
+
+    def test_function_requires_func_or_batch(self):
+        with pytest.raises(ValueError):
+            fields.Function()
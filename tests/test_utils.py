@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 import datetime as dt
+import json
 from collections import namedtuple
 
 import pytest
 
 from marshmallow import utils
+from marshmallow.compat import PY2, text_type
 from tests.base import (
     assert_datetime_equal,
     central,
@@ -77,6 +79,59 @@ def test_get_value_for_nested_object():
     assert utils.get_value('p2.x', tri) == 3
     assert utils.get_value('p3.x', tri) == 5
 
+class IndexablePoint(object):
+    def __init__(self, x, y):
+        self.x = x
+        self._data = {'y': y}
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+@pytest.mark.parametrize('obj', [
+    PointNT(24, 42),
+    PointClass(24, 42),
+    {'x': 24, 'y': 42},
+    IndexablePoint(24, 42),
+    'notapoint',
+    None,
+])
+@pytest.mark.parametrize('key', ['x', 'y', 'z', 'items', 'strip'])
+def test_get_accessor_matches_get_value(obj, key):
+    def outcome(func, *args):
+        try:
+            return func(*args)
+        except Exception as error:
+            return type(error)
+    accessor = utils.get_accessor(key)
+    assert outcome(accessor, obj) == outcome(utils.get_value, key, obj)
+    assert outcome(accessor, obj, 123) == outcome(utils.get_value, key, obj, 123)
+
+def test_get_accessor_for_nested_object():
+    tri = Triangle(p1=PointClass(1, 2), p2=PointNT(3, 4), p3={'x': 5, 'y': 6})
+    assert utils.get_accessor('p1.x')(tri) == 1
+    assert utils.get_accessor('p2.x')(tri) == 3
+    assert utils.get_accessor('p3.x')(tri) == 5
+    assert utils.get_accessor('p4.x')(tri, 123) == 123
+
+def test_get_accessor_is_cached():
+    assert utils.get_accessor('p1.x') is utils.get_accessor('p1.x')
+
+def test_get_accessor_does_not_keep_classes_alive():
+    import gc
+    import weakref
+    accessor = utils.get_accessor('runtime_key')
+    cls = type('RuntimeClass', (object, ), {'runtime_key': 42})
+    assert accessor(cls()) == 42
+    ref = weakref.ref(cls)
+    del cls
+    gc.collect()
+    assert ref() is None
+    assert accessor._getters == {}
+    assert accessor({'runtime_key': 1}) == 1
+
+def test_get_accessor_with_int_key():
+    assert utils.get_accessor(1)(['a', 'b']) == 'b'
+
 def test_is_keyed_tuple():
     Point = namedtuple('Point', ['x', 'y'])
     p = Point(24, 42)
@@ -183,3 +238,129 @@ def test_from_iso_date(use_dateutil):
     result = utils.from_iso_date(iso_date, use_dateutil=use_dateutil)
     assert isinstance(result, dt.date)
     assert_date_equal(result, d)
+
+ARRAY_ITEMS = [
+    {'name': u'Mick', 'tags': ['a', ']', ','], 'nested': {'x': [1, 2.5]}},
+    1234567890,
+    -0.125,
+    u'café ☃ [not, an, array]',
+    True,
+    None,
+    [],
+    {},
+]
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 65536])
+@pytest.mark.parametrize('binary', [True, False])
+def test_iter_json_array(chunk_size, binary):
+    from io import BytesIO, StringIO
+    content = u' \n[ ' + u' ,\n'.join(
+        json.dumps(item, ensure_ascii=False) for item in ARRAY_ITEMS) + u' ]\n'
+    fp = BytesIO(content.encode('utf-8')) if binary else StringIO(content)
+    assert list(utils.iter_json_array(fp, chunk_size=chunk_size)) == ARRAY_ITEMS
+
+def test_iter_json_array_is_lazy():
+    from io import StringIO
+    fp = StringIO(u'[1, 2, {"a": 3}, ' + u'4, ' * 10000 + u'5]')
+    items = utils.iter_json_array(fp, chunk_size=16)
+    assert [next(items), next(items), next(items)] == [1, 2, {'a': 3}]
+    assert fp.tell() < 64
+
+@pytest.mark.parametrize('content', [u'', u'[]', u'  [ ]  '])
+def test_iter_json_array_empty(content):
+    from io import StringIO
+    if content:
+        assert list(utils.iter_json_array(StringIO(content))) == []
+    else:
+        with pytest.raises(ValueError):
+            list(utils.iter_json_array(StringIO(content)))
+
+@pytest.mark.parametrize('content', [u'{"a": 1}', u'[1, 2', u'[1 2]', u'[1, {"a": ]'])
+def test_iter_json_array_invalid(content):
+    from io import StringIO
+    with pytest.raises(ValueError):
+        list(utils.iter_json_array(StringIO(content), chunk_size=2))
+
+@pytest.mark.skipif(PY2, reason='json on Python 2 does not give the position of errors')
+def test_iter_json_array_raises_on_invalid_item_early():
+    from io import StringIO
+    fp = StringIO(u'[1, tru, ' + u'2, ' * 10000 + u'3]')
+    items = utils.iter_json_array(fp, chunk_size=16)
+    assert next(items) == 1
+    with pytest.raises(ValueError):
+        next(items)
+    assert fp.tell() < 64
+
+def test_iter_json_array_decodes_large_items_a_few_times():
+    from io import StringIO
+    calls = []
+
+    class CountingDecoder(json.JSONDecoder):
+        def raw_decode(self, s, idx=0):
+            calls.append(idx)
+            return super(CountingDecoder, self).raw_decode(s, idx)
+
+    big = u'x' * 100000
+    fp = StringIO(text_type(json.dumps([big, [1] * 10000, 2])))
+    items = list(utils.iter_json_array(fp, chunk_size=16, decoder=CountingDecoder()))
+    assert items == [big, [1] * 10000, 2]
+    assert len(calls) < 40
+
+def test_iter_json_lines():
+    from io import BytesIO
+    fp = BytesIO(u'{"a": 1}\n\n{"b": "☃"}\n'.encode('utf-8'))
+    assert list(utils.iter_json_lines(fp)) == [{'a': 1}, {'b': u'☃'}]
+
+@pytest.mark.parametrize(('values', 'num_type', 'as_string'), [
+    ([1, 2.5, -3, True, 2 ** 60], float, False),
+    ([1, 2.5, float('inf')], float, True),
+    ([1, -2, True, 2 ** 62], int, False),
+    ([1, -2], int, True),
+    ([], float, False),
+])
+def test_format_numbers(values, num_type, as_string):
+    pytest.importorskip('numpy')
+    expected = [repr(num_type(value)) if as_string else num_type(value) for value in values]
+    result = utils.format_numbers(values, num_type, as_string=as_string)
+    assert result == expected
+    assert [type(each) for each in result] == [type(each) for each in expected]
+
+def test_format_numbers_arrays():
+    numpy = pytest.importorskip('numpy')
+    for dtype in ('int8', 'int64', 'uint32', 'float32', 'float64', 'bool'):
+        values = numpy.array([0, 1, 2], dtype=dtype)
+        assert utils.format_numbers(values, float) == [float(v) for v in values]
+    values = numpy.array([-1, 2 ** 40], dtype='int64')
+    assert utils.format_numbers(values, int, as_string=True) == ['-1', repr(2 ** 40)]
+
+@pytest.mark.parametrize(('values', 'num_type'), [
+    ([1, None], float),
+    (['1.5'], float),
+    ([1.5], int),
+    ([2 ** 64], int),
+    ([1], complex),
+])
+def test_format_numbers_falls_back(values, num_type):
+    pytest.importorskip('numpy')
+    assert utils.format_numbers(values, num_type) is None
+
+def test_format_numbers_falls_back_on_arrays():
+    numpy = pytest.importorskip('numpy')
+    assert utils.format_numbers(numpy.array([1.5]), int) is None
+    assert utils.format_numbers(numpy.array([2 ** 63], dtype='uint64'), int) is None
+    assert utils.format_numbers(numpy.zeros((2, 2)), float) is None
+    assert utils.format_numbers(numpy.array(['1']), float) is None
+
+def test_format_numbers_without_numpy(monkeypatch):
+    monkeypatch.setattr(utils, 'numpy_available', False)
+    assert utils.format_numbers([1.5], float) is None
+
+def test_numpy_is_imported_on_first_use():
+    import subprocess
+    import sys
+    code = ('import sys, marshmallow; '
+            'assert "numpy" not in sys.modules; '
+            'from marshmallow import utils; '
+            'utils.format_numbers([1], int); '
+            'assert utils.numpy_available is ("numpy" in sys.modules)')
+    subprocess.check_call([sys.executable, '-c', code])